@@ -0,0 +1,6 @@
+from .session_entry import SessionEntry as SessionEntry
+from .protocol_session_backend import ProtocolSessionBackend as ProtocolSessionBackend
+from .memory_session_backend import MemorySessionBackend as MemorySessionBackend
+from .sqlite_session_backend import SqliteSessionBackend as SqliteSessionBackend
+from .lru_session_backend import LruSessionBackend as LruSessionBackend
+from .session_backend_factory import create_session_backend as create_session_backend
@@ -0,0 +1,98 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+from .protocol_session_backend import ProtocolSessionBackend
+from .session_entry import SessionEntry
+
+
+class LruSessionBackend:
+    """
+    In-process read-through LRU placed in front of a shared session backend.
+
+    Reads are served from memory while the cached entry is younger than ``ttl_seconds``.
+    After that the entry is re-read from the wrapped backend. A change made by another
+    worker becomes visible here after at most ``ttl_seconds``.
+    Writes go through to the wrapped backend and update the cached entry. ``set_data``
+    changes one key in the wrapped backend and drops the cached entry, since the rest of
+    the cached data may be older than the stored data.
+    """
+
+    def __init__(
+        self,
+        backend: ProtocolSessionBackend,
+        max_size: int = 1024,
+        ttl_seconds: float = 2.0,
+    ):
+        self._backend = backend
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        self._lock = threading.Lock()
+        self._cache: OrderedDict[str, tuple[SessionEntry, float]] = OrderedDict()
+
+    def _cache_set(self, entry: SessionEntry) -> None:
+        if self._max_size <= 0:
+            return
+        sid = entry.session.session_id
+        self._cache[sid] = (entry, time.monotonic())
+        self._cache.move_to_end(sid)
+        while len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
+
+    def get(self, session_id: str, now: float) -> SessionEntry | None:
+        with self._lock:
+            cached = self._cache.get(session_id)
+            if cached is not None:
+                entry, cached_at = cached
+                if time.monotonic() - cached_at <= self._ttl:
+                    if entry.is_expired(now):
+                        del self._cache[session_id]
+                        return None
+                    self._cache.move_to_end(session_id)
+                    return entry
+                del self._cache[session_id]
+
+        entry = self._backend.get(session_id, now)
+        if entry is not None:
+            with self._lock:
+                self._cache_set(entry)
+        return entry
+
+    def put(self, entry: SessionEntry) -> None:
+        self._backend.put(entry)
+        with self._lock:
+            self._cache_set(entry)
+
+    def set_data(self, session_id: str, key: str, value: Any, now: float) -> bool:
+        with self._lock:
+            self._cache.pop(session_id, None)
+        return self._backend.set_data(session_id, key, value, now)
+
+    def touch(self, session_id: str, last_accessed: str, expires_at: float) -> None:
+        with self._lock:
+            cached = self._cache.get(session_id)
+            if cached is not None:
+                entry = cached[0]
+                entry.session.last_accessed = last_accessed
+                entry.expires_at = expires_at
+        self._backend.touch(session_id, last_accessed, expires_at)
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            self._cache.pop(session_id, None)
+        self._backend.delete(session_id)
+
+    def cleanup_expired(self, now: float) -> int:
+        with self._lock:
+            expired = [sid for sid, (e, _) in self._cache.items() if e.is_expired(now)]
+            for sid in expired:
+                del self._cache[sid]
+        return self._backend.cleanup_expired(now)
+
+    def flush(self) -> None:
+        self._backend.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._cache.clear()
+        self._backend.close()
@@ -0,0 +1,51 @@
+from typing import Any
+from .session_entry import SessionEntry
+
+
+class MemorySessionBackend:
+    """
+    Per-process dictionary session backend.
+
+    This is the default backend. Sessions are not shared between worker processes.
+    """
+
+    def __init__(self):
+        self._entries: dict[str, SessionEntry] = {}
+
+    def get(self, session_id: str, now: float) -> SessionEntry | None:
+        entry = self._entries.get(session_id)
+        if entry is None or entry.is_expired(now):
+            return None
+        return entry
+
+    def put(self, entry: SessionEntry) -> None:
+        self._entries[entry.session.session_id] = entry
+
+    def set_data(self, session_id: str, key: str, value: Any, now: float) -> bool:
+        entry = self.get(session_id, now)
+        if entry is None:
+            return False
+        entry.session.data[key] = value
+        return True
+
+    def touch(self, session_id: str, last_accessed: str, expires_at: float) -> None:
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return
+        entry.session.last_accessed = last_accessed
+        entry.expires_at = expires_at
+
+    def delete(self, session_id: str) -> None:
+        self._entries.pop(session_id, None)
+
+    def cleanup_expired(self, now: float) -> int:
+        expired = [sid for sid, e in self._entries.items() if e.is_expired(now)]
+        for sid in expired:
+            self._entries.pop(sid, None)
+        return len(expired)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
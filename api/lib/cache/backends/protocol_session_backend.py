@@ -0,0 +1,86 @@
+from typing import Any, Protocol
+from .session_entry import SessionEntry
+
+
+class ProtocolSessionBackend(Protocol):
+    def get(self, session_id: str, now: float) -> SessionEntry | None:
+        """
+        Gets a session entry.
+
+        Args:
+            session_id (str): Session ID.
+            now (float): Current time as a POSIX timestamp. Expired entries are not returned.
+
+        Returns:
+            SessionEntry | None: The entry if it exists and is not expired; Otherwise, None.
+        """
+        ...
+
+    def put(self, entry: SessionEntry) -> None:
+        """
+        Inserts or replaces a session entry, including its data.
+
+        Args:
+            entry (SessionEntry): Entry to store.
+        """
+        ...
+
+    def set_data(self, session_id: str, key: str, value: Any, now: float) -> bool:
+        """
+        Sets one data value of a session, keeping the other values as stored.
+
+        The change is made in the store itself, so concurrent changes of other keys
+        by other workers are not lost.
+
+        Args:
+            session_id (str): Session ID.
+            key (str): Data key.
+            value (Any): JSON serializable value.
+            now (float): Current time as a POSIX timestamp. Expired entries are not changed.
+
+        Returns:
+            bool: True if the session exists and is not expired; Otherwise, False.
+        """
+        ...
+
+    def touch(self, session_id: str, last_accessed: str, expires_at: float) -> None:
+        """
+        Records an access to a session, sliding its expiry.
+
+        Backends may defer touches and write them in batches.
+
+        Args:
+            session_id (str): Session ID.
+            last_accessed (str): ISO formatted access time.
+            expires_at (float): New expiry as a POSIX timestamp.
+        """
+        ...
+
+    def delete(self, session_id: str) -> None:
+        """
+        Removes a session entry if it exists.
+
+        Args:
+            session_id (str): Session ID.
+        """
+        ...
+
+    def cleanup_expired(self, now: float) -> int:
+        """
+        Removes all entries expired at the given time.
+
+        Args:
+            now (float): Current time as a POSIX timestamp.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        ...
+
+    def flush(self) -> None:
+        """Writes any deferred changes to the underlying store."""
+        ...
+
+    def close(self) -> None:
+        """Flushes deferred changes and releases resources."""
+        ...
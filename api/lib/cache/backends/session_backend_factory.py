@@ -0,0 +1,39 @@
+from pathlib import Path
+from src.config.api_session import ApiSession
+from src.config.pkg_config import PkgConfig
+from .protocol_session_backend import ProtocolSessionBackend
+from .memory_session_backend import MemorySessionBackend
+from .sqlite_session_backend import SqliteSessionBackend
+from .lru_session_backend import LruSessionBackend
+
+
+def create_session_backend(config: ApiSession | None = None) -> ProtocolSessionBackend:
+    """
+    Creates the session backend described by configuration.
+
+    Args:
+        config (ApiSession | None, optional): Session configuration. Defaults to ``PkgConfig().api_info.session``.
+
+    Returns:
+        ProtocolSessionBackend: ``MemorySessionBackend`` for ``memory``; Otherwise,
+            a ``SqliteSessionBackend`` behind a ``LruSessionBackend``.
+    """
+    pkg_config = PkgConfig()
+    if config is None:
+        config = pkg_config.api_info.session
+    if config.backend == "memory":
+        return MemorySessionBackend()
+
+    db_path = Path(config.sqlite_path)
+    if not db_path.is_absolute():
+        db_path = pkg_config.root_path / db_path
+    backend = SqliteSessionBackend(
+        db_path=db_path,
+        batch_size=config.batch_size,
+        batch_interval_seconds=config.batch_interval_seconds,
+    )
+    return LruSessionBackend(
+        backend=backend,
+        max_size=config.lru_size,
+        ttl_seconds=config.lru_ttl_seconds,
+    )
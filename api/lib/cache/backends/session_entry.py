@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from ....models.session.session import Session
+
+
+@dataclass
+class SessionEntry:
+    """
+    A stored session together with its expiry.
+
+    Attributes:
+        session (Session): The session model.
+        expires_at (float): Expiry as a POSIX timestamp.
+    """
+
+    session: Session
+    expires_at: float
+
+    def is_expired(self, now: float) -> bool:
+        """
+        Check if the entry is expired at the given time.
+
+        Args:
+            now (float): Current time as a POSIX timestamp.
+
+        Returns:
+            bool: True if the entry has expired; Otherwise, False.
+        """
+        return self.expires_at < now
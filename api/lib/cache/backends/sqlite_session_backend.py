@@ -0,0 +1,242 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+from loguru import logger
+from ....models.session.session import Session
+from .session_entry import SessionEntry
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    started_at TEXT NOT NULL,
+    last_accessed TEXT NOT NULL,
+    data TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_sessions_expires_at ON sessions (expires_at);
+"""
+
+
+class SqliteSessionBackend:
+    """
+    Session backend stored in a local SQLite database.
+
+    All worker processes on a node that point at the same file share sessions.
+    The database runs in WAL mode so readers never block the single writer.
+
+    Creating a session or changing its data is written immediately so other workers
+    can see it. ``set_data`` reads and changes the stored data in one write transaction,
+    so workers changing different keys of a session do not overwrite each other. Access updates (``touch``) happen on every read and are batched.
+    They are flushed when ``batch_size`` updates are pending or when
+    ``batch_interval_seconds`` have passed since the last flush, checked on every
+    operation and by a timer started with the first pending update, so a worker that
+    goes idle still writes them before other workers expire the sessions.
+
+    Connections are opened lazily per process. A backend created before a fork
+    is therefore safe to use in the forked workers.
+    """
+
+    def __init__(
+        self,
+        db_path: Path | str,
+        batch_size: int = 64,
+        batch_interval_seconds: float = 1.0,
+    ):
+        self._db_path = Path(db_path)
+        self._batch_size = batch_size
+        self._batch_interval = batch_interval_seconds
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._conn_pid = 0
+        self._pending: dict[str, tuple[str, float]] = {}
+        self._last_flush = time.monotonic()
+        self._timer: threading.Timer | None = None
+
+    # region Connection
+    def _get_conn(self) -> sqlite3.Connection:
+        pid = os.getpid()
+        if self._conn is None or self._conn_pid != pid:
+            # a connection inherited through fork must not be used in the child,
+            # and the flush timer thread of the parent does not exist in it
+            self._pending.clear()
+            self._timer = None
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self._db_path, timeout=5.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+            self._conn_pid = pid
+            logger.debug(
+                "SqliteSessionBackend opened {path} for pid {pid}",
+                path=self._db_path,
+                pid=pid,
+            )
+        return self._conn
+
+    # endregion Connection
+
+    # region Batching
+    def _flush_pending(self, conn: sqlite3.Connection) -> None:
+        if self._pending:
+            rows = [
+                (last_accessed, expires_at, sid)
+                for sid, (last_accessed, expires_at) in self._pending.items()
+            ]
+            with conn:
+                conn.executemany(
+                    "UPDATE sessions SET last_accessed = ?, expires_at = ? WHERE session_id = ?",
+                    rows,
+                )
+            self._pending.clear()
+        self._last_flush = time.monotonic()
+
+    def _maybe_flush(self, conn: sqlite3.Connection) -> None:
+        if (
+            len(self._pending) >= self._batch_size
+            or time.monotonic() - self._last_flush >= self._batch_interval
+        ):
+            self._flush_pending(conn)
+        elif self._pending and self._timer is None:
+            self._start_timer()
+
+    def _start_timer(self) -> None:
+        self._timer = threading.Timer(self._batch_interval, self._flush_on_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _flush_on_timer(self) -> None:
+        with self._lock:
+            self._timer = None
+            if self._conn is None or self._conn_pid != os.getpid():
+                return
+            try:
+                self._flush_pending(self._conn)
+            except sqlite3.Error as e:
+                logger.warning("SqliteSessionBackend flush failed: {error}", error=e)
+                self._start_timer()
+
+    # endregion Batching
+
+    def get(self, session_id: str, now: float) -> SessionEntry | None:
+        with self._lock:
+            conn = self._get_conn()
+            row = conn.execute(
+                "SELECT started_at, last_accessed, data, expires_at FROM sessions WHERE session_id = ?",
+                (session_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            started_at, last_accessed, data, expires_at = row
+            pending = self._pending.get(session_id)
+            if pending is not None:
+                last_accessed, expires_at = pending
+            self._maybe_flush(conn)
+            if expires_at < now:
+                return None
+            session = Session(
+                session_id=session_id,
+                started_at=started_at,
+                last_accessed=last_accessed,
+                data=json.loads(data),
+            )
+            return SessionEntry(session=session, expires_at=expires_at)
+
+    def put(self, entry: SessionEntry) -> None:
+        session = entry.session
+        data = json.dumps(session.data)
+        with self._lock:
+            conn = self._get_conn()
+            self._pending.pop(session.session_id, None)
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO sessions (session_id, started_at, last_accessed, data, expires_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (
+                        session.session_id,
+                        session.started_at,
+                        session.last_accessed,
+                        data,
+                        entry.expires_at,
+                    ),
+                )
+            self._maybe_flush(conn)
+
+    def set_data(self, session_id: str, key: str, value: Any, now: float) -> bool:
+        with self._lock:
+            conn = self._get_conn()
+            # the write lock is taken before reading, so other workers wait for this change
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT data, expires_at FROM sessions WHERE session_id = ?",
+                    (session_id,),
+                ).fetchone()
+                if row is None:
+                    conn.rollback()
+                    return False
+                data, expires_at = row
+                pending = self._pending.get(session_id)
+                if pending is not None:
+                    expires_at = pending[1]
+                if expires_at < now:
+                    conn.rollback()
+                    return False
+                session_data = json.loads(data)
+                session_data[key] = value
+                conn.execute(
+                    "UPDATE sessions SET data = ? WHERE session_id = ?",
+                    (json.dumps(session_data), session_id),
+                )
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+            self._maybe_flush(conn)
+            return True
+
+    def touch(self, session_id: str, last_accessed: str, expires_at: float) -> None:
+        with self._lock:
+            conn = self._get_conn()
+            self._pending[session_id] = (last_accessed, expires_at)
+            self._maybe_flush(conn)
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            conn = self._get_conn()
+            self._pending.pop(session_id, None)
+            with conn:
+                conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+
+    def cleanup_expired(self, now: float) -> int:
+        with self._lock:
+            conn = self._get_conn()
+            # pending touches may extend an expiry, write them first
+            self._flush_pending(conn)
+            with conn:
+                cursor = conn.execute(
+                    "DELETE FROM sessions WHERE expires_at < ?", (now,)
+                )
+            return cursor.rowcount
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._conn is not None and self._conn_pid == os.getpid():
+                self._flush_pending(self._conn)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._conn is None:
+                return
+            if self._conn_pid == os.getpid():
+                self._flush_pending(self._conn)
+                self._conn.close()
+            self._conn = None
+            self._conn_pid = 0
@@ -1,8 +1,14 @@
-from typing import Any, Dict
+import time
+from typing import Any
 from uuid import uuid4
-from datetime import datetime, timedelta
+from datetime import datetime
 from src.config.pkg_config import PkgConfig
 from ...models.session.session import Session
+from .backends import ProtocolSessionBackend, SessionEntry, create_session_backend
+
+# Minimum seconds between full purges of expired sessions.
+# Expiry is also checked per entry on every read.
+_CLEANUP_INTERVAL_SECONDS = 60.0
 
 
 class SessionHandler:
@@ -13,69 +19,98 @@ class SessionHandler:
             cls._instance = super(SessionHandler, cls).__new__(cls)
         return cls._instance
 
-    def __init__(self):
+    def __init__(self, backend: ProtocolSessionBackend | None = None):
         if hasattr(self, "_initialized") and self._initialized:
             return
         config = PkgConfig()
         self._ttl_seconds = config.api_info.ttl_session_cache_seconds
-        self.sessions: Dict[str, Session] = {}
-        self.expiry: Dict[str, datetime] = {}
-        self.ttl = timedelta(seconds=self._ttl_seconds)
+        self._backend = backend if backend is not None else create_session_backend()
+        self._last_cleanup = 0.0
         self._initialized = True
 
-    def _update_access(self, session_id: str):
-        if session_id in self.sessions:
-            now = datetime.now().astimezone()
-            self.sessions[session_id].last_accessed = now.isoformat()
-            self.expiry[session_id] = now + self.ttl
+    def _maybe_cleanup(self, now: float) -> None:
+        mono = time.monotonic()
+        if mono - self._last_cleanup < _CLEANUP_INTERVAL_SECONDS:
+            return
+        self._last_cleanup = mono
+        self._backend.cleanup_expired(now)
+
+    def _get_entry(self, session_id: str) -> SessionEntry | None:
+        now = datetime.now().astimezone()
+        timestamp = now.timestamp()
+        self._maybe_cleanup(timestamp)
+        entry = self._backend.get(session_id, timestamp)
+        if entry is not None:
+            last_accessed = now.isoformat()
+            expires_at = timestamp + self._ttl_seconds
+            self._backend.touch(session_id, last_accessed, expires_at)
+            entry.session.last_accessed = last_accessed
+            entry.expires_at = expires_at
+        return entry
 
     def create_session(self) -> str:
         session_id = str(uuid4())
         now = datetime.now().astimezone()
-        self.sessions[session_id] = Session(
+        session = Session(
             started_at=now.isoformat(),
             last_accessed=now.isoformat(),
             session_id=session_id,
             data={},
         )
-        self.expiry[session_id] = now + self.ttl
+        self._backend.put(
+            SessionEntry(
+                session=session, expires_at=now.timestamp() + self._ttl_seconds
+            )
+        )
         return session_id
 
     def has_session(self, session_id: str) -> bool:
-        self.cleanup_expired()
-        return session_id in self.sessions
+        timestamp = datetime.now().astimezone().timestamp()
+        self._maybe_cleanup(timestamp)
+        return self._backend.get(session_id, timestamp) is not None
 
     def get_session(self, session_id: str) -> Session | None:
-        self.cleanup_expired()
-        session = self.sessions.get(session_id)
-        if session:
-            self._update_access(session_id)
-        return session
+        entry = self._get_entry(session_id)
+        if entry is None:
+            return None
+        return entry.session
 
     def set_data(self, session_id: str, key: str, value: Any) -> bool:
-        self.cleanup_expired()
-        if session_id in self.sessions:
-            self.sessions[session_id].data[key] = value
-            self._update_access(session_id)
-            return True
-        return False
+        now = datetime.now().astimezone()
+        timestamp = now.timestamp()
+        self._maybe_cleanup(timestamp)
+        # changed in the backend rather than read and put back whole, so a change of
+        # another key made meanwhile by another worker is kept
+        if not self._backend.set_data(session_id, key, value, timestamp):
+            return False
+        self._backend.touch(session_id, now.isoformat(), timestamp + self._ttl_seconds)
+        return True
 
     def get_data(self, session_id: str, key: str) -> Any:
-        self.cleanup_expired()
-        session = self.sessions.get(session_id)
-        if session:
-            self._update_access(session_id)
-            return session.data.get(key)
-        return None
-
-    def cleanup_expired(self):
-        now = datetime.now().astimezone()
-        expired = [sid for sid, exp in self.expiry.items() if exp < now]
-        for sid in expired:
-            self.sessions.pop(sid, None)
-            self.expiry.pop(sid, None)
+        entry = self._get_entry(session_id)
+        if entry is None:
+            return None
+        return entry.session.data.get(key)
+
+    def cleanup_expired(self) -> int:
+        """
+        Removes all expired sessions from the backend.
+
+        Returns:
+            int: Number of sessions removed.
+        """
+        self._last_cleanup = time.monotonic()
+        return self._backend.cleanup_expired(datetime.now().astimezone().timestamp())
+
+    def close(self) -> None:
+        """Flushes pending session writes and releases backend resources."""
+        self._backend.close()
 
     # region Properties
+    @property
+    def backend(self) -> ProtocolSessionBackend:
+        return self._backend
+
     @property
     def ttl_seconds(self) -> int:
         return self._ttl_seconds
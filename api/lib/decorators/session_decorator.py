@@ -3,6 +3,7 @@ import inspect
 from fastapi import Request, HTTPException
 from typing import Callable, Optional, cast
 from ..cache.session_handler import SessionHandler
+from ..util.request_body import get_body_session_id, get_parsed_body
 
 
 def with_session(
@@ -26,16 +27,9 @@ def with_session(
             if not session_id:
                 session_id = request.query_params.get("session_id")
 
-            # 3. Body ONLY for non-GET
+            # 3. Body ONLY for non-GET, parsed once and shared with the route
             if not session_id and request.method not in {"GET", "HEAD"}:
-                try:
-                    body = await request.json()
-                    if isinstance(body, dict):
-                        session_id = body.get("session_id") or body.get(
-                            "submission", {}
-                        ).get("session_id")
-                except Exception:
-                    pass
+                session_id = get_body_session_id(await get_parsed_body(request))
 
             handler = SessionHandler()
 
@@ -1,3 +1,5 @@
+import time
+from collections import OrderedDict
 from typing import Any, Optional, List
 from loguru import logger
 import jwt
@@ -12,9 +14,20 @@ from api.models.descope.descope_session import DescopeSession
 class TokenVerifier:
     def __init__(self):
         self.config = get_settings()
-        headers = {"User-Agent": "Mozilla/5.0 (CodexTemplatesFastAPIApp)"}
-        self.jwks_client = PyJWKClient(uri=self.config.jwks_url, headers=headers)
+        self._jwks_client: PyJWKClient | None = None
         self.allowed_algorithms = ["RS256"]
+        # verified sessions keyed by raw token, kept until the token expires.
+        # The session carries its cached permission mask along with it.
+        self._session_cache: OrderedDict[str, DescopeSession] = OrderedDict()
+        self._session_cache_size = 1024
+
+    @property
+    def jwks_client(self) -> PyJWKClient:
+        """Gets the JWKS client, created on first use."""
+        if self._jwks_client is None:
+            headers = {"User-Agent": "Mozilla/5.0 (CodexTemplatesFastAPIApp)"}
+            self._jwks_client = PyJWKClient(uri=self.config.jwks_url, headers=headers)
+        return self._jwks_client
 
     async def __call__(
         self,
@@ -82,12 +95,36 @@ class TokenVerifier:
         Returns:
             DescopeSession: An object representing the validated session data.
         """
+        session = self._get_cached_session(token)
+        if session is not None:
+            return session
         try:
             key = self._get_signing_key(token)
             payload = self._decode_token(token, key)
-            return DescopeSession(session=payload)
+            session = DescopeSession(session=payload)
         except Exception as e:
             raise UnauthorizedException(f"Token verification failed: {str(e)}")
+        self._cache_session(token, session)
+        return session
+
+    def _get_cached_session(self, token: str) -> DescopeSession | None:
+        session = self._session_cache.get(token)
+        if session is None:
+            return None
+        if session.session.get("exp", 0) <= time.time():
+            self._session_cache.pop(token, None)
+            return None
+        self._session_cache.move_to_end(token)
+        return session
+
+    def _cache_session(self, token: str, session: DescopeSession) -> None:
+        if not session.session.get("exp"):
+            # tokens without an expiry are verified on every call
+            return
+        self._session_cache[token] = session
+        self._session_cache.move_to_end(token)
+        while len(self._session_cache) > self._session_cache_size:
+            self._session_cache.popitem(last=False)
 
 
 AUTH = TokenVerifier()
@@ -1,4 +1,22 @@
-from descope.descope_client import DescopeClient
-from ..env import env_info
+from functools import lru_cache
+from typing import TYPE_CHECKING
+from .auth_config import get_settings
 
-DESCOPE_CLIENT = DescopeClient(project_id=env_info.DESCOPE_PROJECT_ID)
+if TYPE_CHECKING:
+    from descope.descope_client import DescopeClient
+
+
+@lru_cache()
+def get_descope_client() -> "DescopeClient":
+    """
+    Gets the process-wide Descope client.
+
+    The client and the Descope SDK are only loaded on first use, so importing the
+    application does not pay for them.
+
+    Returns:
+        DescopeClient: Descope client for ``DESCOPE_PROJECT_ID``.
+    """
+    from descope.descope_client import DescopeClient
+
+    return DescopeClient(project_id=get_settings().DESCOPE_PROJECT_ID)
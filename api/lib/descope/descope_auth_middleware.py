@@ -1,16 +1,15 @@
-import json
 from fastapi import HTTPException, Request, status
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
-from descope.descope_client import DescopeClient
 from . import auth
+from ..security import permissions
+from ..util.request_body import get_parsed_body
 
 # from fastapi.security import HTTPBearer
 from .auth_config import get_settings
 
 
 _SETTINGS = get_settings()
-descope_client = DescopeClient(project_id=_SETTINGS.DESCOPE_PROJECT_ID)
 
 
 # 3. Define the Auth Middleware
@@ -28,28 +27,17 @@ class DescopeAuthMiddleware(BaseHTTPMiddleware):
 
             token = auth_header.split(" ")[1]
 
-            request_body = await request.body()
-
-            # Parse JSON from bytes
-            try:
-                request_data = json.loads(request_body.decode("utf-8"))
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                request_data = {}
-
-            is_tool_call = request_data.get("method") == "tools/call"
-
-            required_scopes = []
-            if is_tool_call:
-                required_scopes = [
-                    "mcp:template:read",
-                    "api:context:read",
-                ]  # get required scope for your tool
-                # validation_options.required_scopes = required_scopes
+            # parsed once per request; shared through request.state
+            request_data = await get_parsed_body(request)
+            is_tool_call = (
+                isinstance(request_data, dict)
+                and request_data.get("method") == "tools/call"
+            )
 
             try:
                 session = await auth.AUTH.verify_token(token)
-                if required_scopes:
-                    if not session.validate_scopes(required_scopes, match_any=True):
+                if is_tool_call:
+                    if not session.has_permission(permissions.MCP_TOOL_CALL):
                         raise HTTPException(
                             status_code=status.HTTP_403_FORBIDDEN,
                             detail="Insufficient scopes for the requested resource",
@@ -1,13 +1,9 @@
 from fastapi import HTTPException, Request, status
 from loguru import logger
 
-from descope.descope_client import DescopeClient
-from api.lib.descope.auth_config import get_settings
+from api.lib.descope.client import get_descope_client
 from api.models.descope.descope_session import DescopeSession
 
-auth_settings = get_settings()
-descope_client = DescopeClient(project_id=auth_settings.DESCOPE_PROJECT_ID)
-
 # def get_descope_session(
 #     request: Request, session_data: dict[str, Any] = Security(AUTH),
 # ) -> DescopeSession:
@@ -62,12 +58,12 @@ def get_user_session(request: Request) -> DescopeSession | None:
         if refresh_token:
             logger.debug("get_user_session() Validating session with refresh token")
             # Handles expired access tokens if refresh token is valid
-            data = descope_client.validate_and_refresh_session(
+            data = get_descope_client().validate_and_refresh_session(
                 session_token=token, refresh_token=refresh_token
             )
         else:
             logger.debug("get_user_session() Validating session without refresh token")
-            data = descope_client.validate_session(session_token=token)
+            data = get_descope_client().validate_session(session_token=token)
 
         return DescopeSession(
             session=data, access_token=token, refresh_token=refresh_token
@@ -92,18 +92,32 @@ _API_ENV_DATA = os.getenv("API_ENV_DATA")
 if not _API_ENV_DATA:
     raise ValueError("API environment data variable is not set")
 
-API_ENV_DB: dict[str, dict[str, Any]] = json.loads(
-    base64.b64decode(_API_ENV_DATA).decode("utf-8")
-)
-_API_ENV_DATA = None  # Clear sensitive data from memory
+_API_ENV_DB: dict[str, dict[str, Any]] | None = None
+
+
+def _get_env_db() -> dict[str, dict[str, Any]]:
+    # decoded on first use rather than at import
+    global _API_ENV_DB, _API_ENV_DATA
+    if _API_ENV_DB is None:
+        _API_ENV_DB = json.loads(
+            base64.b64decode(cast(str, _API_ENV_DATA)).decode("utf-8")
+        )
+        _API_ENV_DATA = None  # Clear sensitive data from memory
+    return _API_ENV_DB
+
+
+def __getattr__(name: str) -> Any:
+    if name == "API_ENV_DB":
+        return _get_env_db()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_data_value(key: str, default: T = None) -> T:
-    return API_ENV_DB.get("data", {}).get(key, default)
+    return _get_env_db().get("data", {}).get(key, default)
 
 
 def get_api_value(key: str, default: T = None) -> T:
-    data = API_ENV_DB.get("data", {})
+    data = _get_env_db().get("data", {})
     return data.get("api", {}).get(key, default)
 
 
@@ -119,21 +133,23 @@ def get_api_value(key: str, default: T = None) -> T:
 
 
 def get_user_info(user_id: str) -> User | None:
-    users = get_data_value("users", {})
-    if user_id not in users:
-        return None
+    """
+    Gets a user from the user directory.
+    See ``api.lib.user.user_directory.get_user_directory()``.
+    """
+    from ..user.user_directory import get_user_directory
 
-    user_data = users.get(user_id)
-    if not user_data:
-        return None
-    return User(monad_name=user_data.get("monad_name"))
+    return get_user_directory().get(user_id)
 
 
 def get_users() -> dict[str, User]:
-    users = {}
-    for user_id, user_data in API_ENV_DB.get("data", {}).get("users", {}).items():
-        users[user_id] = User(monad_name=user_data.get("monad_name"))
-    return users
+    """
+    Gets all users from the user directory.
+    See ``api.lib.user.user_directory.get_user_directory()``.
+    """
+    from ..user.user_directory import get_user_directory
+
+    return dict(get_user_directory().get_all())
 
 
 def get_api_servers() -> list[dict[str, str]]:
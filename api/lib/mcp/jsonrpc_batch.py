@@ -0,0 +1,144 @@
+import asyncio
+from typing import Any, Callable, Mapping
+from loguru import logger
+from .mcp_asgi_client import McpAsgiClient
+
+# JSON-RPC 2.0 error codes
+INVALID_REQUEST = -32600
+INTERNAL_ERROR = -32603
+# implementation defined server error
+RATE_LIMITED = -32000
+
+# request headers passed on to each message of a batch
+_FORWARD_HEADERS = (
+    "authorization",
+    "mcp-session-id",
+    "mcp-protocol-version",
+    "last-event-id",
+)
+
+
+def jsonrpc_error(msg_id: Any, code: int, message: str) -> dict[str, Any]:
+    """
+    Builds a JSON-RPC 2.0 error response.
+
+    Args:
+        msg_id (Any): ID of the request the error answers, None if unknown.
+        code (int): JSON-RPC error code.
+        message (str): Error message.
+
+    Returns:
+        dict[str, Any]: Error response.
+    """
+    return {"jsonrpc": "2.0", "id": msg_id, "error": {"code": code, "message": message}}
+
+
+class JsonRpcBatchExecutor:
+    """
+    Executes JSON-RPC 2.0 batch arrays against the streamable HTTP MCP app.
+
+    Each message of a batch is posted in process to the MCP app through
+    ``McpAsgiClient``, at most ``max_concurrency`` at a time. Responses are
+    returned in the order of the requests. Notifications, messages without an ``id``,
+    produce no response entry.
+
+    Authentication is done once for the whole batch by the caller. Rate limiting is
+    done per message: each message takes a token through the ``acquire`` callable of
+    ``execute()`` before it runs, and is answered with a ``RATE_LIMITED`` error when
+    its principal is over quota.
+    """
+
+    def __init__(
+        self,
+        client: McpAsgiClient,
+        max_size: int = 32,
+        max_concurrency: int = 8,
+    ):
+        self._client = client
+        self._max_size = max_size
+        self._max_concurrency = max_concurrency
+
+    async def _execute_one(
+        self,
+        message: Any,
+        base_url: str,
+        headers: dict[str, str],
+        semaphore: asyncio.Semaphore,
+        acquire: Callable[[], float] | None,
+    ) -> dict[str, Any] | None:
+        if not isinstance(message, dict) or message.get("jsonrpc") != "2.0":
+            return jsonrpc_error(None, INVALID_REQUEST, "Invalid Request")
+        msg_id = message.get("id")
+        # charged before waiting for a slot, so tokens are taken in message order
+        if acquire is not None and acquire() > 0:
+            return (
+                None
+                if msg_id is None
+                else jsonrpc_error(msg_id, RATE_LIMITED, "Too many requests")
+            )
+        async with semaphore:
+            try:
+                status_code, result = await self._client.post_jsonrpc(
+                    message, headers=headers, base_url=base_url
+                )
+            except Exception as e:
+                logger.error(
+                    "JsonRpcBatchExecutor() message {id} failed: {error}",
+                    id=msg_id,
+                    error=e,
+                )
+                return (
+                    None
+                    if msg_id is None
+                    else jsonrpc_error(msg_id, INTERNAL_ERROR, "Internal error")
+                )
+        if msg_id is None:
+            return None
+        if isinstance(result, dict) and ("result" in result or "error" in result):
+            result["id"] = msg_id
+            return result
+        if status_code >= 400:
+            return jsonrpc_error(msg_id, INTERNAL_ERROR, f"HTTP {status_code}")
+        return jsonrpc_error(msg_id, INTERNAL_ERROR, "No response")
+
+    async def execute(
+        self,
+        messages: list[Any],
+        headers: Mapping[str, str],
+        base_url: str,
+        acquire: Callable[[], float] | None = None,
+    ) -> list[dict[str, Any]] | dict[str, Any]:
+        """
+        Executes a batch.
+
+        Args:
+            messages (list[Any]): Parsed batch array.
+            headers (Mapping[str, str]): Headers of the batch request.
+            base_url (str): Scheme and host of the batch request, such as ``https://example.com``.
+                Tools build absolute URLs from it.
+            acquire (Callable[[], float], optional): Takes one rate limit token for a
+                message, returning zero if it was taken. Defaults to no rate limit.
+
+        Returns:
+            list[dict[str, Any]] | dict[str, Any]: Responses in request order, or a single
+                error response if the batch itself is invalid.
+        """
+        if not messages:
+            return jsonrpc_error(None, INVALID_REQUEST, "Invalid Request")
+        if len(messages) > self._max_size:
+            return jsonrpc_error(
+                None,
+                INVALID_REQUEST,
+                f"Batch size {len(messages)} exceeds maximum of {self._max_size}",
+            )
+        forward = {name: headers[name] for name in _FORWARD_HEADERS if name in headers}
+        forward["accept"] = "application/json, text/event-stream"
+        forward["content-type"] = "application/json"
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        results = await asyncio.gather(
+            *(
+                self._execute_one(m, base_url, forward, semaphore, acquire)
+                for m in messages
+            )
+        )
+        return [r for r in results if r is not None]
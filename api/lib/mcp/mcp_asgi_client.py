@@ -0,0 +1,135 @@
+import json
+from dataclasses import dataclass
+from typing import Any, Mapping
+import httpx
+from starlette.types import ASGIApp
+from .sse import aiter_sse_json
+
+
+@dataclass(frozen=True)
+class McpPostResult:
+    """
+    Response of the MCP app to one posted JSON-RPC message.
+
+    Attributes:
+        status_code (int): HTTP status code.
+        data (Any): The JSON-RPC response, None if there is none.
+        body (bytes): Raw body of a response that is neither JSON nor an event stream.
+        content_type (str): Content type of the response.
+        session_id (str): ``mcp-session-id`` response header, empty if not set.
+    """
+
+    status_code: int
+    data: Any
+    body: bytes = b""
+    content_type: str = ""
+    session_id: str = ""
+
+
+class McpAsgiClient:
+    """
+    Long-lived in-process client for the mounted streamable HTTP MCP app.
+
+    Requests go straight to the MCP ASGI app through ``httpx.ASGITransport``, so no
+    socket, proxy or second HTTP stack is involved. Open the client once in the
+    application lifespan and close it on shutdown.
+    """
+
+    def __init__(self, app: ASGIApp, path: str = "/mcp", timeout: float = 30.0):
+        self._app = app
+        self._path = path
+        self._timeout = timeout
+        self._client: httpx.AsyncClient | None = None
+
+    def open(self) -> httpx.AsyncClient:
+        """
+        Creates the underlying client if it is not open yet.
+
+        Returns:
+            httpx.AsyncClient: The underlying client.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=self._app), timeout=self._timeout
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Closes the underlying client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def post(
+        self,
+        message: dict[str, Any],
+        headers: Mapping[str, str],
+        base_url: str,
+    ) -> McpPostResult:
+        """
+        Posts one JSON-RPC message to the MCP app.
+
+        An event-stream response is parsed frame by frame and reading stops at the
+        response for ``message["id"]``, or at the first JSON frame when the message has
+        no ``id``. The body of a response that is not JSON, such as an error page, is
+        returned as is.
+
+        Args:
+            message (dict[str, Any]): JSON-RPC message.
+            headers (Mapping[str, str]): Request headers such as ``authorization`` and ``mcp-session-id``.
+            base_url (str): Scheme and host the MCP app sees, such as ``https://example.com``.
+
+        Returns:
+            McpPostResult: The response.
+        """
+        client = self.open()
+        msg_id = message.get("id")
+        url = base_url.rstrip("/") + self._path
+        async with client.stream(
+            "POST", url, json=message, headers=dict(headers)
+        ) as response:
+            content_type = response.headers.get("content-type", "")
+            session_id = response.headers.get("mcp-session-id", "")
+            if not content_type.startswith("text/event-stream"):
+                body = await response.aread()
+                try:
+                    data = json.loads(body)
+                except ValueError:
+                    return McpPostResult(
+                        response.status_code, None, body, content_type, session_id
+                    )
+                return McpPostResult(
+                    response.status_code, data, b"", content_type, session_id
+                )
+            async for data in aiter_sse_json(response.aiter_lines()):
+                if msg_id is None or (
+                    isinstance(data, dict)
+                    and data.get("id") == msg_id
+                    and ("result" in data or "error" in data)
+                ):
+                    return McpPostResult(
+                        response.status_code, data, b"", content_type, session_id
+                    )
+            return McpPostResult(
+                response.status_code, None, b"", content_type, session_id
+            )
+
+    async def post_jsonrpc(
+        self,
+        message: dict[str, Any],
+        headers: Mapping[str, str],
+        base_url: str,
+    ) -> tuple[int, Any]:
+        """
+        Posts one JSON-RPC message to the MCP app, see ``post()``.
+
+        Args:
+            message (dict[str, Any]): JSON-RPC message.
+            headers (Mapping[str, str]): Request headers such as ``authorization`` and ``mcp-session-id``.
+            base_url (str): Scheme and host the MCP app sees, such as ``https://example.com``.
+
+        Returns:
+            tuple[int, Any]: HTTP status code and the JSON-RPC response, None if there is none.
+        """
+        result = await self.post(message, headers=headers, base_url=base_url)
+        return (result.status_code, result.data)
@@ -0,0 +1,36 @@
+import json
+from typing import Any, AsyncIterator
+
+
+async def aiter_sse_json(lines: AsyncIterator[str]) -> AsyncIterator[Any]:
+    """
+    Parses server-sent events incrementally, yielding the JSON ``data`` of each event.
+
+    Events are yielded as soon as their terminating blank line is read, so a caller can
+    stop reading once it has the event it needs. Events whose data is not JSON are skipped.
+
+    Args:
+        lines (AsyncIterator[str]): Lines of an event stream, such as ``response.aiter_lines()``.
+
+    Yields:
+        Any: Parsed JSON data of each event.
+    """
+    data_lines: list[str] = []
+    async for line in lines:
+        if line.startswith("data:"):
+            data = line[5:]
+            data_lines.append(data[1:] if data.startswith(" ") else data)
+            continue
+        if line or not data_lines:
+            # other fields such as event: or id: are not used
+            continue
+        try:
+            yield json.loads("\n".join(data_lines))
+        except json.JSONDecodeError:
+            pass
+        data_lines = []
+    if data_lines:
+        try:
+            yield json.loads("\n".join(data_lines))
+        except json.JSONDecodeError:
+            pass
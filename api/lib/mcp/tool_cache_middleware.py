@@ -0,0 +1,100 @@
+import hashlib
+import json
+from typing import Any
+from fastmcp.server.dependencies import get_http_headers
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.tools.tool import ToolResult
+from loguru import logger
+from mcp import types as mt
+from src.config.api_mcp_cache import ApiMcpCache
+from src.config.pkg_config import PkgConfig
+from ..descope.auth import AUTH
+from ..security import permissions
+from ..user.user_info import get_user_monad_name
+from . import ctx_util
+from .tool_result_cache import ToolResultCache
+
+
+class ToolCacheMiddleware(Middleware):
+    """
+    Serves repeated calls of MCP tools with deterministic results from memory.
+
+    Only the tools listed in the ``tools`` configuration are cached. Read-only and
+    idempotent annotations are not enough: tools such as ``get_codex_template_status``
+    add the current time to their result. The cache key is the tool name, the
+    normalized arguments, the caller monad name and the request root URL, which are
+    every input the listed tools use to build a result.
+
+    The caller token is verified and its template permissions checked before a cached
+    result is returned. Calls that fail these checks go to the tool, which reports
+    the error as usual.
+    """
+
+    def __init__(self, config: ApiMcpCache | None = None):
+        pkg_config = PkgConfig()
+        self._config = config if config is not None else pkg_config.api_info.mcp_cache
+        self._cache = ToolResultCache(
+            ttl_seconds=self._config.ttl_seconds,
+            max_entries=self._config.max_entries,
+            watch_path=pkg_config.config_cache.get_api_templates_generation_path(),
+            reload_check_seconds=self._config.reload_check_seconds,
+        )
+        self._tools = frozenset(self._config.tools)
+
+    async def _get_principal_key(self) -> str | None:
+        auth_header = get_http_headers().get("authorization", "")
+        if not auth_header.startswith("Bearer "):
+            return None
+        try:
+            session = await AUTH.verify_token(auth_header.split(" ")[1])
+        except Exception:
+            return None
+        # a cached result skips the check of its tool, so only principals passing
+        # the checks of every tool are served from the cache
+        if not (
+            session.has_permission(permissions.MCP_TEMPLATE_CONTEXT_ACCESS)
+            and session.has_permission(permissions.MCP_TEMPLATE_HEADER_ACCESS)
+        ):
+            return None
+        return get_user_monad_name(session) or ""
+
+    def _get_key(
+        self,
+        name: str,
+        arguments: dict[str, Any] | None,
+        monad_name: str,
+        app_root_url: str,
+    ) -> tuple[str, str, str, str]:
+        args = json.dumps(arguments or {}, sort_keys=True, default=str)
+        args_digest = hashlib.sha256(args.encode("utf-8")).hexdigest()
+        return (name, args_digest, monad_name, app_root_url)
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[mt.CallToolRequestParams],
+        call_next: CallNext[mt.CallToolRequestParams, ToolResult],
+    ) -> ToolResult:
+        name = context.message.name
+        if not self._config.enabled or name not in self._tools:
+            return await call_next(context)
+
+        monad_name = await self._get_principal_key()
+        if monad_name is None or context.fastmcp_context is None:
+            return await call_next(context)
+
+        app_root_url = ctx_util.get_request_app_root_url(
+            ctx=context.fastmcp_context, return_default=True
+        )
+        key = self._get_key(name, context.message.arguments, monad_name, app_root_url)
+        hit, result = self._cache.get(key)
+        if hit:
+            logger.debug("ToolCacheMiddleware() cache hit for {tool}", tool=name)
+            return result
+
+        result = await call_next(context)
+        self._cache.set(key, result)
+        return result
+
+    def invalidate(self) -> None:
+        """Clears all cached tool results."""
+        self._cache.invalidate()
@@ -0,0 +1,100 @@
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Hashable
+from loguru import logger
+
+
+class ToolResultCache:
+    """
+    Bounded TTL cache for MCP tool results.
+
+    Entries expire ``ttl_seconds`` after they are stored and the least recently used
+    entries are dropped once ``max_entries`` is reached. When ``watch_path`` is given,
+    its modification time is checked at most every ``reload_check_seconds`` and the
+    whole cache is cleared when it changes, such as when templates are reinstalled.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 300.0,
+        max_entries: int = 1024,
+        watch_path: Path | None = None,
+        reload_check_seconds: float = 1.0,
+    ):
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._watch_path = watch_path
+        self._reload_check = reload_check_seconds
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self._watch_stamp = self._get_watch_stamp()
+        self._last_check = time.monotonic()
+
+    def _get_watch_stamp(self) -> int:
+        if self._watch_path is None:
+            return 0
+        try:
+            return self._watch_path.stat().st_mtime_ns
+        except OSError:
+            return 0
+
+    def _check_reload(self, now: float) -> None:
+        if self._watch_path is None or now - self._last_check < self._reload_check:
+            return
+        self._last_check = now
+        stamp = self._get_watch_stamp()
+        if stamp != self._watch_stamp:
+            self._watch_stamp = stamp
+            self._entries.clear()
+            logger.debug(
+                "ToolResultCache() cleared, {path} changed", path=self._watch_path
+            )
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        """
+        Gets a cached result.
+
+        Args:
+            key (Hashable): Cache key.
+
+        Returns:
+            tuple[bool, Any]: ``(True, result)`` on a hit; Otherwise, ``(False, None)``.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._check_reload(now)
+            item = self._entries.get(key)
+            if item is None:
+                return (False, None)
+            result, expires_at = item
+            if expires_at <= now:
+                del self._entries[key]
+                return (False, None)
+            self._entries.move_to_end(key)
+            return (True, result)
+
+    def set(self, key: Hashable, result: Any) -> None:
+        """
+        Stores a result.
+
+        Args:
+            key (Hashable): Cache key.
+            result (Any): Result to cache. Treat as read-only once cached, it is shared.
+        """
+        if self._max_entries <= 0 or self._ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (result, time.monotonic() + self._ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Clears all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
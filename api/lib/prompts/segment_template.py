@@ -0,0 +1,58 @@
+import re
+from typing import Mapping
+
+
+class SegmentTemplate:
+    """
+    Text compiled once into literal segments and named slots.
+
+    Rendering joins the literals with the slot values, so no parsing, formatting or
+    replacing is done per render.
+
+    Example:
+        >>> t = SegmentTemplate("Hi <<name>>!", {"<<name>>": "name"})
+        >>> t.render({"name": "Ada"})
+        'Hi Ada!'
+    """
+
+    def __init__(self, text: str, markers: Mapping[str, str]):
+        """
+        Args:
+            text (str): Text containing slot markers.
+            markers (Mapping[str, str]): Marker text to slot name.
+        """
+        parts: list[str] = []
+        slots: list[str] = []
+        if markers:
+            pattern = re.compile("|".join(re.escape(m) for m in markers))
+            pos = 0
+            for match in pattern.finditer(text):
+                parts.append(text[pos : match.start()])
+                slots.append(markers[match.group(0)])
+                pos = match.end()
+            parts.append(text[pos:])
+        else:
+            parts.append(text)
+        self._parts = tuple(parts)
+        self._slots = tuple(slots)
+
+    def render(self, values: Mapping[str, str]) -> str:
+        """
+        Renders the template.
+
+        Args:
+            values (Mapping[str, str]): Slot name to value. Every slot must have a value.
+
+        Returns:
+            str: Rendered text.
+        """
+        out = [self._parts[0]]
+        for slot, part in zip(self._slots, self._parts[1:]):
+            out.append(values[slot])
+            out.append(part)
+        return "".join(out)
+
+    @property
+    def slots(self) -> frozenset[str]:
+        """Gets the slot names used in the template."""
+        return frozenset(self._slots)
@@ -0,0 +1,224 @@
+import json
+from functools import lru_cache
+from loguru import logger
+from ..routes import mcp_path
+from ..routes.rpc_descriptors import (
+    ARTIFACT_NAME_SLOT,
+    TEMPLATE_CONTENT_SLOT,
+    RpcDescriptor,
+    get_rpc_descriptor_table,
+)
+from .segment_template import SegmentTemplate
+
+_TEMPLATE_CONTENT_PLACEHOLDER = "< template_content_with_frontmatter >"
+_ATTACHED_IMAGE_SLOT = "\x00attached_image_block\x00"
+_MARKERS = {
+    ARTIFACT_NAME_SLOT: "artifact_name",
+    # artifact name inside the pre-rendered JSON snippets
+    json.dumps(ARTIFACT_NAME_SLOT): "artifact_name_json",
+    _ATTACHED_IMAGE_SLOT: "attached_image_block",
+}
+
+
+@lru_cache()
+def _get_submission_tools() -> tuple[RpcDescriptor, RpcDescriptor]:
+    """
+    Gets the verify and finalize tool descriptors with the template content comment rendered in.
+
+    Returns:
+        tuple[RpcDescriptor, RpcDescriptor]: Verify and finalize descriptors.
+    """
+    table = get_rpc_descriptor_table()
+    content = f'template_content": {json.dumps(TEMPLATE_CONTENT_SLOT)}'
+    comment = f"{content} // Must include YAML + body"
+    return (
+        table.verify_tool.with_json_replaced(content, comment),
+        table.finalize_tool.with_json_replaced(content, comment),
+    )
+
+
+@lru_cache(maxsize=128)
+def compile_upgrade_template_prompt(
+    template_type: str, latest_version: str
+) -> SegmentTemplate:
+    """
+    Compiles the upgrade prompt of a template type and version into a segment template.
+
+    The tool call JSON snippets are rendered here once with their call IDs fixed, so
+    only the artifact name and the attached image block are filled in per render.
+
+    Args:
+        template_type (str): Template type as requested, such as ``glyph``.
+        latest_version (str): Version to upgrade to such as ``v2.11``.
+
+    Returns:
+        SegmentTemplate: Template with ``artifact_name``, ``artifact_name_json`` and
+            ``attached_image_block`` slots.
+    """
+    tt = template_type.strip().lower()
+    artifact_name = ARTIFACT_NAME_SLOT
+    tools = mcp_path.get_mcp_tool_call_descriptors(
+        template_type=tt, version=latest_version
+    )
+    template_tool = tools.template_tool
+    instructions_tool = tools.instructions_tool
+    registry_tool = tools.registry_tool
+    executor_mode_tool = mcp_path.get_mcp_executor_mode_descriptor()
+    verify_tool, finalize_tool = _get_submission_tools()
+
+    # the artifact name slot stays in the JSON as its encoded marker
+    template_tool_json = template_tool.to_json(artifact_name)
+    instructions_tool_json = instructions_tool.to_json(artifact_name)
+    registry_tool_json = registry_tool.to_json(artifact_name)
+    verify_tool_json = verify_tool.to_json(
+        artifact_name, template_content=_TEMPLATE_CONTENT_PLACEHOLDER
+    )
+    finalize_tool_json = finalize_tool.to_json(
+        artifact_name, template_content=_TEMPLATE_CONTENT_PLACEHOLDER
+    )
+    executor_mode_tool_json = executor_mode_tool.to_json()
+
+    ver = latest_version if latest_version.startswith("v") else f"v{latest_version}"
+
+    system_content = (
+        "## ⬒ System Instructions  \n\n"
+        "**You are an assistant that can:**\n"
+        "\n"
+        f"- Call tools (e.g. `{template_tool.tool_name}`) to perform active queries.\n"
+        "\n"
+        "---\n"
+        "\n"
+        "### 🧷 Artifact Under Upgrade\n\n"
+        f"- `artifact_name`: **{artifact_name}**\n"
+        f"- `template_type`: **{template_type}**\n"
+        f"- `template_version`: `{ver}`\n"
+        "\n"
+        "---\n"
+        "\n"
+        "## ⬒ Tool Reference\n\n"
+        f"### **{template_tool.tool_name}**\n"
+        "\n"
+        "Use this when you need to get the full template content for a specific type and version.\n"
+        "\n"
+        "```json\n"
+        f"{template_tool_json}\n"
+        "```\n"
+        "\n"
+        f"### **{instructions_tool.tool_name}**\n"
+        "\n"
+        "Use this when you need to get the instructions on how to apply templates.\n"
+        "\n"
+        "```json\n"
+        f"{instructions_tool_json}\n"
+        "```\n"
+        "\n"
+        f"### **{registry_tool.tool_name}**\n"
+        "\n"
+        "Use this when you need to get the registry for the template.\n"
+        "This registry determines how the metadata in the template is structured and the rules to apply.\n"
+        "\n"
+        "```json\n"
+        f"{registry_tool_json}\n"
+        "```\n"
+        "\n"
+        f"### **{executor_mode_tool.tool_name}**\n"
+        "\n"
+        "Use this tool when retrieving the Executor Mode (CBIB) that is used in Codex templates.\n"
+        "\n"
+        "```json\n"
+        f"{executor_mode_tool_json}\n"
+        "```\n"
+        "\n"
+        f"### **{verify_tool.tool_name}**\n"
+        "\n"
+        "Use this to verify the metadata fields of a template artifact against the registered schema.\n"
+        f"Replace `{_TEMPLATE_CONTENT_PLACEHOLDER}` of **jsonrpc** with the actual **json encoded** template markdown content including frontmatter.\n"
+        "\n"
+        "```json\n"
+        f"{verify_tool_json}\n"
+        "```\n"
+        "\n"
+        f"### **{finalize_tool.tool_name}**\n"
+        "\n"
+        "Use this to finalize an artifact submission by adding any necessary metadata or performing final validation steps.\n"
+        f"Replace `{_TEMPLATE_CONTENT_PLACEHOLDER}` of **jsonrpc** with the actual **json encoded** template markdown content including frontmatter.\n"
+        "\n"
+        "```json\n"
+        f"{finalize_tool_json}\n"
+        "```\n"
+    )
+
+    user_content = (
+        "\n"
+        "---\n"
+        "\n"
+        "## ⬒ Upgrade Sequence Instructions\n\n"
+        f"The purpose of this workflow is to upgrade the artifact **{artifact_name}** to template version `{latest_version}`, using canonical execution rules.\n"
+        "\n"
+        "Follow this 6-step sequence exactly:\n"
+        "\n"
+        f"1. **Call** `{template_tool.tool_name}` to retrieve the canonical target template.\n"
+        f"2. **Call** `{executor_mode_tool.tool_name}` to confirm execution policy.\n"
+        f"3. **Call** `{registry_tool.tool_name}` to retrieve the metadata validation schema.\n"
+        f"4. **Call** `{instructions_tool.tool_name}` to retrieve rendering directives and strict mode rules.\n"
+        f"5. **Apply** the upgrade: Render the existing artifact into the new template version, replacing any conditionals or outdated fields.\n"
+        f"6. **Verify** using `{verify_tool.tool_name}`, then **finalize** with `{finalize_tool.tool_name}`.\n"
+        "\n"
+        "> ⚠ If any tool fails (e.g. 401, registry mismatch, unresolved placeholders), return the failure output directly. Do not attempt speculative completion.\n"
+        "\n"
+        "---\n"
+        "\n"
+    )
+    user_content += _ATTACHED_IMAGE_SLOT
+    user_content += (
+        "## ⬒ Template to Upgrade\n\n"
+        "```md\n"
+        "< Paste full artifact markdown content here >\n"
+        "```\n"
+    )
+
+    logger.debug(
+        "Compiled upgrade prompt for {template_type} {version}",
+        template_type=template_type,
+        version=latest_version,
+    )
+    return SegmentTemplate(f"{system_content}{user_content}", _MARKERS)
+
+
+@lru_cache(maxsize=256)
+def render_upgrade_template_prompt(
+    template_type: str,
+    latest_version: str,
+    artifact_name: str,
+    attached_img_name: str | None = None,
+) -> str:
+    """
+    Renders the upgrade prompt, keeping the most recently rendered prompts.
+
+    Args:
+        template_type (str): Template type as requested, such as ``glyph``.
+        latest_version (str): Version to upgrade to such as ``v2.11``.
+        artifact_name (str): Name of the artifact to upgrade.
+        attached_img_name (str | None, optional): Name of an attached image. Defaults to None.
+
+    Returns:
+        str: Markdown prompt.
+    """
+    if attached_img_name:
+        attached_image_block = (
+            "## 🖼️ Attached Image Information\n\n"
+            f"- `{attached_img_name}` is included and should be referenced in the upgraded template as needed to aid getting field information.\n"
+            "\n"
+            "---\n"
+            "\n"
+        )
+    else:
+        attached_image_block = ""
+    template = compile_upgrade_template_prompt(template_type, latest_version)
+    return template.render(
+        {
+            "artifact_name": artifact_name,
+            "artifact_name_json": json.dumps(artifact_name),
+            "attached_image_block": attached_image_block,
+        }
+    )
@@ -0,0 +1,143 @@
+import functools
+import json
+import math
+from http.cookies import SimpleCookie
+from loguru import logger
+from starlette.types import ASGIApp, Receive, Scope, Send
+from src.config.api_rate_limit import ApiRateLimit, ApiRateLimitQuota
+from src.config.pkg_config import PkgConfig
+from ..descope.auth import AUTH
+from .token_bucket_limiter import TokenBucketLimiter
+
+# request state attribute holding a callable that takes one more token from the
+# bucket of the request principal, returning what ``TokenBucketLimiter.acquire`` returns
+RATE_LIMIT_ACQUIRE = "rate_limit_acquire"
+
+
+class RateLimitMiddleware:
+    """
+    ASGI middleware that meters requests per principal before authentication and routing.
+
+    The bearer token, or ``access_token`` cookie, is verified first; verified sessions
+    are cached by token, so the route does not verify it again. Requests with a valid
+    token are keyed by user id, so all tokens of a user share one bucket, and get the
+    quota of the user's scopes. Requests without a token or with an invalid one are
+    keyed by client address and get the anonymous quota. Because this runs before
+    routing, responses served from the response cache are metered too.
+
+    Over-quota requests are answered with ``429 Too Many Requests`` and a
+    ``Retry-After`` header without reaching any route. Admitted requests get a
+    ``RATE_LIMIT_ACQUIRE`` request state attribute, so handlers that run several
+    operations for one request, such as JSON-RPC batches, can charge each of them.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        config: ApiRateLimit | None = None,
+        limiter: TokenBucketLimiter | None = None,
+    ):
+        self.app = app
+        self._config = config if config is not None else PkgConfig().api_info.rate_limit
+        self._path_prefixes = tuple(self._config.path_prefixes)
+        self._limiter = (
+            limiter
+            if limiter is not None
+            else TokenBucketLimiter(max_keys=self._config.max_principals)
+        )
+        # most generous quota first so the first scope match wins
+        self._scope_quotas = sorted(
+            self._config.scopes.items(),
+            key=lambda item: item[1].requests_per_minute,
+            reverse=True,
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or not self._config.enabled
+            or scope["method"] == "OPTIONS"
+            or not scope["path"].startswith(self._path_prefixes)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        key, quota = await self._get_principal(scope)
+        retry_after = self._limiter.acquire(key, quota)
+        if retry_after > 0:
+            logger.debug("RateLimitMiddleware() Rate limit exceeded for {key}", key=key)
+            await self._reject(send, retry_after)
+            return
+        scope.setdefault("state", {})[RATE_LIMIT_ACQUIRE] = functools.partial(
+            self._limiter.acquire, key, quota
+        )
+        await self.app(scope, receive, send)
+
+    def _get_token(self, scope: Scope) -> str | None:
+        authorization = None
+        cookie = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                authorization = value.decode("latin-1")
+            elif name == b"cookie":
+                cookie = value.decode("latin-1")
+        if authorization:
+            parts = authorization.split()
+            if len(parts) == 2 and parts[0].lower() == "bearer":
+                return parts[1]
+        if cookie:
+            morsel = SimpleCookie(cookie).get("access_token")
+            if morsel is not None:
+                return morsel.value
+        return None
+
+    def _get_quota(self, scopes: set[str]) -> ApiRateLimitQuota:
+        for scope_name, quota in self._scope_quotas:
+            if scope_name in scopes:
+                return quota
+        return self._config.default
+
+    def _get_client_key(self, scope: Scope) -> str:
+        if self._config.trust_forwarded_for:
+            hops = self._config.trusted_proxy_hops
+            forwarded: list[str] = []
+            for name, value in scope["headers"]:
+                if name == b"x-forwarded-for":
+                    forwarded.extend(
+                        h.strip() for h in value.decode("latin-1").split(",")
+                    )
+            # each trusted proxy appends the address it received the request from,
+            # entries left of those were sent by the client and can hold any value
+            if len(forwarded) >= hops and forwarded[-hops]:
+                return f"anonymous:{forwarded[-hops]}"
+        client = scope.get("client")
+        host = client[0] if client else "unknown"
+        return f"anonymous:{host}"
+
+    async def _get_principal(self, scope: Scope) -> tuple[str, ApiRateLimitQuota]:
+        token = self._get_token(scope)
+        if token:
+            try:
+                # verified sessions are cached by token, so the route does not re-verify
+                session = await AUTH.verify_token(token)
+            except Exception:
+                # invalid tokens are metered as anonymous; the route rejects them
+                session = None
+            if session is not None and session.user_id:
+                return f"user:{session.user_id}", self._get_quota(session.scopes)
+        return self._get_client_key(scope), self._config.anonymous
+
+    async def _reject(self, send: Send, retry_after: float) -> None:
+        body = json.dumps({"detail": "Too many requests"}).encode("utf-8")
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                    (b"retry-after", str(math.ceil(retry_after)).encode("latin-1")),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,57 @@
+import threading
+import time
+from collections import OrderedDict
+from src.config.api_rate_limit import ApiRateLimitQuota
+
+
+class TokenBucketLimiter:
+    """
+    In-process token-bucket rate limiter.
+
+    Each key has its own bucket that refills continuously at the quota rate up to the
+    quota burst. Buckets are refilled lazily when a key is seen, so every call is O(1).
+    At most ``max_keys`` buckets are kept; the least recently used are dropped first,
+    which at worst gives a dropped key a full bucket again.
+    """
+
+    def __init__(self, max_keys: int = 100_000):
+        self._max_keys = max_keys
+        self._lock = threading.Lock()
+        # key -> [tokens, last refill time]
+        self._buckets: OrderedDict[str, list[float]] = OrderedDict()
+
+    def acquire(self, key: str, quota: ApiRateLimitQuota) -> float:
+        """
+        Takes one token from the bucket of a key.
+
+        Args:
+            key (str): Bucket key, such as ``user:<user_id>``.
+            quota (ApiRateLimitQuota): Quota of the key.
+
+        Returns:
+            float: Zero if a token was taken; Otherwise, seconds until a token is available.
+        """
+        rate = quota.requests_per_minute / 60.0
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = [float(quota.burst), now]
+                self._buckets[key] = bucket
+                if len(self._buckets) > self._max_keys:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+                bucket[0] = min(
+                    float(quota.burst), bucket[0] + (now - bucket[1]) * rate
+                )
+                bucket[1] = now
+            if bucket[0] >= 1.0:
+                bucket[0] -= 1.0
+                return 0.0
+            return (1.0 - bucket[0]) / rate
+
+    def reset(self) -> None:
+        """Drops all buckets."""
+        with self._lock:
+            self._buckets.clear()
@@ -1,10 +1,6 @@
 from collections import defaultdict
-from functools import lru_cache
-from src.config.pkg_config import PkgConfig
 from urllib.parse import quote
-
-_SETTINGS = PkgConfig()
-_TEMPLATE_DIR = _SETTINGS.config_cache.get_api_templates_path()
+from .rpc_descriptors import get_rpc_descriptor_table
 
 
 class ApiPaths(defaultdict):
@@ -14,7 +10,6 @@ class ApiPaths(defaultdict):
     manifest_api_path: str
 
 
-@lru_cache(maxsize=128)
 def get_api_paths_template(
     template_type: str,
     version: str,
@@ -32,31 +27,23 @@ def get_api_paths_template(
         ApiPaths: Mapping containing template, instructions, registry, and manifest URLs.
     """
 
-    api_paths = ApiPaths()
-    # # http://localhost:8000/api/v1/templates/glyph/template?artifact_name=My%20Artifact&version=v2.11
-    api_path = f"{app_root_url}/{_TEMPLATE_DIR.name}/{template_type}/template?version={version}"
-    if artifact_name:
-        api_path += f"&artifact_name={quote(artifact_name)}"
-    api_paths["template_api_path"] = api_path
-
-    # http://localhost:8000/api/v1/templates/glyph/instructions?artifact_name=My%20Artifact&version=v2.11
-    api_path = f"{app_root_url}/{_TEMPLATE_DIR.name}/{template_type}/instructions?version={version}"
-    if artifact_name:
-        api_path += f"&artifact_name={quote(artifact_name)}"
-    api_paths["instructions_api_path"] = api_path
-
-    # http://localhost:8000/api/v1/templates/glyph/registry?artifact_name=My%20Artifact&version=v2.11
-    api_path = f"{app_root_url}/{_TEMPLATE_DIR.name}/{template_type}/registry?version={version}"
-    if artifact_name:
-        api_path += f"&artifact_name={quote(artifact_name)}"
-    api_paths["registry_api_path"] = api_path
-
-    # http://localhost:8000/api/v1/templates/glyph/manifest?artifact_name=My%20Artifact&version=v2.11
-    api_path = f"{app_root_url}/{_TEMPLATE_DIR.name}/{template_type}/manifest?version={version}"
-    if artifact_name:
-        api_path += f"&artifact_name={quote(artifact_name)}"
-    api_paths["manifest_api_path"] = api_path
+    # http://localhost:8000/api/v1/templates/glyph/template?artifact_name=My%20Artifact&version=v2.11
+    suffixes = get_rpc_descriptor_table().get_api_path_suffixes(template_type, version)
+    query = f"&artifact_name={quote(artifact_name)}" if artifact_name else ""
 
+    api_paths = ApiPaths()
+    api_paths["template_api_path"] = (
+        f"{app_root_url}{suffixes.template_api_path}{query}"
+    )
+    api_paths["instructions_api_path"] = (
+        f"{app_root_url}{suffixes.instructions_api_path}{query}"
+    )
+    api_paths["registry_api_path"] = (
+        f"{app_root_url}{suffixes.registry_api_path}{query}"
+    )
+    api_paths["manifest_api_path"] = (
+        f"{app_root_url}{suffixes.manifest_api_path}{query}"
+    )
     return api_paths
 
 
@@ -0,0 +1,38 @@
+from typing import Any, Callable, Coroutine
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from ..util.request_body import PARSED_BODY_STATE_KEY, get_parsed_body
+
+
+class CachedBodyRequest(Request):
+    """
+    Request whose ``json()`` is served from the request-scoped parsed body cache.
+
+    FastAPI calls ``request.json()`` when it validates body parameters. With this
+    request class that parse is shared with ``with_session`` and any middleware
+    that used ``get_parsed_body`` for the same request.
+    """
+
+    async def json(self) -> Any:
+        if getattr(self.state, PARSED_BODY_STATE_KEY, None) is None:
+            # let invalid JSON raise as usual so FastAPI reports a 422
+            self._json = await super().json()
+            setattr(self.state, PARSED_BODY_STATE_KEY, self._json)
+            return self._json
+        body = await get_parsed_body(self)
+        if body is None:
+            return await super().json()
+        return body
+
+
+class CachedBodyRoute(APIRoute):
+    """Route class that parses each JSON request body only once."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        original_route_handler = super().get_route_handler()
+
+        async def cached_body_route_handler(request: Request) -> Response:
+            request = CachedBodyRequest(request.scope, request.receive)
+            return await original_route_handler(request)
+
+        return cached_body_route_handler
@@ -0,0 +1,143 @@
+import hashlib
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from loguru import logger
+from src.config.pkg_config import PkgConfig
+from api.lib.util.result import Result
+from api.models.executor_modes.v1_0.cbib_response import CbibResponse
+
+
+def validate_version_str(
+    version: str,
+) -> Result[str, None] | Result[None, Exception]:
+    """
+    Normalizes an executor mode version such as ``1``, ``1.0`` or ``v1.0`` to ``v1.0``.
+
+    Args:
+        version (str): Version string.
+
+    Returns:
+        Result[str, None] | Result[None, Exception]: Normalized version or the validation error.
+    """
+    if not version:
+        return Result(None, Exception("Version is required."))
+    v = version.strip().lower()
+    v = v.lstrip("v")
+    if not v:
+        return Result(None, Exception("Version cannot be empty."))
+    if not v.replace(".", "").isdigit():
+        return Result(None, Exception("Invalid version format."))
+    if v.isdigit():
+        v = f"{v}.0"
+    if not v.startswith("v"):
+        v = "v" + v
+    return Result(v, None)
+
+
+@dataclass(frozen=True)
+class CbibEntry:
+    """
+    Executor mode (CBIB) loaded once, validated and pre-serialized.
+
+    Attributes:
+        version (str): Version folder name such as ``v1.0``.
+        model (CbibResponse): Validated model. Treat as read-only, it is shared.
+        json_bytes (bytes): Serialized JSON of ``model``.
+        etag (str): Quoted strong ETag of ``json_bytes``.
+    """
+
+    version: str
+    model: CbibResponse
+    json_bytes: bytes
+    etag: str
+
+
+class CbibStore:
+    """
+    In-memory store of every executor mode version under ``ConfigCache.get_api_cbib_path()``.
+
+    All versions are read and validated when the store is created, so serving an
+    executor mode does no file or JSON work.
+    """
+
+    def __init__(self, base_path: Path, default_version: str):
+        """
+        Args:
+            base_path (Path): Executor modes directory holding ``vX.Y/cbib.json`` folders.
+            default_version (str): Default version such as ``1.0`` or ``v1.0``.
+        """
+        self._entries: dict[str, CbibEntry] = {}
+        if base_path.is_dir():
+            for version_dir in sorted(base_path.iterdir()):
+                cbib_path = version_dir / "cbib.json"
+                if not version_dir.name.startswith("v") or not cbib_path.is_file():
+                    continue
+                model = CbibResponse(**json.loads(cbib_path.read_text()))
+                json_bytes = model.model_dump_json().encode("utf-8")
+                etag = f'"{hashlib.sha256(json_bytes).hexdigest()[:32]}"'
+                self._entries[version_dir.name] = CbibEntry(
+                    version=version_dir.name,
+                    model=model,
+                    json_bytes=json_bytes,
+                    etag=etag,
+                )
+        else:
+            logger.error(
+                "CbibStore() executor modes path does not exist: {path}",
+                path=base_path,
+            )
+        v_result = validate_version_str(default_version)
+        self._default_version = v_result.data if Result.is_success(v_result) else ""
+        logger.debug(
+            "CbibStore() loaded versions {versions}, default {default}",
+            versions=list(self._entries.keys()),
+            default=self._default_version,
+        )
+
+    def get(self, version: str) -> CbibEntry | None:
+        """
+        Gets an executor mode by normalized version.
+
+        Args:
+            version (str): Version as returned by ``validate_version_str()`` such as ``v1.0``.
+
+        Returns:
+            CbibEntry | None: The entry if found; Otherwise, None.
+        """
+        return self._entries.get(version)
+
+    def get_default(self) -> CbibEntry | None:
+        """
+        Gets the default executor mode configured in ``pyproject.toml``.
+
+        Returns:
+            CbibEntry | None: The entry if found; Otherwise, None.
+        """
+        return self._entries.get(self._default_version)
+
+    @property
+    def default_version(self) -> str:
+        """Gets the normalized default version such as ``v1.0``."""
+        return self._default_version
+
+    @property
+    def versions(self) -> list[str]:
+        """Gets the loaded versions."""
+        return list(self._entries.keys())
+
+
+@lru_cache()
+def get_cbib_store() -> CbibStore:
+    """
+    Gets the process-wide executor mode store.
+
+    Returns:
+        CbibStore: Executor mode store.
+    """
+    config = PkgConfig()
+    return CbibStore(
+        base_path=config.config_cache.get_api_cbib_path(),
+        default_version=config.template_cbib_api.version,
+    )
@@ -1,8 +1,5 @@
-import json
 from datetime import datetime
-from pathlib import Path
 from typing import Any, cast
-from jinja2 import Template
 from loguru import logger
 from fastapi import APIRouter, HTTPException, status
 
@@ -53,6 +50,7 @@ from api.lib.exceptions import (
 from api.lib.routes import api_path as api_path_utils
 from api.lib.routes import mcp_path as mcp_path_utils
 from . import fn_versions
+from .template_store import get_template_store
 from .mcp_path import validate_version_str
 
 _CONFIG = Config()
@@ -60,7 +58,6 @@ _SETTINGS = PkgConfig()
 
 router = APIRouter(prefix=f"{_CONFIG.api_v1_prefix}/templates", tags=["Templates"])
 _API_RELATIVE_URL = _CONFIG.api_v1_prefix
-_TEMPLATE_DIR = _SETTINGS.config_cache.get_api_templates_path()
 
 
 def _get_template_manifest(
@@ -81,11 +78,10 @@ def _get_template_manifest(
         raise HTTPException(status_code=400, detail=str(v_result.error))
     ver = v_result.data
 
-    path = _TEMPLATE_DIR / template_type / ver / "manifest.json"
-
-    if not path.exists():
+    manifest = get_template_store().get_manifest(template_type, ver)
+    if manifest is None:
         raise HTTPException(status_code=404, detail="Manifest file not found.")
-    json_content: dict = json.loads(path.read_text())
+    json_content: dict = manifest
     if server_mode_kind == ServerModeKind.API and app_root_url:
         api_paths = api_path_utils.get_api_paths_template(
             template_type=template_type,
@@ -141,11 +137,14 @@ def _get_template_registry(template_type: str, version: str) -> dict[str, Any]:
         )
         raise HTTPException(status_code=400, detail=str(v_result.error))
     ver = v_result.data
-    path = _TEMPLATE_DIR / template_type / ver / "registry.json"
-    if not path.exists():
-        logger.error("Registry file not found at path: {path}", path=path)
+    json_content = get_template_store().get_registry(template_type, ver)
+    if json_content is None:
+        logger.error(
+            "Registry file not found for {template_type} {version}",
+            template_type=template_type,
+            version=ver,
+        )
         raise HTTPException(status_code=404, detail="Registry file not found.")
-    json_content = cast(dict[str, Any], json.loads(path.read_text()))
     return json_content
 
 
@@ -167,13 +166,16 @@ async def get_template(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(v_result.error)
         )
     ver = v_result.data
-    path = _TEMPLATE_DIR / template_type / ver / "template.md"
-    if not path.exists():
-        logger.error("Template file not found at path: {path}", path=path)
+    fm = get_template_store().get_template(template_type, ver)
+    if fm is None:
+        logger.error(
+            "Template file not found for {template_type} {version}",
+            template_type=template_type,
+            version=ver,
+        )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Template file not found."
         )
-    fm = FrontMatterMeta(file_path=path)
 
     if not fm.has_field("instruction_info"):
         fm.set_field("instruction_info", {})
@@ -258,13 +260,17 @@ async def get_template_instructions(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(v_result.error)
         )
     ver = v_result.data
-    path = _TEMPLATE_DIR / template_type / ver / "instructions.md"
-    if not path.exists():
-        logger.error("Instructions file not found at path: {path}", path=path)
+    store_entry = get_template_store().get(template_type, ver)
+    fm = get_template_store().get_instructions(template_type, ver)
+    if store_entry is None or fm is None:
+        logger.error(
+            "Instructions file not found for {template_type} {version}",
+            template_type=template_type,
+            version=ver,
+        )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Instructions file not found."
         )
-    fm = FrontMatterMeta(file_path=path)
 
     if artifact_name is None:
         has_artifact_name = False
@@ -295,18 +301,18 @@ async def get_template_instructions(
 [`{_API_RELATIVE_URL}/executor_modes/CANONICAL-EXECUTOR-MODE-V{cbib_ver}`]({cem_api_path})"""
 
     if server_mode_kind == ServerModeKind.MCP:
-        exec_mode_rpc = mcp_path_utils.get_mcp_executor_mode_rpc(cbib_ver)
-        rpc_json = json.dumps(exec_mode_rpc, indent=2)
+        exec_mode_tool = mcp_path_utils.get_mcp_executor_mode_descriptor(cbib_ver)
+        rpc_json = exec_mode_tool.to_json()
         link_block = f"""📘 **MCP Definition:**
 
-- MCP Tool Call Name: `{exec_mode_rpc["params"]["name"]}`  
+- MCP Tool Call Name: `{exec_mode_tool.tool_name}`  
 - MCP `jsonrpc` Tool Call Info (args):
 
 ```json
 {rpc_json}
 ```
 """
-        exec_mode_rpc = None
+        exec_mode_tool = None
         rpc_json = None
 
     if artifact_name:
@@ -316,7 +322,8 @@ async def get_template_instructions(
     else:
         template_scope_block = ""
 
-    template: Template = Template(source=fm.content)
+    # compiled once when the template store was loaded
+    template = store_entry.instructions_template
     content = template.render(
         link_definition_block=link_block,
         artifact_name=artifact_name,
@@ -478,12 +485,10 @@ def _verify_artifact(submission: ArtifactSubmission) -> VerifyArtifactResponse:
             detail="Field template_version is not specified in frontmatter.",
         )
 
-    registry_path = (
-        _TEMPLATE_DIR / fm.template_type / f"v{fm.template_version}" / "registry.json"
+    registry = get_template_store().get_registry(
+        fm.template_type, f"v{fm.template_version}"
     )
-    if not registry_path.is_absolute():
-        registry_path = Path.cwd() / registry_path
-    if not registry_path.exists():
+    if registry is None:
         logger.error(
             "No registry found for template_type: {template_type}, template_version: {template_version}",
             template_type=fm.template_type,
@@ -493,7 +498,6 @@ def _verify_artifact(submission: ArtifactSubmission) -> VerifyArtifactResponse:
             status_code=400,
             detail=f"No registry found for the specified template_type of {fm.template_type} and template_version {fm.template_version} not found.",
         )
-    registry: dict[str, Any] = json.loads(registry_path.read_text())
 
     verify_instance = VerifyMetaFields(registry=registry, fm=fm)
     result = verify_instance.verify()
@@ -635,12 +639,10 @@ async def finalize_artifact(
             detail="Field template_version is not specified in frontmatter.",
         )
 
-    registry_path = (
-        _TEMPLATE_DIR / fm.template_type / f"v{fm.template_version}" / "registry.json"
+    registry = get_template_store().get_registry(
+        fm.template_type, f"v{fm.template_version}"
     )
-    if not registry_path.is_absolute():
-        registry_path = Path.cwd() / registry_path
-    if not registry_path.exists():
+    if registry is None:
         logger.error(
             f"No registry found for template_type: {fm.template_type}, template_version: {fm.template_version}"
         )
@@ -648,7 +650,6 @@ async def finalize_artifact(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No registry found for the specified template_type of {fm.template_type} and template_version {fm.template_version} not found.",
         )
-    registry: dict[str, Any] = json.loads(registry_path.read_text())
 
     clean_instance = CleanMetaFields(registry=registry, fm=fm)
     result = clean_instance.cleanup()
@@ -732,11 +733,16 @@ def _upgrade_to_template(
         )
 
     try:
-        path = _TEMPLATE_DIR / upgrade_fm.template_type / new_version / "template.md"
-        if not path.exists():
-            logger.error("Template file not found at path: {path}", path=path)
+        template_fm = get_template_store().get_template(
+            upgrade_fm.template_type, new_version
+        )
+        if template_fm is None:
+            logger.error(
+                "Template file not found for {template_type} {version}",
+                template_type=upgrade_fm.template_type,
+                version=new_version,
+            )
             raise HTTPException(status_code=404, detail="Template file not found.")
-        template_fm = FrontMatterMeta(file_path=path)
     except Exception as e:
         raise HTTPException(
             status_code=400,
@@ -1,8 +1,12 @@
-import uuid
 from collections import defaultdict
 
 from src.config.pkg_config import PkgConfig
 from ..util.result import Result
+from .rpc_descriptors import (
+    RpcDescriptor,
+    TemplateRpcDescriptors,
+    get_rpc_descriptor_table,
+)
 from api.lib.exceptions import (
     VersionError,
     VersionLatestError,
@@ -37,6 +41,23 @@ def validate_version_str(
     return Result(v, None)
 
 
+# normalized versions by input; only successful validations are kept
+_NORMALIZED_VERSIONS: dict[str, str] = {}
+
+
+def _normalize_version(version: str | None) -> str:
+    if version is not None:
+        ver = _NORMALIZED_VERSIONS.get(version)
+        if ver is not None:
+            return ver
+    v_result = validate_version_str(version)
+    if not Result.is_success(v_result):
+        raise v_result.error
+    if len(_NORMALIZED_VERSIONS) < 1024:
+        _NORMALIZED_VERSIONS[version] = v_result.data  # type: ignore[index]
+    return v_result.data
+
+
 class McpToolArg(defaultdict):
     name: str
     value: str
@@ -85,10 +106,7 @@ def get_mcp_paths_template(
         >>> # - get_codex_template_manifest
     """
 
-    v_result = validate_version_str(version)
-    if not Result.is_success(v_result):
-        raise v_result.error
-    ver = v_result.data
+    ver = _normalize_version(version)
     a_name = artifact_name if artifact_name else ""
 
     mcp_paths = McpPaths()
@@ -203,73 +221,29 @@ def get_mcp_tool_call_rpc(
         Exception: If the version string validation fails, the validation error is raised.
     """
 
-    results = {}
-    # generate a uuid
-    v_result = validate_version_str(version)
-    if not Result.is_success(v_result):
-        raise v_result.error
-    ver = v_result.data
-    call_id = str(uuid.uuid4())
-    a_name = artifact_name if artifact_name else ""
-    results["template_tool"] = {
-        "jsonrpc": "2.0",
-        "id": call_id,
-        "method": "tools/call",
-        "params": {
-            "name": "get_codex_template",
-            "arguments": {
-                "input_type": {"type": template_type},
-                "input_ver": {"version": ver},
-                "input_artifact_name": {"name": a_name},
-            },
-        },
-    }
-
-    call_id = str(uuid.uuid4())
-    results["instructions_tool"] = {
-        "jsonrpc": "2.0",
-        "id": call_id,
-        "method": "tools/call",
-        "params": {
-            "name": "get_codex_template_instructions",
-            "arguments": {
-                "input_type": {"type": template_type},
-                "input_ver": {"version": ver},
-                "input_artifact_name": {"name": a_name},
-            },
-        },
-    }
-
-    call_id = str(uuid.uuid4())
-    results["registry_tool"] = {
-        "jsonrpc": "2.0",
-        "id": call_id,
-        "method": "tools/call",
-        "params": {
-            "name": "get_codex_template_registry",
-            "arguments": {
-                "input_type": {"type": template_type},
-                "input_ver": {"version": ver},
-            },
-        },
-    }
-
-    call_id = str(uuid.uuid4())
-    results["manifest_tool"] = {
-        "jsonrpc": "2.0",
-        "id": call_id,
-        "method": "tools/call",
-        "params": {
-            "name": "get_codex_template_manifest",
-            "arguments": {
-                "input_type": {"type": template_type},
-                "input_ver": {"version": ver},
-                "input_artifact_name": {"name": a_name},
-            },
-        },
-    }
-
-    return results
+    tools = get_mcp_tool_call_descriptors(template_type, version)
+    return tools.to_rpcs(artifact_name if artifact_name else "")
+
+
+def get_mcp_tool_call_descriptors(
+    template_type: str, version: str
+) -> TemplateRpcDescriptors:
+    """
+    Gets the pre-built tool call descriptors for a template type and version.
+
+    Args:
+        template_type (str): The type of template.
+        version (str): The version of the template. Must be a valid version string.
+
+    Returns:
+        TemplateRpcDescriptors: Descriptors whose ``to_rpc()`` and ``to_json()`` fill in the artifact name.
+
+    Raises:
+        VersionError: If the version string validation fails.
+    """
+    return get_rpc_descriptor_table().get_template_tools(
+        template_type, _normalize_version(version)
+    )
 
 
 def to_plain(obj) -> dict | list | str:
@@ -319,10 +293,7 @@ def get_mcp_executor_mode_tool(version: str | None = None) -> McpTool:
     if not version:
         version = _SETTINGS.template_cbib_api.version
 
-    v_result = validate_version_str(version)
-    if not Result.is_success(v_result):
-        raise v_result.error
-    ver = v_result.data
+    ver = _normalize_version(version)
     input = McpToolArg(name="version", value=ver)
     return McpTool(tool_name="get_canonical_executor_mode", tool_args=[input])
 
@@ -349,28 +320,26 @@ def get_mcp_executor_mode_rpc(version: str | None = None) -> dict:
         'tools/call'
     """
 
-    if not version:
-        version = _SETTINGS.template_cbib_api.version
-
     # http://localhost:8000/api/v1/executor_modes/CANONICAL-EXECUTOR-MODE?version=v1.0
+    return get_mcp_executor_mode_descriptor(version).to_rpc()
 
-    # generate a uuid
-    v_result = validate_version_str(version)
-    if not Result.is_success(v_result):
-        raise v_result.error
-    ver = v_result.data
-    call_id = str(uuid.uuid4())
-    return {
-        "jsonrpc": "2.0",
-        "id": call_id,
-        "method": "tools/call",
-        "params": {
-            "name": "get_canonical_executor_mode",
-            "arguments": {
-                "version": ver,
-            },
-        },
-    }
+
+def get_mcp_executor_mode_descriptor(version: str | None = None) -> RpcDescriptor:
+    """
+    Gets the pre-built canonical executor mode tool call descriptor.
+
+    Args:
+        version (str, optional): Executor mode version. If not provided, the version from settings is used.
+
+    Returns:
+        RpcDescriptor: Descriptor.
+
+    Raises:
+        VersionError: If the version string validation fails.
+    """
+    if not version:
+        version = _SETTINGS.template_cbib_api.version
+    return get_rpc_descriptor_table().get_executor_mode(_normalize_version(version))
 
 
 def get_mcp_verify_template_rpc(artifact_name: str, template_content: str = "") -> dict:
@@ -394,24 +363,11 @@ def get_mcp_verify_template_rpc(artifact_name: str, template_content: str = "")
         'tools/call'
     """
 
-    # generate a uuid
-    call_id = str(uuid.uuid4())
     if not template_content:
         template_content = "< template_content_with_frontmatter >"
-    return {
-        "jsonrpc": "2.0",
-        "id": call_id,
-        "method": "tools/call",
-        "params": {
-            "name": "verify_codex_template_artifact",
-            "arguments": {
-                "submission": {
-                    "artifact_name": artifact_name,
-                    "template_content": template_content,
-                }
-            },
-        },
-    }
+    return get_rpc_descriptor_table().verify_tool.to_rpc(
+        artifact_name=artifact_name, template_content=template_content
+    )
 
 
 def get_mcp_finalize_template_rpc(
@@ -436,21 +392,8 @@ def get_mcp_finalize_template_rpc(
         >>> request['method']
         'tools/call'
     """
-    # generate a uuid
-    call_id = str(uuid.uuid4())
     if not template_content:
         template_content = "< template_content_with_frontmatter >"
-    return {
-        "jsonrpc": "2.0",
-        "id": call_id,
-        "method": "tools/call",
-        "params": {
-            "name": "finalize_codex_template_artifact",
-            "arguments": {
-                "submission": {
-                    "artifact_name": artifact_name,
-                    "template_content": template_content,
-                }
-            },
-        },
-    }
+    return get_rpc_descriptor_table().finalize_tool.to_rpc(
+        artifact_name=artifact_name, template_content=template_content
+    )
@@ -0,0 +1,312 @@
+import json
+import uuid
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Any, Iterable, Mapping
+from loguru import logger
+from src.config.pkg_config import PkgConfig
+
+# placeholders filled per request; control characters cannot clash with real values
+ARTIFACT_NAME_SLOT = "\x00artifact_name\x00"
+TEMPLATE_CONTENT_SLOT = "\x00template_content\x00"
+_CALL_ID_SLOT = "\x00call_id\x00"
+
+
+def _fill(obj: Any, values: Mapping[str, str]) -> Any:
+    if isinstance(obj, dict):
+        return {k: _fill(v, values) for k, v in obj.items()}
+    if isinstance(obj, str):
+        return values.get(obj, obj)
+    return obj
+
+
+@dataclass(frozen=True)
+class RpcDescriptor:
+    """
+    JSON-RPC 2.0 ``tools/call`` request built once with slots for the per request values.
+
+    Attributes:
+        tool_name (str): MCP tool name.
+        arguments (Mapping[str, Any]): Tool arguments, may hold slot placeholders.
+        json_template (str): The request pre-rendered with ``json.dumps(..., indent=2)``.
+    """
+
+    tool_name: str
+    arguments: Mapping[str, Any]
+    json_template: str
+
+    @classmethod
+    def create(cls, tool_name: str, arguments: dict[str, Any]) -> "RpcDescriptor":
+        rpc = {
+            "jsonrpc": "2.0",
+            "id": _CALL_ID_SLOT,
+            "method": "tools/call",
+            "params": {"name": tool_name, "arguments": arguments},
+        }
+        return cls(
+            tool_name=tool_name,
+            arguments=arguments,
+            json_template=json.dumps(rpc, indent=2),
+        )
+
+    def _values(self, artifact_name: str, template_content: str) -> dict[str, str]:
+        return {
+            ARTIFACT_NAME_SLOT: artifact_name,
+            TEMPLATE_CONTENT_SLOT: template_content,
+        }
+
+    def to_rpc(self, artifact_name: str = "", template_content: str = "") -> dict:
+        """
+        Builds a new request with a unique call ID.
+
+        Args:
+            artifact_name (str, optional): Value of the artifact name slot.
+            template_content (str, optional): Value of the template content slot.
+
+        Returns:
+            dict: JSON-RPC 2.0 request owned by the caller.
+        """
+        return {
+            "jsonrpc": "2.0",
+            "id": str(uuid.uuid4()),
+            "method": "tools/call",
+            "params": {
+                "name": self.tool_name,
+                "arguments": _fill(
+                    self.arguments, self._values(artifact_name, template_content)
+                ),
+            },
+        }
+
+    def to_json(self, artifact_name: str = "", template_content: str = "") -> str:
+        """
+        Renders the request as indented JSON with a unique call ID.
+
+        The output is the same as ``json.dumps(self.to_rpc(...), indent=2)``.
+
+        Args:
+            artifact_name (str, optional): Value of the artifact name slot.
+            template_content (str, optional): Value of the template content slot.
+
+        Returns:
+            str: Indented JSON.
+        """
+        text = self.json_template.replace(
+            json.dumps(_CALL_ID_SLOT), json.dumps(str(uuid.uuid4()))
+        )
+        for slot, value in self._values(artifact_name, template_content).items():
+            text = text.replace(json.dumps(slot), json.dumps(value))
+        return text
+
+    def with_json_replaced(self, old: str, new: str) -> "RpcDescriptor":
+        """
+        Gets a copy whose pre-rendered JSON has ``old`` replaced by ``new``, such as to add a comment.
+
+        Args:
+            old (str): Text to replace.
+            new (str): Replacement text.
+
+        Returns:
+            RpcDescriptor: Annotated copy.
+        """
+        return replace(self, json_template=self.json_template.replace(old, new))
+
+
+@dataclass(frozen=True)
+class TemplateRpcDescriptors:
+    """Tool call descriptors for one template type and version."""
+
+    template_tool: RpcDescriptor
+    instructions_tool: RpcDescriptor
+    registry_tool: RpcDescriptor
+    manifest_tool: RpcDescriptor
+
+    def to_rpcs(self, artifact_name: str = "") -> dict[str, dict]:
+        """
+        Builds the tool call requests for an artifact.
+
+        Args:
+            artifact_name (str, optional): Artifact name. Defaults to "".
+
+        Returns:
+            dict[str, dict]: Requests keyed by ``template_tool``, ``instructions_tool``,
+                ``registry_tool`` and ``manifest_tool``.
+        """
+        return {
+            "template_tool": self.template_tool.to_rpc(artifact_name),
+            "instructions_tool": self.instructions_tool.to_rpc(artifact_name),
+            "registry_tool": self.registry_tool.to_rpc(artifact_name),
+            "manifest_tool": self.manifest_tool.to_rpc(artifact_name),
+        }
+
+
+@dataclass(frozen=True)
+class TemplateApiPathSuffixes:
+    """API paths for one template type and version relative to the application root URL."""
+
+    template_api_path: str
+    instructions_api_path: str
+    registry_api_path: str
+    manifest_api_path: str
+
+
+class RpcDescriptorTable:
+    """
+    Tool call descriptors and API path suffixes for every template type and version.
+
+    Entries are built when the table is created. A type and version that was not
+    present at that time is built on first use and kept.
+    """
+
+    def __init__(
+        self,
+        template_versions: Mapping[str, Iterable[str]],
+        templates_dir_name: str,
+    ):
+        """
+        Args:
+            template_versions (Mapping[str, Iterable[str]]): Template type to normalized versions such as ``v2.11``.
+            templates_dir_name (str): Name of the templates directory used in API paths.
+        """
+        self._templates_dir_name = templates_dir_name
+        self._tools: dict[tuple[str, str], TemplateRpcDescriptors] = {}
+        self._api_paths: dict[tuple[str, str], TemplateApiPathSuffixes] = {}
+        self._executor_modes: dict[str, RpcDescriptor] = {}
+        for template_type, versions in template_versions.items():
+            for version in versions:
+                self.get_template_tools(template_type, version)
+                self.get_api_path_suffixes(template_type, version)
+        self.verify_tool = RpcDescriptor.create(
+            "verify_codex_template_artifact",
+            {
+                "submission": {
+                    "artifact_name": ARTIFACT_NAME_SLOT,
+                    "template_content": TEMPLATE_CONTENT_SLOT,
+                }
+            },
+        )
+        self.finalize_tool = RpcDescriptor.create(
+            "finalize_codex_template_artifact",
+            {
+                "submission": {
+                    "artifact_name": ARTIFACT_NAME_SLOT,
+                    "template_content": TEMPLATE_CONTENT_SLOT,
+                }
+            },
+        )
+        logger.debug(
+            "RpcDescriptorTable() built {count} template entries",
+            count=len(self._tools),
+        )
+
+    def get_template_tools(
+        self, template_type: str, version: str
+    ) -> TemplateRpcDescriptors:
+        """
+        Gets the tool call descriptors of a template.
+
+        Args:
+            template_type (str): Template type such as ``glyph``.
+            version (str): Normalized version such as ``v2.11``.
+
+        Returns:
+            TemplateRpcDescriptors: Descriptors.
+        """
+        key = (template_type, version)
+        entry = self._tools.get(key)
+        if entry is None:
+
+            def args(with_artifact_name: bool) -> dict[str, Any]:
+                arguments: dict[str, Any] = {
+                    "input_type": {"type": template_type},
+                    "input_ver": {"version": version},
+                }
+                if with_artifact_name:
+                    arguments["input_artifact_name"] = {"name": ARTIFACT_NAME_SLOT}
+                return arguments
+
+            entry = TemplateRpcDescriptors(
+                template_tool=RpcDescriptor.create("get_codex_template", args(True)),
+                instructions_tool=RpcDescriptor.create(
+                    "get_codex_template_instructions", args(True)
+                ),
+                registry_tool=RpcDescriptor.create(
+                    "get_codex_template_registry", args(False)
+                ),
+                manifest_tool=RpcDescriptor.create(
+                    "get_codex_template_manifest", args(True)
+                ),
+            )
+            self._tools[key] = entry
+        return entry
+
+    def get_api_path_suffixes(
+        self, template_type: str, version: str
+    ) -> TemplateApiPathSuffixes:
+        """
+        Gets the API paths of a template relative to the application root URL.
+
+        Args:
+            template_type (str): Template type such as ``glyph``.
+            version (str): Version query parameter such as ``v2.11``.
+
+        Returns:
+            TemplateApiPathSuffixes: Path suffixes ending with the version query parameter.
+        """
+        key = (template_type, version)
+        entry = self._api_paths.get(key)
+        if entry is None:
+            # http://localhost:8000/api/v1/templates/glyph/template?version=v2.11
+            prefix = f"/{self._templates_dir_name}/{template_type}"
+            query = f"?version={version}"
+            entry = TemplateApiPathSuffixes(
+                template_api_path=f"{prefix}/template{query}",
+                instructions_api_path=f"{prefix}/instructions{query}",
+                registry_api_path=f"{prefix}/registry{query}",
+                manifest_api_path=f"{prefix}/manifest{query}",
+            )
+            self._api_paths[key] = entry
+        return entry
+
+    def get_executor_mode(self, version: str) -> RpcDescriptor:
+        """
+        Gets the canonical executor mode tool call descriptor.
+
+        Args:
+            version (str): Normalized version such as ``v1.0``.
+
+        Returns:
+            RpcDescriptor: Descriptor.
+        """
+        entry = self._executor_modes.get(version)
+        if entry is None:
+            entry = RpcDescriptor.create(
+                "get_canonical_executor_mode", {"version": version}
+            )
+            self._executor_modes[version] = entry
+        return entry
+
+
+@lru_cache()
+def get_rpc_descriptor_table() -> RpcDescriptorTable:
+    """
+    Gets the process-wide descriptor table built from the installed templates.
+
+    Returns:
+        RpcDescriptorTable: Descriptor table.
+    """
+    from .fn_versions import get_available_versions
+
+    config = PkgConfig()
+    try:
+        templates = get_available_versions().templates
+        template_versions = {
+            key: [f"v{v}" for v in entry.versions] for key, entry in templates.items()
+        }
+    except FileNotFoundError as e:
+        logger.error("get_rpc_descriptor_table() {error}", error=e)
+        template_versions = {}
+    return RpcDescriptorTable(
+        template_versions=template_versions,
+        templates_dir_name=config.config_cache.get_api_templates_path().name,
+    )
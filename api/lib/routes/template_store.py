@@ -0,0 +1,260 @@
+import pickle
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from loguru import logger
+from src.config.pkg_config import PkgConfig
+from src.template.front_mater_meta import FrontMatterMeta
+from src.template.template_bundle import (
+    BUNDLE_MEMBERS,
+    TemplateBundle,
+    get_templates_stamp,
+    read_version_member,
+)
+from src.template.templates_generation import (
+    GenerationWatcher,
+    read_templates_generation,
+)
+from .fn_versions import get_available_versions
+
+if TYPE_CHECKING:
+    from jinja2 import Template
+
+
+@dataclass(frozen=True)
+class TemplateFiles:
+    """
+    Parsed markdown files of one template type and version.
+
+    Attributes:
+        template (FrontMatterMeta | None): Parsed ``template.md``. Treat as read-only, it is shared.
+        instructions (FrontMatterMeta | None): Parsed ``instructions.md``. Treat as read-only, it is shared.
+        instructions_template (Template | None): ``instructions.md`` body compiled as a Jinja template.
+    """
+
+    template: FrontMatterMeta | None
+    instructions: FrontMatterMeta | None
+    instructions_template: "Template | None"
+
+
+class TemplateStore:
+    """
+    In-memory store of every template version under ``ConfigCache.get_api_templates_path()``.
+
+    When the bundle written by ``install-api`` exists and was written from the current
+    folders it is memory mapped and each template version is deserialized on first
+    access, so startup is an open, an index read and a stat of the folder files, and
+    workers share the bundle pages. Otherwise every folder is read when the store is
+    created. Getters return copies that callers may change.
+    """
+
+    def __init__(self, base_path: Path, bundle_path: Path | None = None):
+        """
+        Args:
+            base_path (Path): Templates directory holding ``<type>/vX.Y/`` folders.
+            bundle_path (Path, optional): Template bundle. Used when it exists and its
+                source stamp matches ``base_path``.
+        """
+        self._base_path = base_path
+        self._entries: dict[tuple[str, str], TemplateFiles] = {}
+        self._members: dict[tuple[str, str, str], bytes] = {}
+        self._bundle: TemplateBundle | None = None
+        if bundle_path is not None and bundle_path.is_file():
+            try:
+                self._bundle = TemplateBundle(bundle_path)
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(
+                    "TemplateStore() unable to open bundle {path}, reading folders: {error}",
+                    path=bundle_path,
+                    error=e,
+                )
+        if self._bundle is not None and self._bundle.source != get_templates_stamp(
+            base_path
+        ):
+            logger.warning(
+                "TemplateStore() bundle {path} was not written from the current folders, reading folders",
+                path=bundle_path,
+            )
+            self._bundle = None
+        if self._bundle is not None:
+            self._keys = set(self._bundle.keys())
+            logger.debug(
+                "TemplateStore() mapped {count} template versions from {path}",
+                count=len(self._keys),
+                path=bundle_path,
+            )
+            return
+        self._keys = set()
+        if not base_path.is_dir():
+            logger.error(
+                "TemplateStore() templates path does not exist: {path}",
+                path=base_path,
+            )
+            return
+        for type_dir in sorted(base_path.iterdir()):
+            if not type_dir.is_dir():
+                continue
+            for version_dir in sorted(type_dir.iterdir()):
+                if not version_dir.is_dir() or not version_dir.name.startswith("v"):
+                    continue
+                key = (type_dir.name, version_dir.name)
+                for member in BUNDLE_MEMBERS:
+                    value = read_version_member(version_dir, member)
+                    if value is not None:
+                        self._members[(*key, member)] = pickle.dumps(value)
+                self._keys.add(key)
+                self.get(*key)
+        logger.debug(
+            "TemplateStore() loaded {count} template versions", count=len(self._keys)
+        )
+
+    def _read(self, template_type: str, version: str, member: str) -> Any:
+        if self._bundle is not None:
+            return self._bundle.read(template_type, version, member)
+        data = self._members.get((template_type, version, member))
+        return None if data is None else pickle.loads(data)
+
+    def _read_fm(
+        self, template_type: str, version: str, member: str
+    ) -> FrontMatterMeta | None:
+        parts = self._read(template_type, version, member)
+        if parts is None:
+            return None
+        fm_dict, content = parts
+        return FrontMatterMeta.from_frontmatter_dict(
+            file_path=self._base_path / template_type / version / f"{member}.md",
+            fm_dict=fm_dict,
+            content=content,
+        )
+
+    def get(self, template_type: str, version: str) -> TemplateFiles | None:
+        """
+        Gets the shared files of a template, parsing them on first access.
+
+        Args:
+            template_type (str): Template type such as ``glyph``.
+            version (str): Normalized version such as ``v2.11``.
+
+        Returns:
+            TemplateFiles | None: The files if found; Otherwise, None.
+        """
+        key = (template_type, version)
+        entry = self._entries.get(key)
+        if entry is not None or key not in self._keys:
+            return entry
+        from jinja2 import Template
+
+        instructions = self._read_fm(template_type, version, "instructions")
+        entry = TemplateFiles(
+            template=self._read_fm(template_type, version, "template"),
+            instructions=instructions,
+            instructions_template=(
+                Template(source=instructions.content) if instructions else None
+            ),
+        )
+        # concurrent first access builds equal entries, either one may be kept
+        return self._entries.setdefault(key, entry)
+
+    def get_template(self, template_type: str, version: str) -> FrontMatterMeta | None:
+        """
+        Gets a copy of ``template.md`` that the caller may change.
+
+        Args:
+            template_type (str): Template type such as ``glyph``.
+            version (str): Normalized version such as ``v2.11``.
+
+        Returns:
+            FrontMatterMeta | None: The template if found; Otherwise, None.
+        """
+        entry = self.get(template_type, version)
+        if entry is None or entry.template is None:
+            return None
+        return entry.template.copy(deep=True)
+
+    def get_instructions(
+        self, template_type: str, version: str
+    ) -> FrontMatterMeta | None:
+        """
+        Gets a copy of ``instructions.md`` that the caller may change.
+
+        Args:
+            template_type (str): Template type such as ``glyph``.
+            version (str): Normalized version such as ``v2.11``.
+
+        Returns:
+            FrontMatterMeta | None: The instructions if found; Otherwise, None.
+        """
+        entry = self.get(template_type, version)
+        if entry is None or entry.instructions is None:
+            return None
+        return entry.instructions.copy(deep=True)
+
+    def get_manifest(self, template_type: str, version: str) -> dict[str, Any] | None:
+        """
+        Gets a new parsed ``manifest.json``.
+
+        Args:
+            template_type (str): Template type such as ``glyph``.
+            version (str): Normalized version such as ``v2.11``.
+
+        Returns:
+            dict[str, Any] | None: The manifest if found; Otherwise, None.
+        """
+        return self._read(template_type, version, "manifest")
+
+    def get_registry(self, template_type: str, version: str) -> dict[str, Any] | None:
+        """
+        Gets a new parsed ``registry.json``.
+
+        Args:
+            template_type (str): Template type such as ``glyph``.
+            version (str): Normalized version such as ``v2.11``.
+
+        Returns:
+            dict[str, Any] | None: The registry if found; Otherwise, None.
+        """
+        return self._read(template_type, version, "registry")
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+@lru_cache()
+def _get_generation_watcher() -> GenerationWatcher:
+    config = PkgConfig()
+    return GenerationWatcher(
+        path=config.config_cache.get_api_templates_generation_path(),
+        reload_check_seconds=config.api_info.info_templates.reload_check_seconds,
+    )
+
+
+@lru_cache()
+def _load_template_store() -> TemplateStore:
+    config_cache = PkgConfig().config_cache
+    return TemplateStore(
+        base_path=config_cache.get_api_templates_path(),
+        bundle_path=config_cache.get_api_templates_bundle_path(),
+    )
+
+
+def get_template_store() -> TemplateStore:
+    """
+    Gets the process-wide template store.
+
+    The store and the template version index are reloaded when ``install-api``
+    publishes a new generation of templates.
+
+    Returns:
+        TemplateStore: Template store.
+    """
+    watcher = _get_generation_watcher()
+    if watcher.changed():
+        _load_template_store.cache_clear()
+        get_available_versions.cache_clear()
+        generation = read_templates_generation(watcher.path)
+        logger.info(
+            "get_template_store() reloading templates, generation {generation}",
+            generation=generation.generation if generation else None,
+        )
+    return _load_template_store()
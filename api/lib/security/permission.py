@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Permission:
+    """
+    Compiled permission requirement.
+
+    A session is granted the permission when its permission mask contains at least one
+    of the bits in ``scope_mask`` and, when ``role_mask`` is not zero, at least one of
+    the bits in ``role_mask``.
+
+    Attributes:
+        name (str): Name of the permission, used in log messages.
+        scope_mask (int): Bits of the scopes of which at least one is required.
+        role_mask (int): Bits of the roles of which at least one is required. Zero means no role is required.
+    """
+
+    name: str
+    scope_mask: int = 0
+    role_mask: int = 0
+
+    def is_granted(self, mask: int) -> bool:
+        """
+        Checks the permission against a session permission mask.
+
+        Args:
+            mask (int): Permission mask of a session.
+
+        Returns:
+            bool: True if the permission is granted; Otherwise, False.
+        """
+        if not mask & self.scope_mask:
+            return False
+        return not self.role_mask or bool(mask & self.role_mask)
@@ -0,0 +1,65 @@
+from typing import Iterable
+from .permission import Permission
+
+
+class PermissionTable:
+    """
+    Assigns a bit to every known scope and role.
+
+    Scopes and roles are kept in separate name spaces so a role and a scope with the
+    same name get different bits. Names that are not in the table have no bit and are
+    ignored when a session mask is built.
+    """
+
+    def __init__(self):
+        self._scope_bits: dict[str, int] = {}
+        self._role_bits: dict[str, int] = {}
+        self._next_bit = 0
+
+    def _bit(self, bits: dict[str, int], name: str) -> int:
+        bit = bits.get(name)
+        if bit is None:
+            bit = 1 << self._next_bit
+            self._next_bit += 1
+            bits[name] = bit
+        return bit
+
+    def compile(
+        self, name: str, scopes: Iterable[str] = (), roles: Iterable[str] = ()
+    ) -> Permission:
+        """
+        Compiles a permission, adding any new scopes and roles to the table.
+
+        Args:
+            name (str): Name of the permission.
+            scopes (Iterable[str], optional): Scopes of which at least one is required.
+            roles (Iterable[str], optional): Roles of which at least one is required.
+
+        Returns:
+            Permission: Compiled permission.
+        """
+        scope_mask = 0
+        for scope in scopes:
+            scope_mask |= self._bit(self._scope_bits, scope)
+        role_mask = 0
+        for role in roles:
+            role_mask |= self._bit(self._role_bits, role)
+        return Permission(name=name, scope_mask=scope_mask, role_mask=role_mask)
+
+    def get_mask(self, scopes: Iterable[str] = (), roles: Iterable[str] = ()) -> int:
+        """
+        Builds the permission mask of a session.
+
+        Args:
+            scopes (Iterable[str], optional): Scopes granted to the session.
+            roles (Iterable[str], optional): Roles granted to the session.
+
+        Returns:
+            int: Permission mask.
+        """
+        mask = 0
+        for scope in scopes:
+            mask |= self._scope_bits.get(scope, 0)
+        for role in roles:
+            mask |= self._role_bits.get(role, 0)
+        return mask
@@ -0,0 +1,67 @@
+"""
+Permissions compiled once from the scopes configuration in ``API_ENV_DB``.
+
+Usage:
+    if not permissions.TEMPLATES_READ.is_granted(session.permission_mask):
+        raise HTTPException(status_code=403, ...)
+"""
+
+from ..env import env_info
+from .permission_table import PermissionTable
+
+_MCP_TEMPLATE_SCOPES = ("mcp:template:read", "mcp.template:read")
+
+_GENERAL_SCOPE = env_info.get_api_scopes()
+_TEMPLATES_SCOPE = env_info.get_api_scopes("templates")
+
+TABLE = PermissionTable()
+"""Table holding the bit of every scope and role used by the permissions below."""
+
+GENERAL_READ = TABLE.compile("general:read", scopes=_GENERAL_SCOPE.read_scopes)
+"""Any read scope of the ``general`` scope group."""
+
+GENERAL_READ_WRITE = TABLE.compile(
+    "general:read_write", scopes=_GENERAL_SCOPE.get_rw_scopes()
+)
+"""Any read or write scope of the ``general`` scope group."""
+
+TEMPLATES_READ = TABLE.compile("templates:read", scopes=_TEMPLATES_SCOPE.read_scopes)
+"""Any read scope of the ``templates`` scope group."""
+
+TEMPLATES_READ_WRITE = TABLE.compile(
+    "templates:read_write", scopes=_TEMPLATES_SCOPE.get_rw_scopes()
+)
+"""Any read or write scope of the ``templates`` scope group."""
+
+MCP_TEMPLATE_CONTEXT_ACCESS = TABLE.compile(
+    "mcp:template_context_access",
+    scopes=_MCP_TEMPLATE_SCOPES,
+    roles=("mcp:template.user", "mcp:template:user"),
+)
+"""Template role and scope checked by MCP template tools that read the tool context."""
+
+MCP_TEMPLATE_HEADER_ACCESS = TABLE.compile(
+    "mcp:template_header_access",
+    scopes=_MCP_TEMPLATE_SCOPES,
+    roles=("mcp.template.user", "mcp:template:user"),
+)
+"""Template role and scope checked by MCP template and executor mode tools that read the request headers."""
+
+MCP_TOOL_CALL = TABLE.compile(
+    "mcp:tool_call", scopes=("mcp:template:read", "api:context:read")
+)
+"""Scopes accepted for MCP ``tools/call`` requests by ``DescopeAuthMiddleware``."""
+
+
+def get_mask(scopes: set[str], roles: set[str]) -> int:
+    """
+    Builds the permission mask for a set of granted scopes and roles.
+
+    Args:
+        scopes (set[str]): Granted scopes.
+        roles (set[str]): Granted roles.
+
+    Returns:
+        int: Permission mask.
+    """
+    return TABLE.get_mask(scopes, roles)
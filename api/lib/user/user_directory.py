@@ -0,0 +1,189 @@
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping
+from loguru import logger
+from src.config.pkg_config import PkgConfig
+from ...models.auth.user import User
+
+_SQLITE_SUFFIXES = (".sqlite", ".sqlite3", ".db")
+
+
+class UserDirectory:
+    """
+    Index of users by user ID.
+
+    Users are loaded once and kept as interned, immutable ``User`` objects, so users
+    with the same record share a single instance and lookups do not allocate.
+
+    Users come from ``API_ENV_DATA`` unless a users file is given. A users file is
+    either JSON, ``{"users": {"<user_id>": {"monad_name": "..."}}}``, or SQLite with a
+    ``users (user_id TEXT PRIMARY KEY, monad_name TEXT)`` table. The file is checked
+    for changes at most once every ``reload_check_seconds`` and reloaded when its
+    modification time or size changes.
+    """
+
+    def __init__(
+        self,
+        path: Path | str | None = None,
+        reload_check_seconds: float = 5.0,
+        env_users: Mapping[str, Mapping[str, Any]] | None = None,
+    ):
+        """
+        Args:
+            path (Path | str | None, optional): Users file. Defaults to None.
+            reload_check_seconds (float, optional): Minimum seconds between file change checks. Zero disables reloading.
+            env_users (Mapping[str, Mapping[str, Any]] | None, optional): Users used when ``path`` is not set.
+        """
+        self._path = Path(path) if path else None
+        self._reload_check = reload_check_seconds
+        self._lock = threading.Lock()
+        self._interned: dict[tuple[tuple[str, Any], ...], User] = {}
+        self._file_stamp: tuple[int, int] | None = None
+        self._last_check = time.monotonic()
+        if self._path is None:
+            self._users = self._index(env_users or {})
+        else:
+            self._users = self._load_file(self._path)
+
+    # region Loading
+    def _intern(self, user_data: Mapping[str, Any]) -> User:
+        key = (("monad_name", user_data.get("monad_name")),)
+        user = self._interned.get(key)
+        if user is None:
+            user = User(**dict(key))
+            self._interned[key] = user
+        return user
+
+    def _index(self, users: Mapping[str, Mapping[str, Any]]) -> Mapping[str, User]:
+        index = {
+            str(user_id): self._intern(user_data)
+            for user_id, user_data in users.items()
+            if user_data
+        }
+        return MappingProxyType(index)
+
+    def _stamp(self, path: Path) -> tuple[int, int]:
+        stat = path.stat()
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _read_json(self, path: Path) -> Mapping[str, Mapping[str, Any]]:
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data.get("users", {})
+
+    def _read_sqlite(self, path: Path) -> Mapping[str, Mapping[str, Any]]:
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            rows = conn.execute("SELECT user_id, monad_name FROM users").fetchall()
+        finally:
+            conn.close()
+        return {user_id: {"monad_name": monad_name} for user_id, monad_name in rows}
+
+    def _load_file(self, path: Path) -> Mapping[str, User]:
+        stamp = self._stamp(path)
+        if path.suffix.lower() in _SQLITE_SUFFIXES:
+            users = self._read_sqlite(path)
+        else:
+            users = self._read_json(path)
+        # drop interned users no longer referenced by the new index
+        self._interned = {}
+        index = self._index(users)
+        self._file_stamp = stamp
+        logger.debug(
+            "UserDirectory loaded {count} users from {path}",
+            count=len(index),
+            path=path,
+        )
+        return index
+
+    def _reload_if_changed(self) -> None:
+        if self._path is None or self._reload_check <= 0:
+            return
+        now = time.monotonic()
+        if now - self._last_check < self._reload_check:
+            return
+        with self._lock:
+            if now - self._last_check < self._reload_check:
+                return
+            self._last_check = now
+            try:
+                if self._stamp(self._path) == self._file_stamp:
+                    return
+                self._users = self._load_file(self._path)
+            except Exception as e:
+                # keep serving the last good index
+                logger.error(
+                    "UserDirectory failed to reload {path}: {error}",
+                    path=self._path,
+                    error=e,
+                )
+
+    # endregion Loading
+
+    def get(self, user_id: str) -> User | None:
+        """
+        Gets a user by ID.
+
+        Args:
+            user_id (str): User ID.
+
+        Returns:
+            User | None: The shared ``User`` instance if found; Otherwise, None.
+        """
+        self._reload_if_changed()
+        return self._users.get(user_id)
+
+    def get_all(self) -> Mapping[str, User]:
+        """
+        Gets all users.
+
+        Returns:
+            Mapping[str, User]: Read-only mapping of user ID to ``User``.
+        """
+        self._reload_if_changed()
+        return self._users
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def __contains__(self, user_id: object) -> bool:
+        return user_id in self._users
+
+
+_DIRECTORY: UserDirectory | None = None
+_DIRECTORY_LOCK = threading.Lock()
+
+
+def get_user_directory() -> UserDirectory:
+    """
+    Gets the process-wide user directory configured by ``[tool.project.config.api.users]``.
+
+    Returns:
+        UserDirectory: User directory.
+    """
+    global _DIRECTORY
+    if _DIRECTORY is None:
+        with _DIRECTORY_LOCK:
+            if _DIRECTORY is None:
+                config = PkgConfig()
+                users_config = config.api_info.users
+                if users_config.path:
+                    path = Path(users_config.path)
+                    if not path.is_absolute():
+                        path = config.root_path / path
+                    _DIRECTORY = UserDirectory(
+                        path=path,
+                        reload_check_seconds=users_config.reload_check_seconds,
+                    )
+                else:
+                    from ..env import env_info
+
+                    _DIRECTORY = UserDirectory(
+                        env_users=env_info.get_data_value("users", {}),
+                        reload_check_seconds=0,
+                    )
+    return _DIRECTORY
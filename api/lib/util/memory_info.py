@@ -0,0 +1,62 @@
+import os
+import resource
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class MemoryInfo:
+    """
+    Memory of the current process in KiB.
+
+    ``pss``, ``shared`` and ``private`` are only known on Linux and are 0 elsewhere.
+
+    Attributes:
+        rss (int): Resident set size.
+        pss (int): Proportional set size, shared pages divided among the processes sharing them.
+        shared (int): Resident pages shared with other processes, such as copy-on-write pages of a parent.
+        private (int): Resident pages only this process uses.
+    """
+
+    rss: int
+    pss: int = 0
+    shared: int = 0
+    private: int = 0
+
+    def __str__(self) -> str:
+        if not self.pss:
+            return f"rss={self.rss / 1024:.1f}MiB"
+        return (
+            f"rss={self.rss / 1024:.1f}MiB pss={self.pss / 1024:.1f}MiB "
+            f"shared={self.shared / 1024:.1f}MiB private={self.private / 1024:.1f}MiB"
+        )
+
+
+def get_memory_info() -> MemoryInfo:
+    """
+    Gets the memory of the current process.
+
+    Reads ``/proc/self/smaps_rollup`` on Linux; Otherwise, falls back to the peak RSS
+    from ``resource.getrusage()``.
+
+    Returns:
+        MemoryInfo: Memory of the current process.
+    """
+    rollup = Path(f"/proc/{os.getpid()}/smaps_rollup")
+    try:
+        values: dict[str, int] = {}
+        for line in rollup.read_text().splitlines():
+            parts = line.split()
+            if len(parts) >= 2 and parts[0].endswith(":") and parts[1].isdigit():
+                values[parts[0][:-1]] = int(parts[1])
+        return MemoryInfo(
+            rss=values.get("Rss", 0),
+            pss=values.get("Pss", 0),
+            shared=values.get("Shared_Clean", 0) + values.get("Shared_Dirty", 0),
+            private=values.get("Private_Clean", 0) + values.get("Private_Dirty", 0),
+        )
+    except OSError:
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # bytes on macOS, KiB elsewhere
+        return MemoryInfo(rss=max_rss // 1024 if sys.platform == "darwin" else max_rss)
@@ -0,0 +1,65 @@
+import json
+from typing import Any
+from starlette.requests import Request
+
+# request.state attribute holding the parsed JSON body of the current request.
+# ``request.state`` is backed by the ASGI scope so the value is shared by middleware,
+# decorators and route handlers that see the same request.
+PARSED_BODY_STATE_KEY = "parsed_body"
+
+_UNPARSABLE = object()
+
+
+async def get_parsed_body(request: Request) -> Any:
+    """
+    Gets the request body parsed as JSON, parsing it at most once per request.
+
+    Args:
+        request (Request): Current request.
+
+    Returns:
+        Any: Parsed JSON body, or None if the body is empty or is not valid JSON.
+    """
+    cached = getattr(request.state, PARSED_BODY_STATE_KEY, None)
+    if cached is None:
+        body = await request.body()
+        try:
+            cached = json.loads(body) if body else _UNPARSABLE
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            cached = _UNPARSABLE
+        setattr(request.state, PARSED_BODY_STATE_KEY, cached)
+    if cached is _UNPARSABLE:
+        return None
+    return cached
+
+
+def set_parsed_body(request: Request, value: Any) -> None:
+    """
+    Stores an already parsed JSON body for the current request.
+
+    Args:
+        request (Request): Current request.
+        value (Any): Parsed JSON body.
+    """
+    setattr(request.state, PARSED_BODY_STATE_KEY, value)
+
+
+def get_body_session_id(body: Any) -> str | None:
+    """
+    Gets ``session_id`` from a parsed body, either top level or inside ``submission``.
+
+    Args:
+        body (Any): Parsed JSON body.
+
+    Returns:
+        str | None: Session ID if present; Otherwise, None.
+    """
+    if not isinstance(body, dict):
+        return None
+    session_id = body.get("session_id")
+    if session_id:
+        return session_id
+    submission = body.get("submission")
+    if isinstance(submission, dict):
+        return submission.get("session_id") or None
+    return None
@@ -0,0 +1,45 @@
+"""
+Builds the read-only state shared by every request.
+
+Run ``build_read_only_state()`` once in a parent process, then ``freeze_heap()``
+before forking workers, so workers share those pages copy-on-write rather than
+each building its own copy. The lifespan also calls ``build_read_only_state()``,
+which does nothing for state that is already built.
+"""
+
+import gc
+from loguru import logger
+from src.config.pkg_config import PkgConfig
+from .routes import fn_cbib
+from .routes import fn_versions
+from .routes.rpc_descriptors import get_rpc_descriptor_table
+from .routes.template_store import get_template_store
+from .security import permissions  # noqa: F401 - compiled at import
+from .user.user_directory import get_user_directory
+from .util.memory_info import get_memory_info
+
+
+def build_read_only_state() -> None:
+    """
+    Builds the configuration, version index, template store, executor mode store,
+    tool call descriptors, user directory and permission table.
+    """
+    PkgConfig()
+    fn_versions.get_available_versions()
+    get_template_store()
+    fn_cbib.get_cbib_store()
+    get_rpc_descriptor_table()
+    get_user_directory()
+    logger.debug("build_read_only_state() done, {memory}", memory=get_memory_info())
+
+
+def freeze_heap() -> None:
+    """
+    Moves every object alive now to the permanent generation.
+
+    The garbage collector then never touches them, so it does not write to their
+    pages and break copy-on-write sharing with forked workers.
+    """
+    gc.collect()
+    gc.freeze()
+    logger.debug("freeze_heap() {count} objects frozen", count=gc.get_freeze_count())
@@ -1,8 +1,48 @@
+"""
+Async load generator for the MCP endpoint.
+
+Replays a weighted mix of ``initialize``, ``tools/list`` and ``tools/call`` scenarios
+at a target concurrency or request rate and reports throughput and p50/p95/p99 latency
+per scenario.
+
+The target is either a URL, ``MCP_SERVER_URL`` by default, or the application in
+process through ``httpx.ASGITransport`` with ``--in-process``, which needs no network.
+
+Examples:
+    python api/mcp/harness.py --token $TOKEN --concurrency 16 --requests 2000
+    python api/mcp/harness.py --token $TOKEN --in-process --rate 50 --duration 30
+    python api/mcp/harness.py --token $TOKEN --scenarios scenarios.json
+
+A scenarios file is a JSON list of objects with ``name``, ``method``, optional
+``params`` and optional ``weight``.
+
+Every worker sends its requests with its own copy of the session headers, so a worker
+running the ``initialize`` scenario only moves itself to the new session. The scenario
+runs the full handshake, ``initialize`` and the ``notifications/initialized``
+notification, and its latency covers both.
+
+The server meters ``/templates/mcp`` with the rate limiter in
+``[tool.project.config.api.rate_limit]``. With the default quotas a token holding
+``mcp:template:read`` gets a burst of 60 and 240 requests per minute, other tokens 30
+and 120, so a run longer than the burst is throttled and shows errors for the rejected
+requests. Raise the quota of the token's scope or set ``enabled=false`` on the server
+under test before measuring throughput.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
 import sys
-import requests
+import time
 import uuid
-import json
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
+import httpx
 
 
 def _append_root_path():
@@ -19,70 +59,401 @@ def _append_root_path():
 
 _append_root_path()
 
-from api.lib.descope.auth_config import get_settings  # noqa: E402
-
-
-def send_rpc(method, params=None):
-    payload = {
-        "jsonrpc": "2.0",
-        "id": str(uuid.uuid4()),
-        "method": method,
-        "params": params or {},
-    }
-    setting = get_settings()
-    server_url = setting.MCP_SERVER_URL
-    resp = requests.post(server_url, json=payload, timeout=30)
-    resp.raise_for_status()
-    data = resp.json()
-    if "error" in data:
-        raise RuntimeError(f"RPC error: {data['error']}")
-    return data["result"]
-
-
-def initialize():
-    return send_rpc(
-        "initialize",
-        {
-            "protocolVersion": "2024-11-05",  # or whatever version your server supports
+from api.lib.mcp.sse import aiter_sse_json  # noqa: E402
+
+_PROTOCOL_VERSION = "2025-06-18"
+
+
+@dataclass
+class Scenario:
+    name: str
+    method: str
+    params: dict[str, Any] = field(default_factory=dict)
+    weight: float = 1.0
+
+
+DEFAULT_SCENARIOS = [
+    Scenario(
+        name="initialize",
+        method="initialize",
+        params={
+            "protocolVersion": _PROTOCOL_VERSION,
             "capabilities": {},
+            "clientInfo": {"name": "mcp-harness", "version": "1.0"},
         },
+        weight=1,
+    ),
+    Scenario(name="tools/list", method="tools/list", weight=2),
+    Scenario(
+        name="list_codex_template_types",
+        method="tools/call",
+        params={"name": "list_codex_template_types", "arguments": {}},
+        weight=4,
+    ),
+    Scenario(
+        name="list_codex_template_versions",
+        method="tools/call",
+        params={"name": "list_codex_template_versions", "arguments": {}},
+        weight=3,
+    ),
+]
+
+
+class McpHarnessClient:
+    """Async MCP client over a pooled ``httpx.AsyncClient``."""
+
+    def __init__(self, client: httpx.AsyncClient, url: str, token: str = ""):
+        self._client = client
+        self._url = url
+        self._headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json, text/event-stream",
+            "MCP-Protocol-Version": _PROTOCOL_VERSION,
+        }
+        if token:
+            self._headers["Authorization"] = f"Bearer {token}"
+
+    def fork(self) -> "McpHarnessClient":
+        """
+        Gets a client sharing the connection pool with its own copy of the headers.
+
+        The copy keeps the current session; a session id returned to the copy does not
+        change this client.
+
+        Returns:
+            McpHarnessClient: The new client.
+        """
+        client = McpHarnessClient(self._client, url=self._url)
+        client._headers = dict(self._headers)
+        return client
+
+    async def send_rpc(self, method: str, params: dict[str, Any] | None = None) -> Any:
+        msg_id = str(uuid.uuid4())
+        payload = {
+            "jsonrpc": "2.0",
+            "id": msg_id,
+            "method": method,
+            "params": params or {},
+        }
+        async with self._client.stream(
+            "POST", self._url, json=payload, headers=self._headers
+        ) as resp:
+            resp.raise_for_status()
+            session_id = resp.headers.get("mcp-session-id")
+            if session_id:
+                self._headers["Mcp-Session-Id"] = session_id
+            data: Any = None
+            if resp.headers.get("content-type", "").startswith("text/event-stream"):
+                async for message in aiter_sse_json(resp.aiter_lines()):
+                    if isinstance(message, dict) and message.get("id") == msg_id:
+                        data = message
+                        break
+            else:
+                data = json.loads(await resp.aread())
+        if not isinstance(data, dict):
+            raise RuntimeError(f"No response to {method}")
+        if "error" in data:
+            raise RuntimeError(f"RPC error: {data['error']}")
+        return data.get("result")
+
+    async def notify(self, method: str) -> None:
+        payload = {"jsonrpc": "2.0", "method": method}
+        resp = await self._client.post(self._url, json=payload, headers=self._headers)
+        resp.raise_for_status()
+
+    async def initialize(self, params: dict[str, Any] | None = None) -> Any:
+        """
+        Starts a session and completes the handshake.
+
+        The client keeps its previous session if the handshake fails, so later
+        requests never run on a session that was not initialized.
+
+        Args:
+            params (dict[str, Any] | None, optional): ``initialize`` parameters.
+                Defaults to this harness's protocol version and client info.
+
+        Returns:
+            Any: Result of ``initialize``.
+        """
+        previous = dict(self._headers)
+        try:
+            result = await self.send_rpc(
+                "initialize",
+                params
+                or {
+                    "protocolVersion": _PROTOCOL_VERSION,
+                    "capabilities": {},
+                    "clientInfo": {"name": "mcp-harness", "version": "1.0"},
+                },
+            )
+            await self.notify("notifications/initialized")
+        except BaseException:
+            self._headers = previous
+            raise
+        return result
+
+    async def list_tools(self) -> Any:
+        return await self.send_rpc("tools/list")
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> Any:
+        return await self.send_rpc("tools/call", {"name": name, "arguments": arguments})
+
+
+# region Statistics
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """
+    Nearest-rank percentile.
+
+    Args:
+        sorted_values (list[float]): Values sorted ascending.
+        pct (float): Percentile between 0 and 100.
+
+    Returns:
+        float: The percentile, or 0.0 for no values.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+@dataclass
+class ScenarioStats:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+
+def format_report(stats: dict[str, ScenarioStats], elapsed: float) -> str:
+    lines = [
+        f"{'scenario':<36}{'ok':>8}{'err':>6}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+    ]
+    total_ok = 0
+    total_err = 0
+    for name, s in sorted(stats.items()):
+        values = sorted(s.latencies)
+        total_ok += len(values)
+        total_err += s.errors
+        lines.append(
+            f"{name:<36}{len(values):>8}{s.errors:>6}"
+            f"{len(values) / elapsed if elapsed else 0.0:>9.1f}"
+            f"{percentile(values, 50) * 1000:>9.1f}"
+            f"{percentile(values, 95) * 1000:>9.1f}"
+            f"{percentile(values, 99) * 1000:>9.1f}"
+        )
+    lines.append(
+        f"total: {total_ok} ok, {total_err} errors in {elapsed:.2f}s, "
+        f"{total_ok / elapsed if elapsed else 0.0:.1f} req/s"
     )
+    return "\n".join(lines)
 
 
-def list_tools():
-    return send_rpc("tools/list")
+# endregion Statistics
 
 
-def call_tool(name, arguments):
-    return send_rpc(
-        "tools/call",
-        {
-            "name": name,
-            "arguments": arguments,
-        },
+# region Load Generation
+async def _run_one(
+    client: McpHarnessClient, scenario: Scenario, stats: dict[str, ScenarioStats]
+) -> None:
+    s = stats.setdefault(scenario.name, ScenarioStats())
+    start = time.perf_counter()
+    try:
+        if scenario.method == "initialize":
+            # the session returned by initialize is only usable after the notification
+            await client.initialize(scenario.params)
+        else:
+            await client.send_rpc(scenario.method, scenario.params)
+    except Exception:
+        s.errors += 1
+        return
+    s.latencies.append(time.perf_counter() - start)
+
+
+async def run_load(
+    client: McpHarnessClient,
+    scenarios: list[Scenario],
+    concurrency: int = 8,
+    rate: float = 0.0,
+    total_requests: int = 0,
+    duration: float = 0.0,
+    seed: int | None = None,
+) -> tuple[dict[str, ScenarioStats], float]:
+    """
+    Replays the scenario mix.
+
+    With ``rate`` set, requests are started on an open-loop schedule at that many per
+    second, with at most ``concurrency`` in flight. Otherwise ``concurrency`` workers
+    send requests back to back. Each request slot uses its own fork of ``client``, so
+    session headers are never shared between requests in flight.
+
+    Args:
+        client (McpHarnessClient): Initialized client.
+        scenarios (list[Scenario]): Weighted scenario mix.
+        concurrency (int, optional): Maximum requests in flight. Defaults to 8.
+        rate (float, optional): Target requests per second, 0 for closed loop.
+        total_requests (int, optional): Stop after this many requests, 0 for no limit.
+        duration (float, optional): Stop after this many seconds, 0 for no limit.
+        seed (int | None, optional): Seed for the scenario choice.
+
+    Returns:
+        tuple[dict[str, ScenarioStats], float]: Statistics per scenario and elapsed seconds.
+    """
+    if not total_requests and not duration:
+        total_requests = 100
+    rng = random.Random(seed)
+    weights = [s.weight for s in scenarios]
+    stats: dict[str, ScenarioStats] = {}
+    started = time.perf_counter()
+    deadline = started + duration if duration else math.inf
+    issued = 0
+
+    def next_scenario() -> Scenario | None:
+        nonlocal issued
+        if total_requests and issued >= total_requests:
+            return None
+        if time.perf_counter() >= deadline:
+            return None
+        issued += 1
+        return rng.choices(scenarios, weights=weights)[0]
+
+    if rate > 0:
+        # the pool bounds the requests in flight and hands each one its own client
+        pool: asyncio.Queue[McpHarnessClient] = asyncio.Queue()
+        for _ in range(concurrency):
+            pool.put_nowait(client.fork())
+        tasks: set[asyncio.Task] = set()
+
+        async def limited(scenario: Scenario) -> None:
+            worker_client = await pool.get()
+            try:
+                await _run_one(worker_client, scenario, stats)
+            finally:
+                pool.put_nowait(worker_client)
+
+        interval = 1.0 / rate
+        next_start = time.perf_counter()
+        while (scenario := next_scenario()) is not None:
+            task = asyncio.create_task(limited(scenario))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            next_start += interval
+            delay = next_start - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        if tasks:
+            await asyncio.gather(*tasks)
+    else:
+
+        async def worker() -> None:
+            worker_client = client.fork()
+            while (scenario := next_scenario()) is not None:
+                await _run_one(worker_client, scenario, stats)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    return stats, time.perf_counter() - started
+
+
+# endregion Load Generation
+
+
+def load_scenarios(path: Path) -> list[Scenario]:
+    data = json.loads(path.read_text())
+    return [
+        Scenario(
+            name=item.get("name", item["method"]),
+            method=item["method"],
+            params=item.get("params", {}),
+            weight=float(item.get("weight", 1.0)),
+        )
+        for item in data
+    ]
+
+
+async def _main(args: argparse.Namespace) -> int:
+    scenarios = (
+        load_scenarios(Path(args.scenarios)) if args.scenarios else DEFAULT_SCENARIOS
+    )
+    limits = httpx.Limits(
+        max_connections=args.concurrency, max_keepalive_connections=args.concurrency
+    )
+    async with AsyncExitStack() as stack:
+        if args.in_process:
+            from main import app
+
+            # ASGITransport does not run the lifespan, which the MCP session manager needs
+            await stack.enter_async_context(app.router.lifespan_context(app))
+            http_client = httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app),
+                base_url="http://localhost",
+                limits=limits,
+                timeout=args.timeout,
+            )
+            url = "http://localhost/templates/mcp"
+        else:
+            http_client = httpx.AsyncClient(limits=limits, timeout=args.timeout)
+            url = args.url
+            if not url:
+                from api.lib.descope.auth_config import get_settings
+
+                url = get_settings().MCP_SERVER_URL
+        await stack.enter_async_context(http_client)
+        client = McpHarnessClient(http_client, url=url, token=args.token)
+
+        init_result = await client.initialize()
+        print("Initialized:", init_result.get("serverInfo", {}) if init_result else {})
+        stats, elapsed = await run_load(
+            client,
+            scenarios,
+            concurrency=args.concurrency,
+            rate=args.rate,
+            total_requests=args.requests,
+            duration=args.duration,
+            seed=args.seed,
+        )
+    print(format_report(stats, elapsed))
+    return 1 if any(s.errors for s in stats.values()) else 0
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="MCP endpoint load generator.")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument(
+        "--url", default="", help="MCP endpoint URL, defaults to MCP_SERVER_URL."
+    )
+    target.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Call the application in process through ASGITransport, no network needed.",
+    )
+    parser.add_argument(
+        "--token",
+        default=os.getenv("MCP_TOKEN", ""),
+        help="Bearer token, defaults to MCP_TOKEN.",
+    )
+    parser.add_argument(
+        "--scenarios", default="", help="JSON file with the scenario mix."
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=8, help="Maximum requests in flight."
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=0.0,
+        help="Target requests per second, 0 for closed loop.",
+    )
+    parser.add_argument(
+        "--requests", type=int, default=0, help="Total requests to send."
+    )
+    parser.add_argument("--duration", type=float, default=0.0, help="Seconds to run.")
+    parser.add_argument(
+        "--timeout", type=float, default=30.0, help="Per request timeout."
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None, help="Seed for the scenario choice."
     )
+    return parser.parse_args(argv)
 
 
 if __name__ == "__main__":
-    # 1. Initialize session
-    init_result = initialize()
-    print("Initialized:", json.dumps(init_result, indent=2))
-
-    # 2. Discover tools
-    tools_result = list_tools()
-    print("Tools:", json.dumps(tools_result, indent=2))
-
-    # Pick first tool just as a demo
-    tools = tools_result.get("tools", [])
-    if not tools:
-        print("No tools exposed by server.")
-        exit(0)
-
-    first_tool = tools[0]
-    tool_name = first_tool["name"]
-    print(f"\nCalling tool: {tool_name}")
-
-    # 3. Call tool with dummy args (adapt to your schema)
-    # Here we just send an empty object; replace with real arguments.
-    call_result = call_tool(tool_name, {})
-    print("Tool result:", json.dumps(call_result, indent=2))
+    sys.exit(asyncio.run(_main(_parse_args())))
@@ -1,4 +1,3 @@
-import json
 from fastmcp import FastMCP
 from fastmcp.exceptions import ResourceError
 from fastmcp.server.context import Context
@@ -7,19 +6,14 @@ from fastmcp.server.dependencies import get_http_headers
 from fastapi import HTTPException, status
 from loguru import logger
 from api.lib.descope.auth import AUTH
+from api.lib.routes import fn_cbib
+from api.lib.security import permissions
 from api.lib.util.result import Result
 from api.models.descope.descope_session import DescopeSession
 from api.models.executor_modes.v1_0.cbib_response import CbibResponse
-from src.config.pkg_config import PkgConfig
 from api.models.args import ArgTemplateVersion
 
 
-_SETTINGS = PkgConfig()
-
-# _TEMPLATE_DIR = _SETTINGS.api_info.info_templates.dir_name
-_CBIB_PATH = _SETTINGS.config_cache.get_api_cbib_path()
-
-
 async def _header_validate_access() -> DescopeSession:
     headers = get_http_headers()
 
@@ -35,35 +29,16 @@ async def _header_validate_access() -> DescopeSession:
     if not token:
         raise Exception("Access token is required.")
     session = await AUTH.verify_token(token)
-    if not session.validate_roles(
-        ["mcp.template.user", "mcp:template:user"], match_any=True
-    ):
-        logger.error("User does not have the required role to access templates.")
-        raise Exception("User does not have the required role to access templates.")
-    if not session.validate_scopes(
-        ["mcp.template:read", "mcp:template:read"], match_any=True
-    ):
-        logger.error("User does not have the required scope to access templates.")
-        raise Exception("User does not have the required scope to access templates.")
+    if not session.has_permission(permissions.MCP_TEMPLATE_HEADER_ACCESS):
+        logger.error(
+            "User does not have the required role and scope to access templates."
+        )
+        raise Exception(
+            "User does not have the required role and scope to access templates."
+        )
     return session
 
 
-def _validate_version_str(version: str) -> Result[str, None] | Result[None, Exception]:
-    if not version:
-        return Result(None, Exception("Version is required."))
-    v = version.strip().lower()
-    v = v.lstrip("v")
-    if not v:
-        return Result(None, Exception("Version cannot be empty."))
-    if not v.replace(".", "").isdigit():
-        return Result(None, Exception("Invalid version format."))
-    if v.isdigit():
-        v = f"{v}.0"
-    if not v.startswith("v"):
-        v = "v" + v
-    return Result(v, None)
-
-
 async def _get_template_cbib_internal(input: ArgTemplateVersion) -> CbibResponse:
     logger.debug("get_template_cbib called")
     try:
@@ -71,17 +46,29 @@ async def _get_template_cbib_internal(input: ArgTemplateVersion) -> CbibResponse
     except Exception as e:
         raise Exception(f"Authentication failed: {str(e)}")
 
-    v_result = _validate_version_str(input.version)
+    v_result = fn_cbib.validate_version_str(input.version)
     if not Result.is_success(v_result):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(v_result.error)
         )
-    ver = v_result.data
-    path = _CBIB_PATH / ver / "cbib.json"
-    if not path.exists():
+    entry = fn_cbib.get_cbib_store().get(v_result.data)
+    if entry is None:
+        raise ResourceError("CBIB file not found.")
+    return entry.model
+
+
+async def _get_default_template_cbib_internal() -> CbibResponse:
+    logger.debug("get_default_template_cbib called")
+    try:
+        _ = await _header_validate_access()
+    except Exception as e:
+        raise Exception(f"Authentication failed: {str(e)}")
+
+    # default version is resolved once when the store is loaded
+    entry = fn_cbib.get_cbib_store().get_default()
+    if entry is None:
         raise ResourceError("CBIB file not found.")
-    json_content = json.loads(path.read_text())
-    return CbibResponse(**json_content)
+    return entry.model
 
 
 def register_routes(mcp: FastMCP):
@@ -110,17 +97,7 @@ def register_routes(mcp: FastMCP):
     async def default_template_executor_mode_resource(
         ctx: Context = CurrentContext(),
     ) -> CbibResponse:
-        default_version = _SETTINGS.template_cbib_api.version
-        v_result = _validate_version_str(f"v{default_version}")
-        if not Result.is_success(v_result):
-            raise ResourceError(str(v_result.error))
-        ver = v_result.data
-
-        logger.debug("resource://default_cbib: Default CBIB version: {v}", v=ver)
-        # get the default CBIB  from get_template_cbib
-        version_input = ArgTemplateVersion(version=ver)
-        response = await _get_template_cbib_internal(version_input)
-        return response
+        return await _get_default_template_cbib_internal()
 
     # endregion Resources
 
@@ -147,16 +124,6 @@ def register_routes(mcp: FastMCP):
     async def get_default_template_executor_mode_tool(
         ctx: Context = CurrentContext(),
     ) -> CbibResponse:
-        default_version = _SETTINGS.template_cbib_api.version
-        v_result = _validate_version_str(f"v{default_version}")
-        if not Result.is_success(v_result):
-            raise ResourceError(str(v_result.error))
-        ver = v_result.data
-
-        logger.debug("resource://default_cbib: Default CBIB version: {v}", v=ver)
-        # get the default CBIB  from get_template_cbib
-        version_input = ArgTemplateVersion(version=ver)
-        response = await _get_template_cbib_internal(version_input)
-        return response
+        return await _get_default_template_cbib_internal()
 
     # endregion Tools
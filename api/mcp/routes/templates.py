@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any
 from fastapi import HTTPException, status
 from fastmcp import FastMCP
@@ -8,6 +9,7 @@ from mcp.types import PromptMessage, TextContent
 from loguru import logger
 from api.config import Config
 from api.lib.descope.auth import AUTH
+from api.lib.security import permissions
 from api.lib.descope.auth_config import get_settings
 from api.lib.kind import ServerModeKind
 from api.lib.mcp import ctx_util
@@ -18,6 +20,7 @@ from api.models.descope.descope_session import DescopeSession
 from api.models.templates.artifact_submission import ArtifactSubmission
 from api.models.templates.finalize_artifact_response import FinalizeArtifactResponse
 from api.models.templates.manifest_response import ManifestMcpResponse
+from api.models.templates.template_bundle_response import TemplateBundleMcpResponse
 from api.models.templates.template_response import TemplateResponse
 from api.models.templates.template_instruction_response import (
     TemplateInstructionsResponse,
@@ -49,16 +52,13 @@ async def _ctx_validate_template_access(ctx: Context) -> DescopeSession:
     if not token:
         raise Exception("Access token is required.")
     session = await AUTH.verify_token(token)
-    if not session.validate_roles(
-        ["mcp:template.user", "mcp:template:user"], match_any=True
-    ):
-        logger.error("User does not have the required role to access templates.")
-        raise Exception("User does not have the required role to access templates.")
-    if not session.validate_scopes(
-        ["mcp:template:read", "mcp.template:read"], match_any=True
-    ):
-        logger.error("User does not have the required scope to access templates.")
-        raise Exception("User does not have the required scope to access templates.")
+    if not session.has_permission(permissions.MCP_TEMPLATE_CONTEXT_ACCESS):
+        logger.error(
+            "User does not have the required role and scope to access templates."
+        )
+        raise Exception(
+            "User does not have the required role and scope to access templates."
+        )
     return session
 
 
@@ -77,16 +77,13 @@ async def _header_validate_access() -> DescopeSession:
     if not token:
         raise Exception("Access token is required.")
     session = await AUTH.verify_token(token)
-    if not session.validate_roles(
-        ["mcp.template.user", "mcp:template:user"], match_any=True
-    ):
-        logger.error("User does not have the required role to access templates.")
-        raise Exception("User does not have the required role to access templates.")
-    if not session.validate_scopes(
-        ["mcp.template:read", "mcp:template:read"], match_any=True
-    ):
-        logger.error("User does not have the required scope to access templates.")
-        raise Exception("User does not have the required scope to access templates.")
+    if not session.has_permission(permissions.MCP_TEMPLATE_HEADER_ACCESS):
+        logger.error(
+            "User does not have the required role and scope to access templates."
+        )
+        raise Exception(
+            "User does not have the required role and scope to access templates."
+        )
     return session
 
 
@@ -676,6 +673,116 @@ The return version will have a prefix of 'v', e.g., 'v1.0'.""",
         )
         return ManifestMcpResponse.from_manifest_response(result)
 
+    @mcp.tool(
+        name="get_codex_template_bundle",
+        title="Get Codex Template Bundle",
+        description="""Use this tool to retrieve the template, instructions, registry and manifest for a codex template type and version in a single call.
+Prefer this tool over calling get_codex_template, get_codex_template_instructions, get_codex_template_registry and get_codex_template_manifest separately.""",
+        tags=set(["codex-template"]),
+        annotations={
+            "title": "Get Codex Template Bundle",
+            "readOnlyHint": True,
+            "destructiveHint": False,
+            "idempotentHint": True,
+        },
+    )
+    async def get_codex_template_bundle(
+        input_type: ArgTemplateType,
+        input_ver: ArgTemplateVersionOptional,
+        input_artifact_name: ArgArtifactNameOptional,
+        ctx: Context = CurrentContext(),
+    ) -> TemplateBundleMcpResponse:
+        """
+        Retrieves the template, instructions, registry and manifest for one template
+        type and version, resolving the version and the user's monad name only once.
+        The caller needs the access of both get_codex_template and
+        get_codex_template_instructions.
+
+        Args:
+            input_type (ArgTemplateType): type of the template to retrieve.
+            input_ver (ArgTemplateVersionOptional): version of the template to retrieve.
+                If not provided, the latest version for the template type will be used.
+            input_artifact_name (ArgArtifactNameOptional): Optional artifact name to include in the instructions.
+            ctx (Context): The FastMCP context object containing request information. Automatically provided.
+        Returns:
+            TemplateBundleMcpResponse: The template, instructions, registry and manifest.
+        Raises:
+            Exception: on errors such as authentication failure or insufficient permissions.
+        """
+        logger.debug("get_codex_template_bundle called")
+
+        try:
+            session = await _header_validate_access()
+            # the bundle includes the instructions, which get_codex_template_instructions
+            # guards with the context permission
+            _ = await _ctx_validate_template_access(ctx=ctx)
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=f"Authentication failed: {str(e)}",
+            )
+
+        typ = input_type.type.strip().lower()
+        if not typ:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Template type is required.",
+            )
+
+        if not input_ver.version or input_ver.version == "latest":
+            try:
+                ver = _get_latest_template_version(template_type=typ)
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND, detail=str(e)
+                )
+        else:
+            ver = input_ver.version.lower()
+
+        app_root_url = ctx_util.get_request_app_root_url(ctx=ctx, return_default=True)
+        monad_name = get_user_monad_name(session=session)
+        artifact_name = input_artifact_name.name or None
+        cfg = Config()
+
+        template, instructions, registry, manifest = await asyncio.gather(
+            fn_template.get_template(
+                template_type=typ,
+                version=ver,
+                app_root_url=app_root_url,
+                monad_name=monad_name,
+                artifact_name=artifact_name,
+                server_mode_kind=ServerModeKind.MCP,
+            ),
+            fn_template.get_template_instructions(
+                template_type=typ,
+                version=ver,
+                app_root_url=cfg.current_api_prefix,
+                artifact_name=artifact_name,
+                server_mode_kind=ServerModeKind.MCP,
+            ),
+            fn_template.get_template_registry(
+                template_type=typ,
+                version=ver,
+                monad_name=monad_name,
+                server_mode_kind=ServerModeKind.MCP,
+            ),
+            fn_template.get_template_manifest(
+                template_type=typ,
+                version=ver,
+                app_root_url="",
+                artifact_name=artifact_name,
+                server_mode_kind=ServerModeKind.MCP,
+            ),
+        )
+        return TemplateBundleMcpResponse(
+            template_type=typ,
+            template_version=ver,
+            template=template,
+            instructions=instructions,
+            registry=registry,
+            manifest=ManifestMcpResponse.from_manifest_response(manifest),
+        )
+
         # endregion Tools
 
     # region Prompts
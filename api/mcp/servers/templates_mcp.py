@@ -5,6 +5,7 @@ from api.mcp.routes import templates as mcp_templates
 from api.mcp.routes import executor_modes as mcp_executor_modes
 from api.mcp.routes import privacy_terms as mcp_privacy_terms
 from api.lib.descope.auth_config import get_settings
+from api.lib.mcp.tool_cache_middleware import ToolCacheMiddleware
 
 _SETTINGS = get_settings()
 
@@ -22,6 +23,8 @@ def init_mcp(auth: Any = None) -> FastMCP:
             mcp = FastMCP(name="Codex Templates MCP Server", auth=auth)
             logger.debug("Initialized MCP with auth provider")
 
+        # serve repeated read-only, idempotent tool calls from memory
+        mcp.add_middleware(ToolCacheMiddleware())
         mcp_templates.register_routes(mcp)
         mcp_executor_modes.register_routes(mcp)
         mcp_privacy_terms.register_routes(mcp)
@@ -3,7 +3,7 @@ from pydantic import BaseModel, ConfigDict, Field
 
 
 class User(BaseModel):
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", frozen=True)
     monad_name: Annotated[
         Optional[str], Field(title="Monad Name", description="The user's monad name.")
     ] = None
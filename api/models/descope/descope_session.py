@@ -2,6 +2,7 @@ from typing import Annotated, Any, Optional
 from pydantic import BaseModel, Field
 from functools import cached_property
 from loguru import logger
+from api.lib.security.permission import Permission
 
 
 class DescopeSession(BaseModel):
@@ -106,6 +107,17 @@ class DescopeSession(BaseModel):
             return set()
         return set(scopes_str.split(" "))
 
+    @cached_property
+    def permission_mask(self) -> int:
+        """
+        Permission mask of the session, built once from its scopes and roles.
+        Returns:
+            int: The permission mask. See ``api.lib.security.permissions``.
+        """
+        from api.lib.security import permissions
+
+        return permissions.get_mask(self.scopes, self.roles)
+
     @cached_property
     def logical_session_id(self) -> str:
         """
@@ -119,6 +131,15 @@ class DescopeSession(BaseModel):
         """
         return f"{self.user_id}:{self.iat}"
 
+    def has_permission(self, permission: Permission) -> bool:
+        """
+        Checks a compiled permission against the session permission mask.
+        Args:
+            permission (Permission): Permission such as ``permissions.TEMPLATES_READ``.
+        Return value (bool): returns true if the permission is granted; Otherwise, false.
+        """
+        return permission.is_granted(self.permission_mask)
+
     def validate_tenant_roles(
         self, tenant: str, roles: list[str] | str, match_any: bool = False
     ) -> bool:
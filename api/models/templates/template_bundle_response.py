@@ -0,0 +1,38 @@
+from typing import Annotated, Any
+from pydantic import BaseModel, Field
+from .manifest_response import ManifestMcpResponse
+from .template_instruction_response import TemplateInstructionsResponse
+from .template_response import TemplateResponse
+
+
+class TemplateBundleMcpResponse(BaseModel):
+    template_type: Annotated[
+        str,
+        Field(
+            title="Template Type",
+            description="Type of the template, e.g., 'glyph', 'sigil', etc.",
+        ),
+    ]
+    template_version: Annotated[
+        str,
+        Field(
+            title="Template Version",
+            description="Resolved version of the template, e.g., 'v1.0'.",
+        ),
+    ]
+    template: Annotated[
+        TemplateResponse,
+        Field(title="Template", description="The codex template."),
+    ]
+    instructions: Annotated[
+        TemplateInstructionsResponse,
+        Field(title="Instructions", description="Instructions for the template."),
+    ]
+    registry: Annotated[
+        dict[str, Any],
+        Field(title="Registry", description="Registry of the template frontmatter."),
+    ]
+    manifest: Annotated[
+        ManifestMcpResponse,
+        Field(title="Manifest", description="Manifest of the template."),
+    ]
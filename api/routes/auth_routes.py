@@ -1,15 +1,14 @@
 import httpx
 import secrets
-from descope.descope_client import DescopeClient
 from fastapi import APIRouter
 from fastapi import Depends, HTTPException, Request
 from fastapi.responses import RedirectResponse
 from api.lib.descope.auth_config import get_settings
+from api.lib.descope.client import get_descope_client
 from api.models.descope.descope_session import DescopeSession
 from api.lib.descope.session import get_descope_session, get_user_session
 
 _AUTH_SETTINGS = get_settings()
-_DESCOPE_CLIENT = DescopeClient(project_id=_AUTH_SETTINGS.DESCOPE_PROJECT_ID)
 
 router = APIRouter(tags=["Authorization", "Authentication"])
 
@@ -77,7 +76,7 @@ def logout(request: Request):
     if refresh_token:
         try:
             # Tell Descope this refresh token is now garbage
-            _DESCOPE_CLIENT.logout(refresh_token)
+            get_descope_client().logout(refresh_token)
         except Exception as e:
             # If it fails (e.g., token already expired), we don't care.
             # We still want to clear the cookies on our side.
@@ -1,14 +1,11 @@
-import httpx
-import json
 from loguru import logger
 from fastapi import APIRouter, Request
 from fastapi.responses import JSONResponse
 import markdown_it
 
-# from starlette.responses import Response
-from api.lib.descope.auth_config import get_settings
-
-_AUTH_SETTINGS = get_settings()
+from starlette.responses import Response
+from api.lib.mcp.mcp_asgi_client import McpAsgiClient, McpPostResult
+from api.lib.util.request_body import get_parsed_body
 
 router = APIRouter(tags=["Authorization", "Authentication"])
 
@@ -16,7 +13,7 @@ router = APIRouter(tags=["Authorization", "Authentication"])
 # ============================================================================
 
 
-async def _get_mcp_proxy_content(request: Request):
+async def _get_mcp_proxy_content(request: Request) -> McpPostResult:
     """
     Standard JSON wrapper for MCP tool calls to help Bruno.
 
@@ -25,44 +22,45 @@ async def _get_mcp_proxy_content(request: Request):
 
     This is just a way to show Response Data as JSON in Bruno instead of SSE format.
     """
-    # 1. Capture the incoming JSON-RPC call and headers
-    payload = await request.json()
+    # 1. Capture the incoming JSON-RPC call and headers; headers the caller did not
+    # send are not forwarded, an empty session id or authorization is invalid
+    payload = await get_parsed_body(request)
+    client_host = request.client.host if request.client else ""
     headers = {
         "Content-Type": "application/json",
         "Accept": request.headers.get("Accept", ""),
         "Mcp-Session-Id": request.headers.get("Mcp-Session-Id", ""),
         "Authorization": request.headers.get("Authorization", ""),
+        # the rate limiter keys anonymous requests by the forwarded client address
+        "X-Forwarded-For": request.headers.get("X-Forwarded-For", client_host),
     }
+    headers = {name: value for name, value in headers.items() if value}
 
-    # 2. Call the internal MCP messages endpoint
-    # Note: We use the full internal URL for your mounted MCP app
-    mcp_url = f"{_AUTH_SETTINGS.BASE_URL}/templates/mcp"
-
-    async with httpx.AsyncClient() as client:
-        try:
-            # We append the sessionId to the URL if it exists
-            session_id = headers.get("Mcp-Session-Id")
-            url = f"{mcp_url}?sessionId={session_id}" if session_id else mcp_url
+    # 2. Call the MCP endpoint through the whole app, so the auth middleware and the
+    # rate limiter apply, with the client opened in the lifespan
+    mcp_client: McpAsgiClient = request.app.state.mcp_proxy_client
+    base_url = f"{request.url.scheme}://{request.url.netloc}"
+    try:
+        # 3. SSE 'data:' frames are unwrapped as they are read
+        return await mcp_client.post(payload, headers=headers, base_url=base_url)
+    except Exception as e:
+        logger.error(f"Proxy error: {str(e)}")
+        raise e
 
-            resp = await client.post(url, json=payload, headers=headers, timeout=30.0)
-            raw_text = resp.text
 
-            # 3. Unwrap the SSE 'data:' format
-            if "data: " in raw_text:
-                # Split by 'data: ' and take the first valid JSON block
-                lines = raw_text.split("\n")
-                for line in lines:
-                    if line.startswith("data: "):
-                        json_str = line.replace("data: ", "").strip()
-                        # response.headers["mcp-session-id"] = session_id or ""
-                        return json.loads(json_str)
+def _get_session_headers(request: Request, result: McpPostResult) -> dict[str, str]:
+    session_id = result.session_id or request.headers.get("Mcp-Session-Id", "")
+    return {"mcp-session-id": session_id} if session_id else {}
 
-            # Fallback if the response wasn't SSE
-            return resp.json()
 
-        except Exception as e:
-            logger.error(f"Proxy error: {str(e)}")
-            raise e
+def _get_raw_response(request: Request, result: McpPostResult) -> Response:
+    # not a JSON-RPC response, such as a 401 or 429 from a middleware or a 202 for a notification
+    return Response(
+        content=result.body,
+        status_code=result.status_code,
+        media_type=result.content_type or None,
+        headers=_get_session_headers(request, result),
+    )
 
 
 @router.post("/bruno/tools/call")
@@ -78,17 +76,20 @@ async def bruno_mcp_proxy(request: Request):
     # 1. Capture the incoming JSON-RPC call and headers
     session_id = request.headers.get("Mcp-Session-Id", "")
     try:
-        json_content = await _get_mcp_proxy_content(request)
+        result = await _get_mcp_proxy_content(request)
+        if result.data is None:
+            return _get_raw_response(request, result)
         return JSONResponse(
-            content=json_content,
-            headers={"mcp-session-id": session_id},
+            content=result.data,
+            status_code=result.status_code,
+            headers=_get_session_headers(request, result),
         )
     except Exception as e:
         logger.error(f"Proxy error: {str(e)}")
         return JSONResponse(
             status_code=500,
             content={"error": "Proxy failed to reach MCP", "details": str(e)},
-            headers={"mcp-session-id": session_id},
+            headers={"mcp-session-id": session_id} if session_id else None,
         )
 
 
@@ -113,19 +114,21 @@ async def bruno_mcp_proxy_markdown(request: Request):
     Side Effects:
         - Logs errors to the logger if the MCP proxy request fails
     """
-    
+
     session_id = request.headers.get("Mcp-Session-Id", "")
     try:
-        json_content = await _get_mcp_proxy_content(request)
+        result = await _get_mcp_proxy_content(request)
+        if not isinstance(result.data, dict):
+            return _get_raw_response(request, result)
         markdown_content = (
-            json_content.get("result", {})
+            result.data.get("result", {})
             .get("structuredContent", {})
             .get("content", "")
         )
         return JSONResponse(
             content=markdown_content,
             media_type="text/markdown",
-            headers={"mcp-session-id": session_id},
+            headers=_get_session_headers(request, result),
         )
 
     except Exception as e:
@@ -133,5 +136,5 @@ async def bruno_mcp_proxy_markdown(request: Request):
         return JSONResponse(
             status_code=500,
             content={"error": "Proxy failed to reach MCP", "details": str(e)},
-            headers={"mcp-session-id": session_id},
+            headers={"mcp-session-id": session_id} if session_id else None,
         )
@@ -1,35 +1,39 @@
-import json
-from pathlib import Path
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from loguru import logger
-from ..lib.env import env_info
+from ..lib.security import permissions
 from ..lib.util.result import Result
 from ..lib.descope.session import get_descope_session
+from ..lib.routes import fn_cbib
 
 # from ..routes.limiter import limiter
 from ..models.executor_modes.v1_0.cbib_response import CbibResponse
 from ..models.descope.descope_session import DescopeSession
-from src.config.pkg_config import PkgConfig
-
-_SETTINGS = PkgConfig()
-_TEMPLATE_DIR = _SETTINGS.api_info.info_templates.dir_name
-_SCOPE = env_info.get_api_scopes()
 
 router = APIRouter(prefix="/api/v1/executor_modes", tags=["Executor Modes"])
 
 
-def _validate_version_str(version: str) -> Result[str, None] | Result[None, Exception]:
-    v = version.strip().lower()
-    v = v.lstrip("v")
-    if not v:
-        return Result(None, Exception("Version cannot be empty."))
-    if not v.replace(".", "").isdigit():
-        return Result(None, Exception("Invalid version format."))
-    if v.isdigit():
-        v = f"{v}.0"
-    if not v.startswith("v"):
-        v = "v" + v
-    return Result(v, None)
+def _get_cbib_response(request: Request, version: str | None) -> Response:
+    """
+    Serves a pre-serialized executor mode from the CBIB store.
+    Answers ``304 Not Modified`` when ``If-None-Match`` matches the ETag.
+    """
+    store = fn_cbib.get_cbib_store()
+    if version:
+        v_result = fn_cbib.validate_version_str(version)
+        if not Result.is_success(v_result):
+            raise HTTPException(status_code=400, detail=str(v_result.error))
+        entry = store.get(v_result.data)
+    else:
+        entry = store.get_default()
+    if entry is None:
+        raise HTTPException(status_code=404, detail="CBIB file not found.")
+    headers = {"ETag": entry.etag}
+    if request.headers.get("if-none-match") == entry.etag:
+        logger.debug("Executor mode {v} not modified.", v=entry.version)
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(
+        content=entry.json_bytes, media_type="application/json", headers=headers
+    )
 
 
 @router.get(
@@ -46,7 +50,7 @@ async def get_template_cbib(
     session: DescopeSession = Depends(get_descope_session),
 ):
     if session:
-        if not session.scopes.intersection(_SCOPE.read_scopes):
+        if not session.has_permission(permissions.GENERAL_READ):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Insufficient scope to access executor modes.",
@@ -57,18 +61,7 @@ async def get_template_cbib(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authentication required to access executor modes.",
         )
-    if not version:
-        version = _SETTINGS.template_cbib_api.version
-
-    v_result = _validate_version_str(version)
-    if not Result.is_success(v_result):
-        raise HTTPException(status_code=400, detail=str(v_result.error))
-    ver = v_result.data
-    path = Path(f"api/{_TEMPLATE_DIR}/executor_modes/{ver}/cbib.json")
-    if not path.exists():
-        raise HTTPException(status_code=404, detail="CBIB file not found.")
-    json_content = json.loads(path.read_text())
-    return CbibResponse(**json_content)
+    return _get_cbib_response(request, version)
 
 
 @router.get(
@@ -85,7 +78,7 @@ async def executor_modes(
     session: DescopeSession = Depends(get_descope_session),
 ):
     if session:
-        if not session.scopes.intersection(_SCOPE.read_scopes):
+        if not session.has_permission(permissions.GENERAL_READ):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Insufficient scope to access executor modes.",
@@ -96,15 +89,4 @@ async def executor_modes(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authentication required to access executor modes.",
         )
-    # check if version is only a number
-    if not version:
-        version = _SETTINGS.template_cbib_api.version
-    v_result = _validate_version_str(version)
-    if not Result.is_success(v_result):
-        raise HTTPException(status_code=400, detail=str(v_result.error))
-    ver = v_result.data
-    path = Path(f"api/{_TEMPLATE_DIR}/executor_modes/{ver}/cbib.json")
-    if not path.exists():
-        raise HTTPException(status_code=404, detail="CBIB file not found.")
-    json_content = json.loads(path.read_text())
-    return CbibResponse(**json_content)
+    return _get_cbib_response(request, version)
@@ -19,12 +19,13 @@ from ..responses.markdown_response import MarkdownResponse
 from ..lib.routes import fn_template
 from ..lib.user.user_info import get_user_monad_name
 from ..lib.descope.session import get_descope_session
-from ..lib.env import env_info
+from ..lib.security import permissions
 from ..lib.routes import fn_versions
+from ..lib.routes.cached_body_route import CachedBodyRoute
 
-_TEMPLATE_SCOPE = env_info.get_api_scopes("templates")
-
-router = APIRouter(prefix="/api/v1/templates", tags=["Templates"])
+router = APIRouter(
+    prefix="/api/v1/templates", tags=["Templates"], route_class=CachedBodyRoute
+)
 _API_RELATIVE_URL = "/api/v1"
 
 
@@ -94,11 +95,11 @@ async def get_template(
     # raise an error if the session.scopes do not match at least 1 of the template scopes
     logger.debug(f"Getting template: {template_type}, {version}")
     if session:
-        if not session.scopes.intersection(_TEMPLATE_SCOPE.read_scopes):
+        if not session.has_permission(permissions.TEMPLATES_READ):
             # print("Session Scopes:")
             # print(session.scopes)
             # print("Template Read Scopes:")
-            # print(_TEMPLATE_SCOPE.read_scopes)
+            # print(permissions.TEMPLATES_READ)
             logger.error("Insufficient scope to access template.")
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -193,7 +194,7 @@ async def get_template_instructions(
 
     # raise an error if the session.scopes do not match at least 1 of the template scopes
     if session:
-        if not session.scopes.intersection(_TEMPLATE_SCOPE.read_scopes):
+        if not session.has_permission(permissions.TEMPLATES_READ):
             logger.error("Insufficient scope to access template instructions.")
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -275,7 +276,7 @@ async def get_template_manifest(
             - 500 Internal Server Error if the retrieved manifest fails Pydantic validation.
     """
     if session:
-        if not session.scopes.intersection(_TEMPLATE_SCOPE.read_scopes):
+        if not session.has_permission(permissions.TEMPLATES_READ):
             logger.error("Insufficient scope to access template manifest.")
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -362,7 +363,7 @@ async def get_template_registry(
             - 500 Internal Server Error: If an error occurs during registry pre-processing.
     """
     if session:
-        if not session.scopes.intersection(_TEMPLATE_SCOPE.read_scopes):
+        if not session.has_permission(permissions.TEMPLATES_READ):
             logger.error("Insufficient scope to access template registry.")
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -436,7 +437,7 @@ async def get_template_status(
             - 400 BAD_REQUEST: If the provided version string is invalid.
     """
     if session:
-        if not session.scopes.intersection(_TEMPLATE_SCOPE.read_scopes):
+        if not session.has_permission(permissions.TEMPLATES_READ):
             logger.error("Insufficient scope to access template status.")
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -485,7 +486,7 @@ async def get_versions_available(
         TemplatesVersions: A response object containing the available template types and their versions.
     """
     if session:
-        if not session.scopes.intersection(_TEMPLATE_SCOPE.read_scopes):
+        if not session.has_permission(permissions.TEMPLATES_READ):
             logger.error("Insufficient scope to access template status.")
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -520,7 +521,7 @@ async def get_types_available(
         list: A list of available template types.
     """
     if session:
-        if not session.scopes.intersection(_TEMPLATE_SCOPE.read_scopes):
+        if not session.has_permission(permissions.TEMPLATES_READ):
             logger.error("Insufficient scope to access template status.")
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -579,7 +580,7 @@ async def verify_artifact(
               response model validation fails.
     """
     if session:
-        if not session.scopes.intersection(_TEMPLATE_SCOPE.read_scopes):
+        if not session.has_permission(permissions.TEMPLATES_READ):
             logger.error("Insufficient scope to verify artifact.")
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -645,7 +646,7 @@ async def finalize_artifact(
             response object.
     """
     if session:
-        if not session.scopes.intersection(_TEMPLATE_SCOPE.get_rw_scopes()):
+        if not session.has_permission(permissions.TEMPLATES_READ_WRITE):
             logger.error("Insufficient scope to finalize artifact.")
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -706,7 +707,7 @@ async def upgrade_to_template(
         HTTPException (500): If there is an error applying the upgrade or constructing the final response object.
     """
     if session:
-        if not session.scopes.intersection(_TEMPLATE_SCOPE.get_rw_scopes()):
+        if not session.has_permission(permissions.TEMPLATES_READ_WRITE):
             logger.error("Insufficient scope to upgrade artifact.")
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -0,0 +1,420 @@
+"""
+Build pipeline scaling benchmark.
+
+Fabricates a project with a multiple of the shipped template types in a temporary
+root and runs ``single``, ``pkg-zip`` and ``install-api`` end to end, recording the
+time, peak memory and output size of each command per scale. Each synthetic type is
+a copy of a shipped type under a new name, with its own source markdown in the
+``template_dirs`` layout, ``Metadata/templates`` YAML, registry and field being map
+entries and ``tool.project.templates`` section in ``pyproject.toml``.
+
+Examples:
+    python bench/build_scale.py
+    python bench/build_scale.py --scales 1 10 --jobs 0 --output bench-scale.json
+    python bench/build_scale.py --scales 100 --commands pkg-zip --keep
+    python bench/build_scale.py --scales 1 10 --trace-memory
+
+Time is the wall time of the command, interpreter start included, of a run without
+memory tracing. Memory is the peak resident set size of the command and its worker
+processes, and the stage times are those of the ``--profile`` report of the command.
+With ``--trace-memory`` every scale is run a second time, in a separate project, with
+``--profile-memory``, and the peak memory allocated by Python objects of that run is
+reported too; tracing slows a build several times, so it is never timed. Output size
+is the size of the files the command created or changed.
+
+The single build processes its templates with one engine per shipped template type,
+so synthetic types scale the shared stages: template processing, registry and
+companion files of the zip package, and template loading of ``install-api``.
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tomllib
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+import yaml
+
+_ROOT = Path(__file__).resolve().parent.parent
+_BUILD = 1
+_COMMANDS = {
+    "single": ["single", "-b", str(_BUILD)],
+    "pkg-zip": ["pkg-zip", "-b", str(_BUILD)],
+    "install-api": ["install-api", "-b", str(_BUILD)],
+}
+
+
+@dataclass
+class CommandResult:
+    command: str
+    seconds: float
+    peak_rss_bytes: int | None
+    output_bytes: int
+    output_files: int
+    stages: list[dict[str, Any]] = field(default_factory=list)
+    traced_peak_bytes: int | None = None
+
+
+@dataclass
+class ScaleResult:
+    scale: int
+    template_count: int
+    commands: list[CommandResult] = field(default_factory=list)
+
+
+def _read_frontmatter(path: Path) -> dict[str, Any] | None:
+    text = path.read_text(encoding="utf-8")
+    if not text.startswith("---"):
+        return None
+    end = text.find("\n---", 3)
+    if end < 0:
+        return None
+    data = yaml.safe_load(text[3:end])
+    return data if isinstance(data, dict) else None
+
+
+def _replace_frontmatter_field(text: str, key: str, value: str) -> str:
+    end = text.find("\n---", 3)
+    frontmatter = re.sub(
+        rf"^{key}:.*$",
+        lambda _: f"{key}: {value}",
+        text[:end],
+        count=1,
+        flags=re.MULTILINE,
+    )
+    return frontmatter + text[end:]
+
+
+def _get_table(pyproject: str, name: str) -> str:
+    match = re.search(
+        rf"^\[{re.escape(name)}\]\n.*?(?=^\[|\Z)", pyproject, re.MULTILINE | re.DOTALL
+    )
+    if match is None:
+        raise ValueError(f"Table [{name}] not found in pyproject.toml")
+    return match.group(0).rstrip() + "\n"
+
+
+def _set_toml_value(table: str, key: str, value: str) -> str:
+    return re.sub(
+        rf"^{key}\s*=.*$",
+        lambda _: f"{key}={json.dumps(value, ensure_ascii=False)}",
+        table,
+        count=1,
+        flags=re.MULTILINE,
+    )
+
+
+def generate(root: Path, scale: int, source: Path = _ROOT) -> list[str]:
+    """
+    Writes a project with ``scale`` times the template types of ``source`` to ``root``.
+
+    Args:
+        root (Path): Empty directory the project is written to.
+        scale (int): Template types per shipped template type; 1 copies the project as is.
+        source (Path, optional): Project to copy. Defaults to this repository.
+
+    Raises:
+        ValueError: If a shipped template type has no source template or metadata file.
+
+    Returns:
+        list[str]: Template types of the written project.
+    """
+    pyproject = (source / "pyproject.toml").read_text(encoding="utf-8")
+    config = tomllib.loads(pyproject)["tool"]["project"]
+    settings = config["config"]
+    api_templates = (
+        Path(settings["api"]["base_dir"]) / (settings["api"]["templates"]["dir_name"])
+    )
+    ignore = shutil.ignore_patterns("__pycache__", "*.pyc")
+    shutil.copytree(source / "src", root / "src", ignore=ignore)
+    shutil.copy2(source / "mkpkg.py", root / "mkpkg.py")
+    for name in ("Assets", "Metadata", *settings["template_dirs"]):
+        shutil.copytree(source / name, root / name, ignore=ignore)
+    shutil.copytree(source / api_templates, root / api_templates, ignore=ignore)
+
+    template_types = list(config["templates"])
+    if scale <= 1:
+        (root / "pyproject.toml").write_text(pyproject, encoding="utf-8")
+        return template_types
+
+    template_files: dict[str, Path] = {}
+    for dir_name in settings["template_dirs"]:
+        for path in sorted((root / dir_name).glob("*.md")):
+            fm = _read_frontmatter(path)
+            if fm and fm.get("template_type") in config["templates"]:
+                template_files[fm["template_type"]] = path
+    meta_files: dict[str, Path] = {}
+    for path in sorted((root / settings["template_meta_dir"]).rglob("*.yml")):
+        meta = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        meta_type = meta.get("template_meta", {}).get("template_type")
+        if meta_type in config["templates"]:
+            meta_files[meta_type] = path
+    missing = set(template_types) - (template_files.keys() & meta_files.keys())
+    if missing:
+        raise ValueError(
+            f"No template or metadata file for: {', '.join(sorted(missing))}"
+        )
+
+    clones: dict[str, list[str]] = {
+        template_type: [f"{template_type}_x{i:03d}" for i in range(2, scale + 1)]
+        for template_type in template_types
+    }
+    tables: list[str] = []
+    for template_type, names in clones.items():
+        info = config["templates"][template_type]
+        template_text = template_files[template_type].read_text(encoding="utf-8")
+        meta_text = meta_files[template_type].read_text(encoding="utf-8")
+        table = _get_table(pyproject, f"tool.project.templates.{template_type}")
+        for name in names:
+            suffix = name.rsplit("_", 1)[1].upper()
+            template_path = template_files[template_type]
+            text = _replace_frontmatter_field(template_text, "template_type", name)
+            text = _replace_frontmatter_field(
+                text, "template_id", f"{info['id']}-{suffix}"
+            )
+            template_path.with_name(
+                f"{template_path.stem}-{suffix.lower()}{template_path.suffix}"
+            ).write_text(text, encoding="utf-8")
+
+            meta_path = meta_files[template_type]
+            meta_path.with_name(f"{meta_path.stem}-{suffix.lower()}.yml").write_text(
+                re.sub(
+                    r"^(\s*template_type:).*$",
+                    lambda m: f"{m.group(1)} {name}",
+                    meta_text,
+                    count=1,
+                    flags=re.MULTILINE,
+                ),
+                encoding="utf-8",
+            )
+
+            clone = table.replace(
+                f"[tool.project.templates.{template_type}]",
+                f"[tool.project.templates.{name}]",
+            )
+            clone = _set_toml_value(clone, "id", f"{info['id']}-{suffix}")
+            clone = _set_toml_value(clone, "name", f"{info['name']} {suffix}")
+            clone = _set_toml_value(clone, "template_type", name)
+            tables.append(clone)
+    (root / "pyproject.toml").write_text(
+        pyproject.rstrip() + "\n\n" + "\n".join(tables), encoding="utf-8"
+    )
+
+    # registry lists of template types, such as the template_types of each field
+    registry_path = root / settings["reg_file"]
+    lines: list[str] = []
+    for line in registry_path.read_text(encoding="utf-8").splitlines():
+        lines.append(line)
+        match = re.match(r"^(\s*-\s+)([A-Za-z_]+)\s*(#.*)?$", line)
+        if match and match.group(2) in clones:
+            lines.extend(f"{match.group(1)}{n}" for n in clones[match.group(2)])
+    registry_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    being_map_path = root / settings["template_field_being_map_src"]
+    being_map = yaml.safe_load(being_map_path.read_text(encoding="utf-8"))
+    for template_type, names in clones.items():
+        entry = being_map["template_type"].get(template_type)
+        if entry is not None:
+            for name in names:
+                being_map["template_type"][name] = entry
+    with being_map_path.open("w", encoding="utf-8") as f:
+        f.write("---\n")
+        yaml.safe_dump(being_map, f, sort_keys=False, allow_unicode=True)
+
+    return template_types + [n for names in clones.values() for n in names]
+
+
+def _snapshot(root: Path) -> dict[Path, tuple[int, int]]:
+    files: dict[Path, tuple[int, int]] = {}
+    for path in root.rglob("*"):
+        if path.is_file() and "__pycache__" not in path.parts:
+            st = path.stat()
+            files[path] = (st.st_size, st.st_mtime_ns)
+    return files
+
+
+def _get_peak_rss(report: dict[str, Any]) -> int | None:
+    peaks = [
+        report.get(key)
+        for key in ("max_rss_bytes", "children_max_rss_bytes")
+        if report.get(key) is not None
+    ]
+    return max(peaks) if peaks else None
+
+
+def run_command(
+    root: Path,
+    command: str,
+    jobs: int,
+    timeout: float | None = None,
+    trace_memory: bool = False,
+) -> CommandResult:
+    """
+    Runs a ``mkpkg`` command in a generated project with ``--profile``.
+
+    Args:
+        root (Path): Generated project.
+        command (str): ``single``, ``pkg-zip`` or ``install-api``.
+        jobs (int): ``--jobs`` of the build commands, 0 for one per CPU.
+        timeout (float, optional): Seconds before the command is stopped.
+        trace_memory (bool, optional): Also pass ``--profile-memory`` and report the
+            traced peak in ``traced_peak_bytes``. The time of a traced run is not
+            comparable to an untraced run. Defaults to False.
+
+    Raises:
+        RuntimeError: If the command fails.
+
+    Returns:
+        CommandResult: Measurements of the command.
+    """
+    report_path = root / "bench-profile" / f"{command}.json"
+    args = [sys.executable, "mkpkg.py", *_COMMANDS[command]]
+    if command != "install-api":
+        args += ["--jobs", str(jobs), "--no-cache"]
+    args += ["--profile", str(report_path)]
+    if trace_memory:
+        args.append("--profile-memory")
+    env = os.environ.copy()
+    env.pop("VERSION_OVERRIDE", None)
+
+    before = _snapshot(root)
+    started = time.perf_counter()
+    proc = subprocess.run(
+        args, cwd=root, env=env, capture_output=True, text=True, timeout=timeout
+    )
+    seconds = time.perf_counter() - started
+    after = _snapshot(root)
+    # mkpkg prints errors rather than raising, so a missing report is also a failure
+    if proc.returncode != 0 or not report_path.exists():
+        tail = "\n".join((proc.stdout + proc.stderr).splitlines()[-20:])
+        raise RuntimeError(f"{command} failed with status {proc.returncode}:\n{tail}")
+
+    changed = [
+        p
+        for p, stat in after.items()
+        if before.get(p) != stat and report_path.parent not in p.parents
+    ]
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    return CommandResult(
+        command=command,
+        seconds=seconds,
+        peak_rss_bytes=_get_peak_rss(report),
+        output_bytes=sum(after[p][0] for p in changed),
+        output_files=len(changed),
+        stages=report["profile"]["children"],
+        traced_peak_bytes=report["profile"]["peak_memory_bytes"]
+        if trace_memory
+        else None,
+    )
+
+
+def _format_mib(value: int | None) -> str:
+    return f"{value / 1_048_576:>10.1f}" if value is not None else f"{'-':>10}"
+
+
+def format_results(results: list[ScaleResult]) -> str:
+    lines = [
+        f"{'scale':>6}{'templates':>11}  {'command':<12}{'seconds':>10}{'RSS MiB':>10}{'traced MiB':>11}{'output KiB':>12}{'files':>7}"
+    ]
+    for result in results:
+        for cmd in result.commands:
+            lines.append(
+                f"{result.scale:>6}{result.template_count:>11}  {cmd.command:<12}{cmd.seconds:>10.2f}{_format_mib(cmd.peak_rss_bytes)} {_format_mib(cmd.traced_peak_bytes)}{cmd.output_bytes / 1024:>12.1f}{cmd.output_files:>7}"
+            )
+    return "\n".join(lines)
+
+
+@contextmanager
+def _project(scale: int, keep: bool) -> Iterator[tuple[Path, list[str]]]:
+    root = Path(tempfile.mkdtemp(prefix=f"codex-bench-{scale}x-"))
+    try:
+        yield root, generate(root, scale)
+    finally:
+        if keep:
+            print(f"Kept project: {root}")
+        else:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build pipeline scaling benchmark.")
+    parser.add_argument(
+        "--scales",
+        type=int,
+        nargs="+",
+        default=[1, 10, 100],
+        help="Template types per shipped template type, one run per scale.",
+    )
+    parser.add_argument(
+        "--commands",
+        nargs="+",
+        choices=list(_COMMANDS),
+        default=list(_COMMANDS),
+        help="Commands to run, in order. install-api installs the single build.",
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=1, help="Build jobs, 0 for one per CPU."
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=None, help="Seconds allowed per command."
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="Also run every scale with --profile-memory in a separate project and report its traced peak memory.",
+    )
+    parser.add_argument("--output", type=Path, help="Write the results as JSON.")
+    parser.add_argument(
+        "--keep", action="store_true", help="Keep the generated projects."
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    results: list[ScaleResult] = []
+    status = 0
+    for scale in args.scales:
+        try:
+            with _project(scale, args.keep) as (root, template_types):
+                result = ScaleResult(scale=scale, template_count=len(template_types))
+                results.append(result)
+                for command in args.commands:
+                    result.commands.append(
+                        run_command(root, command, args.jobs, args.timeout)
+                    )
+                    print(format_results([result]).splitlines()[-1], flush=True)
+            if args.trace_memory:
+                # traced in a fresh project, so each command starts from the same state
+                with _project(scale, args.keep) as (root, _):
+                    for cmd in result.commands:
+                        traced = run_command(
+                            root,
+                            cmd.command,
+                            args.jobs,
+                            args.timeout,
+                            trace_memory=True,
+                        )
+                        cmd.traced_peak_bytes = traced.traced_peak_bytes
+        except (RuntimeError, subprocess.TimeoutExpired) as e:
+            print(f"Scale {scale}: {e}", file=sys.stderr)
+            status = 1
+            break
+    print(format_results(results))
+    if args.output:
+        args.output.write_text(
+            json.dumps([asdict(r) for r in results], indent=2), encoding="utf-8"
+        )
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
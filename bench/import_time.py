@@ -0,0 +1,173 @@
+"""
+Startup import time benchmark.
+
+Imports a module, ``main`` by default, in fresh interpreters with ``python -X importtime``
+and reports the median total import time and the slowest imports. Exits with status 1
+when the median exceeds the budget, so it can run in CI to catch startup regressions.
+
+Examples:
+    python bench/import_time.py
+    python bench/import_time.py --budget-ms 1200 --runs 7 --top 25
+    python bench/import_time.py --module api.routes.templates --budget-ms 400
+
+The application reads its settings at import, so run it with the same environment,
+such as ``API_ENV_DATA`` and ``API_ENV_MODE``, as the server.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+
+
+@dataclass
+class ImportEntry:
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> list[ImportEntry]:
+    """
+    Parses the ``-X importtime`` report.
+
+    Args:
+        stderr (str): Standard error of the interpreter.
+
+    Returns:
+        list[ImportEntry]: Imports in report order.
+    """
+    entries: list[ImportEntry] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3:
+            continue
+        self_str, cumulative_str, name = parts
+        if not self_str.strip().isdigit():
+            # header line
+            continue
+        stripped = name.lstrip()
+        depth = (len(name) - len(stripped) - 1) // 2
+        entries.append(
+            ImportEntry(
+                name=stripped.strip(),
+                self_us=int(self_str),
+                cumulative_us=int(cumulative_str),
+                depth=depth,
+            )
+        )
+    return entries
+
+
+def measure(module: str, python: str = sys.executable) -> list[ImportEntry]:
+    """
+    Imports ``module`` in a fresh interpreter with ``-X importtime``.
+
+    Args:
+        module (str): Module to import.
+        python (str, optional): Interpreter. Defaults to the current one.
+
+    Raises:
+        RuntimeError: If the import fails.
+
+    Returns:
+        list[ImportEntry]: Imports in report order.
+    """
+    proc = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        cwd=_ROOT,
+        env=os.environ.copy(),
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        lines = [
+            line
+            for line in proc.stderr.splitlines()
+            if not line.startswith("import time:")
+        ]
+        tail = "\n".join(lines[-20:])
+        raise RuntimeError(f"Importing {module} failed:\n{tail}")
+    return parse_importtime(proc.stderr)
+
+
+def total_ms(entries: list[ImportEntry], module: str) -> float:
+    """
+    Gets the import time of a module in milliseconds.
+
+    Args:
+        entries (list[ImportEntry]): Parsed report.
+        module (str): Imported module.
+
+    Returns:
+        float: Cumulative import time of ``module``, which excludes interpreter startup.
+    """
+    for e in entries:
+        if e.depth == 0 and e.name == module:
+            return e.cumulative_us / 1000.0
+    return sum(e.cumulative_us for e in entries if e.depth == 0) / 1000.0
+
+
+def format_top(entries: list[ImportEntry], top: int) -> str:
+    rows = sorted(entries, key=lambda e: e.cumulative_us, reverse=True)
+    lines = [f"{'cumulative ms':>14}{'self ms':>10}  module"]
+    for e in rows[:top]:
+        lines.append(
+            f"{e.cumulative_us / 1000:>14.1f}{e.self_us / 1000:>10.1f}  {e.name}"
+        )
+    return "\n".join(lines)
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Startup import time benchmark.")
+    parser.add_argument("--module", default="main", help="Module to import.")
+    parser.add_argument(
+        "--runs", type=int, default=5, help="Fresh interpreter runs, median is used."
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=float(os.getenv("STARTUP_IMPORT_BUDGET_MS", "2000")),
+        help="Fail when the median exceeds this, defaults to STARTUP_IMPORT_BUDGET_MS or 2000.",
+    )
+    parser.add_argument(
+        "--top", type=int, default=15, help="Number of slowest imports to list."
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    runs: list[tuple[float, list[ImportEntry]]] = []
+    for _ in range(max(1, args.runs)):
+        entries = measure(args.module)
+        runs.append((total_ms(entries, args.module), entries))
+    totals = [t for t, _ in runs]
+    median = statistics.median(totals)
+    # list the slowest imports of the run closest to the median
+    _, entries = min(runs, key=lambda r: abs(r[0] - median))
+    print(format_top(entries, args.top))
+    print(
+        f"import {args.module}: median {median:.1f} ms, "
+        f"min {min(totals):.1f} ms, max {max(totals):.1f} ms over {len(totals)} runs, "
+        f"budget {args.budget_ms:.0f} ms"
+    )
+    if median > args.budget_ms:
+        print(
+            f"Import time budget exceeded by {median - args.budget_ms:.1f} ms",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
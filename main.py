@@ -1,10 +1,9 @@
-import json
 import os
 import sys
 from contextlib import asynccontextmanager
 from loguru import logger
 from contextvars import ContextVar
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
@@ -13,7 +12,17 @@ from starlette import status
 from api.lib.exceptions import UnauthorizedException
 from api.lib.env import env_info  # Must be early import to load env vars
 from api.lib.descope.auth import AUTH
-from descope.descope_client import DescopeClient
+from api.lib.rate_limit.rate_limit_middleware import (
+    RATE_LIMIT_ACQUIRE,
+    RateLimitMiddleware,
+)
+from api.lib.security import permissions
+from api.lib import warmup
+from api.lib.util.memory_info import get_memory_info
+from api.lib.cache.session_handler import SessionHandler
+from api.lib.mcp.jsonrpc_batch import JsonRpcBatchExecutor
+from api.lib.mcp.mcp_asgi_client import McpAsgiClient
+from api.lib.util.request_body import get_parsed_body
 from api.lib.descope.auth_config import get_settings
 from api.routes import executor_modes
 from api.routes import privacy_terms
@@ -32,8 +41,6 @@ auth_settings = get_settings()
 bearer_optional = HTTPBearer(auto_error=False)
 auth_context_var: ContextVar[dict | None] = ContextVar("auth_context", default=None)
 
-descope_client = DescopeClient(project_id=auth_settings.DESCOPE_PROJECT_ID)
-
 
 def custom_openapi():
     if app.openapi_schema:
@@ -66,6 +73,16 @@ mcp_templates = templates_mcp.init_mcp()
 # ============================================================================
 mcp_templates_app = mcp_templates.http_app(path="/mcp", transport="streamable-http")
 
+# one in-process client to the MCP app for batch execution
+mcp_asgi_client = McpAsgiClient(app=mcp_templates_app, path="/mcp")
+
+_MCP_BATCH_CONFIG = PkgConfig().api_info.mcp_batch
+mcp_batch_executor = JsonRpcBatchExecutor(
+    client=mcp_asgi_client,
+    max_size=_MCP_BATCH_CONFIG.max_size,
+    max_concurrency=_MCP_BATCH_CONFIG.max_concurrency,
+)
+
 # ============================================================================
 # FastAPI Application with Combined Lifespan
 # ============================================================================
@@ -82,12 +99,23 @@ async def lifespan(app: FastAPI):
     async with mcp_templates_app.lifespan(app):
         logger.remove()
         logger.add(sys.stderr, level=auth_settings.LOG_LEVEL)
+        # already built when a pre-fork parent ran the warmup, see serve_prefork.py
+        warmup.build_read_only_state()
+        mcp_asgi_client.open()
+        if auth_settings.is_development:
+            mcp_proxy_client.open()
+            app.state.mcp_proxy_client = mcp_proxy_client
         logger.info(
-            "Application startup complete. Logging Level is set to {log_level}",
+            "Application startup complete. Logging Level is set to {log_level}, {memory}",
             log_level=auth_settings.LOG_LEVEL,
+            memory=get_memory_info(),
         )
         yield
 
+    # write any batched session access updates before the worker exits
+    SessionHandler().close()
+    await mcp_asgi_client.aclose()
+    await mcp_proxy_client.aclose()
     logger.info("👋 Shutting down...")
 
 
@@ -100,17 +128,9 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-# ============================================================================
-# CORS Middleware - Required for MCP Inspector
-# ============================================================================
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # In production, specify your actual origins
-    allow_credentials=True,
-    allow_methods=["*"],  # Allows all methods
-    allow_headers=["*"],  # Allows all headers
-)
-
+# the Bruno proxy posts through the whole app, so the auth middleware and the rate
+# limiter apply to the calls it proxies
+mcp_proxy_client = McpAsgiClient(app=app, path="/templates/mcp")
 
 app.include_router(templates.router)
 app.include_router(executor_modes.router)
@@ -184,34 +204,32 @@ async def mcp_auth_middleware(request: Request, call_next):
             parts = authorization.split()
             if len(parts) == 2 and parts[0].lower() == "bearer":
                 token = parts[1]
-                request_body = await request.body()
-
-                # Parse JSON from bytes
-                try:
-                    request_data = json.loads(request_body.decode("utf-8"))
-                except (json.JSONDecodeError, UnicodeDecodeError):
-                    request_data = {}
-
-                is_tool_call = request_data.get("method") == "tools/call"
-
-                required_scopes = None
+                # parsed once per request; shared through request.state
+                request_data = await get_parsed_body(request)
+                is_batch = _MCP_BATCH_CONFIG.enabled and isinstance(request_data, list)
+                # a batch is authenticated once, for all of its messages
+                messages = request_data if is_batch else [request_data]
+                is_tool_call = any(
+                    isinstance(m, dict) and m.get("method") == "tools/call"
+                    for m in messages
+                )
+
+                required_permission = None
                 if is_tool_call:
                     logger.debug(
                         "mcp_auth_middleware() Detected tool call in MCP request"
                     )
-                    scopes = env_info.get_api_scopes()
-                    required_scopes = list(
-                        scopes.read_scopes | scopes.write_scopes
-                    )  # get required scope for your tool
+                    # at least one general read or write scope, compiled once at startup
+                    required_permission = permissions.GENERAL_READ_WRITE
                     logger.debug(
-                        "mcp_auth_middleware() Required at least one scope for tool call: {scopes}",
-                        scopes=required_scopes,
+                        "mcp_auth_middleware() Required permission for tool call: {permission}",
+                        permission=required_permission.name,
                     )
 
                 try:
                     session = await AUTH.verify_token(token)
-                    if required_scopes:
-                        if not session.validate_scopes(required_scopes, match_any=True):
+                    if required_permission and required_permission.scope_mask:
+                        if not session.has_permission(required_permission):
                             logger.debug(
                                 "mcp_auth_middleware() Insufficient scopes: {scopes}",
                                 scopes=session.scopes,
@@ -242,6 +260,22 @@ async def mcp_auth_middleware(request: Request, call_next):
                         status_code=status.HTTP_401_UNAUTHORIZED,
                         detail="Token validation failed",
                     )
+                if is_batch:
+                    logger.debug(
+                        "mcp_auth_middleware() Executing JSON-RPC batch of {count} messages",
+                        count=len(messages),
+                    )
+                    # each message is metered like a request of its own
+                    batch_result = await mcp_batch_executor.execute(
+                        messages,
+                        headers=request.headers,
+                        base_url=f"{request.url.scheme}://{request.url.netloc}",
+                        acquire=getattr(request.state, RATE_LIMIT_ACQUIRE, None),
+                    )
+                    if batch_result == []:
+                        # a batch of notifications only gets no response body
+                        return Response(status_code=status.HTTP_202_ACCEPTED)
+                    return JSONResponse(content=batch_result)
         else:
             logger.debug(
                 "mcp_auth_middleware() No Authorization header provided for MCP request"
@@ -260,6 +294,25 @@ async def mcp_auth_middleware(request: Request, call_next):
     return response
 
 
+# ============================================================================
+# Rate Limit Middleware - added after the auth middleware so it runs first and
+# rejects over-quota requests before routing, and before CORS so CORS wraps 429
+# responses. It verifies tokens itself; the verified session cache serves the route.
+# ============================================================================
+app.add_middleware(RateLimitMiddleware)
+
+# ============================================================================
+# CORS Middleware - Required for MCP Inspector
+# ============================================================================
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],  # In production, specify your actual origins
+    allow_credentials=True,
+    allow_methods=["*"],  # Allows all methods
+    allow_headers=["*"],  # Allows all headers
+)
+
+
 # ============================================================================
 # Mount FastMCP to FastAPI
 # ============================================================================
@@ -0,0 +1,314 @@
+"""
+Content-addressed cache of build stage outputs.
+
+Each stage of a build, such as processing one template, is keyed by a hash of its
+inputs. Output files are stored once under their content hash in ``objects/`` and
+each stage entry under ``entries/<stage>/<key>.json`` records the hash of every
+input and its output files, so a later build with the same inputs, including inputs
+seen in any earlier build, copies the outputs back instead of rebuilding them. The
+last entry of each item is also kept as ``entries/<stage>/<name>.last.json`` so a
+build with changed inputs can report which of them changed.
+
+Every key also holds the builder version and a hash of the sources of the builder and
+template engine, so a build with changed code never reuses outputs of the old code.
+
+Entries and objects are written to a temporary file and then replaced, so worker
+processes may share a cache.
+"""
+
+import dataclasses
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import tempfile
+from dataclasses import dataclass
+from datetime import date, time
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path, PurePath
+from typing import Any, Callable
+from ..util import sha
+
+BUILD_CACHE_VERSION = 1
+_SOURCE_ROOT = Path(__file__).resolve().parent.parent
+
+
+@dataclass(frozen=True)
+class CacheDecision:
+    """
+    Result of looking up one stage in the cache.
+
+    Attributes:
+        stage (str): Stage name such as ``template``.
+        name (str): Item of the stage, such as a template type.
+        hit (bool): True if the outputs were reused.
+        reason (str): Why the stage was rebuilt or reused.
+    """
+
+    stage: str
+    name: str
+    hit: bool
+    reason: str
+
+    def __str__(self) -> str:
+        status = "reused" if self.hit else "rebuilt"
+        return f"{status:<8} {self.stage}:{self.name} ({self.reason})"
+
+
+def _canonical(value: Any) -> Any:
+    # sets are sorted, so keys do not depend on the string hash seed of the process
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Enum):
+        return _canonical(value.value)
+    if isinstance(value, PurePath):
+        return value.as_posix()
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            f.name: _canonical(getattr(value, f.name))
+            for f in dataclasses.fields(value)
+        }
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        items = [_canonical(v) for v in value]
+        return sorted(items, key=lambda v: json.dumps(v, sort_keys=True))
+    raise TypeError(f"Cannot fingerprint value of type {type(value).__name__}.")
+
+
+def fingerprint(value: Any) -> str:
+    """
+    Hashes a stage input.
+
+    Args:
+        value (Any): JSON compatible value, dataclass, set, path, enum or date,
+            nested in any way.
+
+    Raises:
+        TypeError: If ``value`` holds a value of another type.
+
+    Returns:
+        str: SHA-256 of the canonical JSON form of ``value``.
+    """
+    text = json.dumps(_canonical(value), sort_keys=True)
+    return sha.compute_str_sha256(text)
+
+
+def file_fingerprint(file_path: Path) -> str:
+    """
+    Hashes a stage input file by its content.
+
+    Args:
+        file_path (Path): Input file.
+
+    Returns:
+        str: SHA-256 of the file, or ``missing`` if it does not exist.
+    """
+    if not file_path.is_file():
+        return "missing"
+    return sha.compute_file_sha256(file_path)
+
+
+@lru_cache(maxsize=None)
+def get_source_fingerprint() -> str:
+    """
+    Hashes the Python sources of the ``src`` package, which holds the builders and the
+    template engine. Computed once per process.
+
+    Returns:
+        str: SHA-256 of the relative path and content of every source file.
+    """
+    hasher = hashlib.sha256()
+    for path in sorted(_SOURCE_ROOT.rglob("*.py")):
+        hasher.update(path.relative_to(_SOURCE_ROOT).as_posix().encode("utf-8"))
+        hasher.update(b"\0")
+        hasher.update(path.read_bytes())
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+
+class BuildCache:
+    def __init__(
+        self,
+        cache_dir: Path,
+        builder_version: str,
+        enabled: bool = True,
+    ):
+        """
+        Args:
+            cache_dir (Path): Cache directory, created on first write.
+            builder_version (str): Version of the builder, part of every key together
+                with ``get_source_fingerprint()``.
+            enabled (bool, optional): If False, every stage is rebuilt and the cache
+                is refreshed with its outputs. Defaults to True.
+        """
+        self._cache_dir = cache_dir
+        # the configured version is not bumped by every code change, the sources are
+        self._builder_version = f"{builder_version}+{get_source_fingerprint()[:16]}"
+        self._enabled = enabled
+        self._decisions: list[CacheDecision] = []
+
+    def _entry_path(self, stage: str, key: str) -> Path:
+        return self._cache_dir / "entries" / stage / f"{key}.json"
+
+    def _last_entry_path(self, stage: str, name: str) -> Path:
+        return self._cache_dir / "entries" / stage / f"{name}.last.json"
+
+    def _object_path(self, digest: str) -> Path:
+        return self._cache_dir / "objects" / digest[:2] / digest
+
+    def _write_atomic(self, path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+
+    def _put_object(self, data: bytes) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if not path.exists():
+            self._write_atomic(path, data)
+        return digest
+
+    def _read_entry(self, path: Path) -> dict[str, Any] | None:
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get("cache_version") != BUILD_CACHE_VERSION:
+            return None
+        return entry
+
+    def _get_key(self, stage: str, inputs: dict[str, str]) -> str:
+        return fingerprint(
+            {
+                "cache_version": BUILD_CACHE_VERSION,
+                "builder_version": self._builder_version,
+                "stage": stage,
+                "inputs": inputs,
+            }
+        )
+
+    def _explain_miss(self, stage: str, name: str, inputs: dict[str, str]) -> str:
+        if not self._enabled:
+            return "cache disabled"
+        entry = self._read_entry(self._last_entry_path(stage, name))
+        if entry is None:
+            return "no cache entry"
+        if entry.get("builder_version") != self._builder_version:
+            return "builder version or sources changed"
+        previous: dict[str, str] = entry.get("inputs", {})
+        changed = sorted(
+            key
+            for key in previous.keys() | inputs.keys()
+            if previous.get(key) != inputs.get(key)
+        )
+        if changed:
+            return f"changed: {', '.join(changed)}"
+        return "cached outputs missing"
+
+    def _restore(self, entry: dict[str, Any], dest_dir: Path) -> list[Path] | None:
+        objects = [(n, self._object_path(d)) for n, d in entry["files"]]
+        if not all(p.is_file() for _, p in objects):
+            return None
+        if not self._object_path(entry["data"]).is_file():
+            return None
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        paths = []
+        for file_name, object_path in objects:
+            dest = dest_dir / file_name
+            shutil.copyfile(object_path, dest)
+            paths.append(dest)
+        return paths
+
+    def run(
+        self,
+        stage: str,
+        name: str,
+        inputs: dict[str, Any],
+        dest_dir: Path,
+        build: Callable[[], tuple[list[Path], Any]],
+    ) -> tuple[list[Path], Any, CacheDecision]:
+        """
+        Reuses the outputs of a stage when its inputs are unchanged; Otherwise, builds them.
+
+        Args:
+            stage (str): Stage name such as ``template``.
+            name (str): Item of the stage, such as a template type.
+            inputs (dict[str, Any]): Named inputs, hashed with ``fingerprint()``. Use
+                ``file_fingerprint()`` for inputs read from files.
+            dest_dir (Path): Directory the stage writes its output files to.
+            build (Callable[[], tuple[list[Path], Any]]): Builds the stage and returns
+                its output files, which must be in ``dest_dir``, and any picklable data
+                the caller needs back on a cache hit.
+
+        Returns:
+            tuple[list[Path], Any, CacheDecision]: Output files, data returned by ``build``
+            and the decision. Decisions are not recorded, pass them to ``record()``.
+        """
+        hashed = {k: fingerprint(v) for k, v in inputs.items()}
+        key = self._get_key(stage, hashed)
+        entry = (
+            self._read_entry(self._entry_path(stage, key)) if self._enabled else None
+        )
+        if entry is not None:
+            paths = self._restore(entry, dest_dir)
+            if paths is not None:
+                data = pickle.loads(self._object_path(entry["data"]).read_bytes())
+                return paths, data, CacheDecision(stage, name, True, "inputs unchanged")
+        reason = self._explain_miss(stage, name, hashed)
+        paths, data = build()
+        files = [[p.name, self._put_object(p.read_bytes())] for p in paths]
+        new_entry = {
+            "cache_version": BUILD_CACHE_VERSION,
+            "builder_version": self._builder_version,
+            "key": key,
+            "inputs": hashed,
+            "files": files,
+            "data": self._put_object(pickle.dumps(data)),
+        }
+        entry_data = json.dumps(new_entry, indent=2).encode("utf-8")
+        self._write_atomic(self._entry_path(stage, key), entry_data)
+        self._write_atomic(self._last_entry_path(stage, name), entry_data)
+        return paths, data, CacheDecision(stage, name, False, reason)
+
+    def record(self, decision: CacheDecision) -> None:
+        """
+        Records a decision for ``format_explain()``.
+
+        Args:
+            decision (CacheDecision): Decision returned by ``run()``.
+        """
+        self._decisions.append(decision)
+
+    def format_explain(self) -> str:
+        """
+        Formats the recorded decisions, one line per stage item.
+
+        Returns:
+            str: Report of what was reused or rebuilt and why.
+        """
+        hits = sum(1 for d in self._decisions if d.hit)
+        lines = [str(d) for d in self._decisions]
+        lines.append(
+            f"Build cache: {hits} reused, {len(self._decisions) - hits} rebuilt ({self._cache_dir})"
+        )
+        return "\n".join(lines)
+
+    @property
+    def decisions(self) -> list[CacheDecision]:
+        """Gets the recorded decisions."""
+        return self._decisions
+
+    @property
+    def enabled(self) -> bool:
+        """Gets if cached outputs are reused."""
+        return self._enabled
@@ -0,0 +1,303 @@
+"""
+Stage timing and memory profile of one ``mkpkg`` command.
+
+Builders and installers wrap their stages in ``BuildProfiler().stage(name)``. Stages
+nest, and the processes run by a ``ProcessScheduler`` are recorded under the stage
+that runs them. Nothing is measured until ``start()`` is called, so the profiler
+costs a context manager per stage when profiling is off.
+
+The report always holds the peak resident set size of the command process and of
+its child processes, read from ``resource`` where available. Tracing the memory of
+each stage is opt-in because ``tracemalloc`` slows a build several times: with
+``trace_memory`` a stage records the peak of memory allocated by Python objects while
+it ran. Processes that ran concurrently have no memory of their own; their peak is
+part of the enclosing stage.
+"""
+
+import cProfile
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator
+from ..meta.singleton import SingletonMeta
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+PROFILE_REPORT_VERSION = 2
+
+
+def get_max_rss_bytes(children: bool = False) -> int | None:
+    """
+    Gets the peak resident set size of this process or of its waited-for children.
+
+    Args:
+        children (bool, optional): Get the largest peak of the child processes
+            instead. Defaults to False.
+
+    Returns:
+        int | None: Peak resident set size in bytes, or None where ``resource`` is
+            not available.
+    """
+    if resource is None:
+        return None
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    max_rss = resource.getrusage(who).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+@dataclass
+class StageProfile:
+    """
+    Measurements of one stage or process.
+
+    Attributes:
+        name (str): Stage name such as ``process_templates``.
+        kind (str): ``stage`` or ``process``.
+        wall_seconds (float): Elapsed time.
+        cpu_seconds (float): CPU time of this process, or of the worker thread for
+            processes run concurrently.
+        peak_memory_bytes (int | None): Peak traced memory, or None if memory was not traced.
+        children (list[StageProfile]): Nested stages and processes.
+    """
+
+    name: str
+    kind: str = "stage"
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_memory_bytes: int | None = None
+    children: list["StageProfile"] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Gets the profile as JSON compatible data.
+
+        Returns:
+            dict[str, Any]: Profile with its children.
+        """
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "wall_seconds": round(self.wall_seconds, 6),
+            "cpu_seconds": round(self.cpu_seconds, 6),
+            "peak_memory_bytes": self.peak_memory_bytes,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+
+class BuildProfiler(metaclass=SingletonMeta):
+    """Process-wide profiler of the running command."""
+
+    def __init__(self):
+        self._enabled = False
+        self._command = ""
+        self._info: dict[str, Any] = {}
+        self._root = StageProfile(name="")
+        self._stack: list[StageProfile] = []
+        self._started_at: datetime | None = None
+        self._wall_start = 0.0
+        self._cpu_start = 0.0
+        self._cprofile: cProfile.Profile | None = None
+        self._trace_memory = False
+        self._owns_tracing = False
+        self._max_rss: int | None = None
+        self._children_max_rss: int | None = None
+
+    def start(
+        self, command: str, cprofile: bool = False, trace_memory: bool = False
+    ) -> None:
+        """
+        Starts profiling.
+
+        Args:
+            command (str): Command being profiled, such as ``pkg-zip``.
+            cprofile (bool, optional): Also collect ``cProfile`` statistics. Defaults to False.
+            trace_memory (bool, optional): Trace the peak memory of each stage with
+                ``tracemalloc``, which slows the command. Defaults to False.
+        """
+        self._enabled = True
+        self._command = command
+        self._info = {}
+        self._cprofile = None
+        self._trace_memory = trace_memory
+        self._max_rss = None
+        self._children_max_rss = None
+        self._root = StageProfile(name=command)
+        self._stack = [self._root]
+        self._started_at = datetime.now().astimezone()
+        self._owns_tracing = False
+        if trace_memory:
+            self._owns_tracing = not tracemalloc.is_tracing()
+            if self._owns_tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        if cprofile:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def stop(self) -> None:
+        """Stops profiling and closes the command stage."""
+        if not self._enabled:
+            return
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        self._update_peaks()
+        self._root.wall_seconds = time.perf_counter() - self._wall_start
+        self._root.cpu_seconds = time.process_time() - self._cpu_start
+        self._max_rss = get_max_rss_bytes()
+        self._children_max_rss = get_max_rss_bytes(children=True)
+        self._stack = []
+        self._enabled = False
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+
+    def _update_peaks(self) -> None:
+        if not self._trace_memory:
+            return
+        # the tracemalloc peak is global; fold it into every open stage before a reset
+        _, peak = tracemalloc.get_traced_memory()
+        for stage in self._stack:
+            stage.peak_memory_bytes = max(stage.peak_memory_bytes or 0, peak)
+        tracemalloc.reset_peak()
+
+    @contextmanager
+    def stage(self, name: str, kind: str = "stage") -> Iterator[None]:
+        """
+        Measures a stage, nested in the stage open when it starts.
+
+        Stages must be opened and closed on the thread that started the profiler.
+
+        Args:
+            name (str): Stage name.
+            kind (str, optional): ``stage`` or ``process``. Defaults to ``stage``.
+        """
+        if not self._enabled:
+            yield
+            return
+        profile = StageProfile(
+            name=name, kind=kind, peak_memory_bytes=0 if self._trace_memory else None
+        )
+        self._update_peaks()
+        self._stack[-1].children.append(profile)
+        self._stack.append(profile)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            profile.wall_seconds = time.perf_counter() - wall_start
+            profile.cpu_seconds = time.process_time() - cpu_start
+            self._update_peaks()
+            self._stack.pop()
+
+    def record(
+        self, name: str, wall_seconds: float, cpu_seconds: float, kind: str = "process"
+    ) -> None:
+        """
+        Records a process measured elsewhere, such as on a worker thread, in the open stage.
+
+        Args:
+            name (str): Process name.
+            wall_seconds (float): Elapsed time.
+            cpu_seconds (float): CPU time.
+            kind (str, optional): Kind of the entry. Defaults to ``process``.
+        """
+        if not self._enabled:
+            return
+        self._stack[-1].children.append(
+            StageProfile(
+                name=name, kind=kind, wall_seconds=wall_seconds, cpu_seconds=cpu_seconds
+            )
+        )
+
+    def set_info(self, key: str, value: Any) -> None:
+        """
+        Sets a value reported with the profile, such as the build number.
+
+        Args:
+            key (str): Name of the value.
+            value (Any): JSON compatible value.
+        """
+        if self._enabled:
+            self._info[key] = value
+
+    def get_report(self) -> dict[str, Any]:
+        """
+        Gets the profile report.
+
+        Returns:
+            dict[str, Any]: JSON compatible report.
+        """
+        return {
+            "report_version": PROFILE_REPORT_VERSION,
+            "command": self._command,
+            "argv": sys.argv[1:],
+            "started_at": self._started_at.isoformat() if self._started_at else None,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "trace_memory": self._trace_memory,
+            "max_rss_bytes": self._max_rss,
+            "children_max_rss_bytes": self._children_max_rss,
+            "info": self._info,
+            "profile": self._root.to_dict(),
+        }
+
+    def write_report(self, report_path: Path, stats_path: Path | None = None) -> None:
+        """
+        Writes the profile report and, if collected, the ``cProfile`` statistics.
+
+        Args:
+            report_path (Path): JSON report file.
+            stats_path (Path, optional): ``pstats`` file, written when ``cProfile``
+                statistics were collected.
+        """
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        with report_path.open("w", encoding="utf-8") as f:
+            json.dump(self.get_report(), f, indent=2, default=str)
+        if stats_path is not None and self._cprofile is not None:
+            self._cprofile.dump_stats(stats_path)
+
+    def format_summary(self) -> str:
+        """
+        Formats the stages of the profile, one line per stage.
+
+        Returns:
+            str: Stage times and peak memory, indented by nesting.
+        """
+        lines: list[str] = []
+
+        def add(profile: StageProfile, depth: int) -> None:
+            memory = (
+                f"{profile.peak_memory_bytes / 1_048_576:8.1f} MiB"
+                if profile.peak_memory_bytes is not None
+                else " " * 12
+            )
+            lines.append(
+                f"{profile.wall_seconds:8.3f}s {profile.cpu_seconds:8.3f}s cpu {memory} {'  ' * depth}{profile.name}"
+            )
+            for child in profile.children:
+                add(child, depth + 1)
+
+        add(self._root, 0)
+        if self._max_rss is not None:
+            lines.append(f"peak RSS {self._max_rss / 1_048_576:.1f} MiB")
+        return "\n".join(lines)
+
+    @property
+    def enabled(self) -> bool:
+        """Gets if the profiler is recording."""
+        return self._enabled
@@ -0,0 +1,212 @@
+"""
+Runs the processes of a processor in dependency order.
+
+Each process declares the outputs it produces and the outputs of other processes it
+reads. A process starts once every process producing one of its inputs has finished,
+so independent processes run concurrently on a thread pool. Inputs no process
+produces, such as build tokens, are ignored.
+"""
+
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+from .build_profiler import BuildProfiler
+
+
+@dataclass(frozen=True)
+class ProcessTiming:
+    """
+    Time taken by one process.
+
+    Attributes:
+        name (str): Process name.
+        seconds (float): Wall time of the process.
+        cpu_seconds (float): CPU time of the thread that ran the process.
+    """
+
+    name: str
+    seconds: float
+    cpu_seconds: float = 0.0
+
+    def __str__(self) -> str:
+        return f"{self.seconds:8.3f}s {self.name}"
+
+
+@dataclass(frozen=True)
+class _Task:
+    name: str
+    run: Callable[[], Any]
+    inputs: frozenset[str]
+    outputs: frozenset[str]
+
+
+class ProcessScheduler:
+    def __init__(self, jobs: int = 1):
+        """
+        Args:
+            jobs (int, optional): Processes run at the same time, 0 for one per CPU.
+                With 1, processes run in the calling thread in the order they were
+                added, moved only after the processes they depend on. Defaults to 1.
+        """
+        self._jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self._tasks: dict[str, _Task] = {}
+        self._timings: dict[str, ProcessTiming] = {}
+        self._elapsed = 0.0
+
+    def add(
+        self,
+        name: str,
+        run: Callable[[], Any],
+        inputs: Iterable[str] = (),
+        outputs: Iterable[str] = (),
+    ) -> None:
+        """
+        Adds a process.
+
+        Args:
+            name (str): Unique process name.
+            run (Callable[[], Any]): Runs the process and returns its result.
+            inputs (Iterable[str], optional): Outputs of other processes this process reads.
+            outputs (Iterable[str], optional): Outputs this process produces.
+
+        Raises:
+            ValueError: If a process with the same name was already added.
+        """
+        if name in self._tasks:
+            raise ValueError(f"Process already added: {name}")
+        self._tasks[name] = _Task(name, run, frozenset(inputs), frozenset(outputs))
+
+    def _get_dependencies(self) -> dict[str, set[str]]:
+        producers: dict[str, str] = {}
+        for task in self._tasks.values():
+            for output in task.outputs:
+                if output in producers:
+                    raise ValueError(
+                        f"Output '{output}' is produced by both {producers[output]} and {task.name}"
+                    )
+                producers[output] = task.name
+        return {
+            task.name: {producers[i] for i in task.inputs if i in producers}
+            - {task.name}
+            for task in self._tasks.values()
+        }
+
+    def get_order(self) -> list[str]:
+        """
+        Gets the order processes run in with one job.
+
+        Returns:
+            list[str]: Process names, each after the processes it depends on.
+
+        Raises:
+            ValueError: If processes depend on each other in a cycle.
+        """
+        dependencies = self._get_dependencies()
+        order: list[str] = []
+        done: set[str] = set()
+        pending = list(self._tasks)
+        while pending:
+            ready = next((n for n in pending if dependencies[n] <= done), None)
+            if ready is None:
+                raise ValueError(
+                    f"Process dependency cycle between: {', '.join(pending)}"
+                )
+            pending.remove(ready)
+            order.append(ready)
+            done.add(ready)
+        return order
+
+    def _run_task(self, task: _Task) -> Any:
+        started = time.perf_counter()
+        cpu_started = time.thread_time()
+        try:
+            return task.run()
+        finally:
+            self._timings[task.name] = ProcessTiming(
+                task.name,
+                time.perf_counter() - started,
+                time.thread_time() - cpu_started,
+            )
+
+    def run(self) -> dict[str, Any]:
+        """
+        Runs every process, each after the processes it depends on.
+
+        If a process fails, processes that have not started are skipped and the
+        first error is raised once running processes finish. Processes are recorded
+        in the open ``BuildProfiler`` stage.
+
+        Returns:
+            dict[str, Any]: Process name to result, in the order processes were added.
+
+        Raises:
+            ValueError: If processes depend on each other in a cycle.
+        """
+        order = self.get_order()
+        profiler = BuildProfiler()
+        self._timings.clear()
+        started = time.perf_counter()
+        results: dict[str, Any] = {}
+        try:
+            if self._jobs == 1 or len(order) < 2:
+                for name in order:
+                    with profiler.stage(name, kind="process"):
+                        results[name] = self._run_task(self._tasks[name])
+            else:
+                try:
+                    self._run_concurrent(results)
+                finally:
+                    for timing in self.timings:
+                        profiler.record(timing.name, timing.seconds, timing.cpu_seconds)
+        finally:
+            self._elapsed = time.perf_counter() - started
+        return {name: results[name] for name in self._tasks}
+
+    def _run_concurrent(self, results: dict[str, Any]) -> None:
+        dependencies = self._get_dependencies()
+        pending = list(self._tasks)
+        done: set[str] = set()
+        running: dict[Future, str] = {}
+        with ThreadPoolExecutor(
+            max_workers=self._jobs, thread_name_prefix="process"
+        ) as executor:
+            while pending or running:
+                for name in [n for n in pending if dependencies[n] <= done]:
+                    pending.remove(name)
+                    future = executor.submit(self._run_task, self._tasks[name])
+                    running[future] = name
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        wait(running)
+                        raise error
+                    results[name] = future.result()
+                    done.add(name)
+
+    def format_timings(self) -> str:
+        """
+        Formats the time of each process of the last run, one line per process.
+
+        Returns:
+            str: Report of process times.
+        """
+        lines = [str(self._timings[n]) for n in self._tasks if n in self._timings]
+        total = sum(t.seconds for t in self._timings.values())
+        lines.append(
+            f"{self._elapsed:8.3f}s total ({total:.3f}s in processes, jobs {self._jobs})"
+        )
+        return "\n".join(lines)
+
+    @property
+    def timings(self) -> list[ProcessTiming]:
+        """Gets the time of each process of the last run, in the order processes were added."""
+        return [self._timings[n] for n in self._tasks if n in self._timings]
+
+    @property
+    def elapsed(self) -> float:
+        """Gets the wall time of the last run in seconds."""
+        return self._elapsed
@@ -3,10 +3,10 @@ from datetime import datetime
 
 from .builderbase import BuilderBase
 from .build_ver_mgr import BuildVerMgr
+from .build_cache import BuildCache
+from .build_profiler import BuildProfiler
 from ..template.main_registry import MainRegistry
-from ..template.process_single.process_obsidian_templates import (
-    ProcessObsidianTemplates,
-)
+from ..template.template_corpus import TemplateCorpus
 from ..template.prompt.single.support_processor import SupportProcessor
 from ..config.pkg_config import PkgConfig
 from ..template.process.read_obsidian_template_meta import ReadObsidianTemplateMeta
@@ -23,10 +23,23 @@ from ..template.process_single.manifest_creator import ManifestCreator
 
 
 class SingleBuilder(BuilderBase):
-    def __init__(self, build_version: int = 0):
+    def __init__(
+        self,
+        build_version: int = 0,
+        jobs: int = 1,
+        use_cache: bool = True,
+        explain_cache: bool = False,
+    ):
         super().__init__()
         self.config = PkgConfig()
         self._build_version = build_version
+        self._jobs = jobs
+        self._explain_cache = explain_cache
+        self._build_cache = BuildCache(
+            cache_dir=self.config.config_cache.get_build_cache_path(),
+            builder_version=self.config.version,
+            enabled=use_cache,
+        )
         self._batch_hash = ""
         self._batch_date = None
         self._current_user = self.config.env_user
@@ -57,61 +70,76 @@ class SingleBuilder(BuilderBase):
         self._main_registry = MainRegistry(build_version=self._build_version)
 
     def build_package(self):
+        profiler = BuildProfiler()
+        profiler.set_info("build_version", self._build_version)
+        profiler.set_info("registry_version", self._main_registry.reg_version)
+        profiler.set_info("jobs", self._jobs)
         current_date = self.batch_date.isoformat()
-        meta_reader = ReadObsidianTemplateMeta()
-        template_meta = meta_reader.read_template_meta()
+        with profiler.stage("read_template_meta"):
+            meta_reader = ReadObsidianTemplateMeta()
+            template_meta = meta_reader.read_template_meta()
 
-        process_templates = ProcessObsidianTemplates()
-
-        processed_template_data = process_templates.process(
-            {
-                "declared_registry_id": self._main_registry.reg_id,
-                "declared_registry_version": self._main_registry.reg_version,
-                "mapped_registry": self._main_registry.reg_id,
-                "mapped_registry_minimum_version": self._main_registry.reg_version,
-                "batch_number": str(self._build_version),
-            }
-        )
-        templates_data = {}
-        for fm in processed_template_data.values():
-            templates_data[fm.template_type] = fm
+        corpus = TemplateCorpus()
+        corpus.configure(jobs=self._jobs, build_cache=self._build_cache)
+        with profiler.stage("process_templates"):
+            processed_template_data = corpus.get_templates(
+                self._main_registry, single=True
+            )
+            templates_data = corpus.get_templates_by_type(
+                self._main_registry, single=True
+            )
+        profiler.set_info("template_count", len(templates_data))
 
         tp = TemplateProcessor(
             workspace_dir=self._destination_path,
             registry=self._main_registry,
             templates_data=templates_data,
+            build_cache=self._build_cache,
+            jobs=self._jobs,
         )
-        fm_data = tp.execute_all(tokens={})
+        with profiler.stage("templates"):
+            fm_data = tp.execute_all(tokens={})
 
         trp = TemplateRegistryProcessor(
             workspace_dir=self._destination_path,
             registry=self._main_registry,
             templates_meta=template_meta,
             templates_data=fm_data,
+            build_cache=self._build_cache,
+            jobs=self._jobs,
         )
-        _ = trp.execute_all(tokens={})
+        with profiler.stage("template_registries"):
+            _ = trp.execute_all(tokens={})
 
-        support_processor = SupportProcessor(registry=self._main_registry)
-        support_processor.execute_all(
-            tokens={
-                "VER": str(self._build_version),
-                "TEMPLATES_DATA": processed_template_data,
-            }
+        support_processor = SupportProcessor(
+            registry=self._main_registry, jobs=self._jobs
         )
+        with profiler.stage("support"):
+            support_processor.execute_all(
+                tokens={
+                    "VER": str(self._build_version),
+                    "TEMPLATES_DATA": processed_template_data,
+                }
+            )
         ep = EnforcementProcessor(
             workspace_dir=self._destination_path,
             registry=self._main_registry,
             templates_data=templates_data,
+            jobs=self._jobs,
         )
-        _ = ep.execute_all(
-            tokens={
-                "DATE": current_date,
-                "VER": str(self._build_version),
-            }
-        )
-        mc = ManifestCreator(build_number=self._build_version)
-        mc.create_manifest(templates=fm_data)
+        with profiler.stage("enforcement"):
+            _ = ep.execute_all(
+                tokens={
+                    "DATE": current_date,
+                    "VER": str(self._build_version),
+                }
+            )
+        with profiler.stage("manifest"):
+            mc = ManifestCreator(build_number=self._build_version)
+            mc.create_manifest(templates=fm_data)
         # template_count = tp.Count
+        if self._explain_cache:
+            print(self._build_cache.format_explain())
 
     @property
     def batch_date(self) -> datetime:
@@ -4,19 +4,35 @@ from datetime import datetime
 
 from .builderbase import BuilderBase
 from .build_ver_mgr import BuildVerMgr
+from .build_cache import BuildCache
+from .build_profiler import BuildProfiler
 from ..template.main_registry import MainRegistry
-from ..template.process.process_obsidian_templates import ProcessObsidianTemplates
+from ..template.template_corpus import TemplateCorpus
 from ..template.process.pkg_companions.processor import PkgCompanionsProcessor
 from ..template.prompt.zip.support_processor import SupportProcessor
 from ..config.pkg_config import PkgConfig
+from ..util.hashing_writer import HashingWriter
 from ..template.process.read_obsidian_template_meta import ReadObsidianTemplateMeta
 
 
 class ZipBuilder(BuilderBase):
-    def __init__(self, build_version: int = 0):
+    def __init__(
+        self,
+        build_version: int = 0,
+        jobs: int = 1,
+        use_cache: bool = True,
+        explain_cache: bool = False,
+    ):
         super().__init__()
         self.config = PkgConfig()
         self._build_version = build_version
+        self._jobs = jobs
+        self._explain_cache = explain_cache
+        self._build_cache = BuildCache(
+            cache_dir=self.config.config_cache.get_build_cache_path(),
+            builder_version=self.config.version,
+            enabled=use_cache,
+        )
         self._destination_path = self.config.root_path / self.config.pkg_out_dir
         self._destination_path.mkdir(parents=True, exist_ok=True)
         self._batch_hash = ""
@@ -39,6 +55,10 @@ class ZipBuilder(BuilderBase):
         self._main_registry = MainRegistry(build_version=self._build_version)
 
     def build_package(self):
+        profiler = BuildProfiler()
+        profiler.set_info("build_version", self._build_version)
+        profiler.set_info("registry_version", self._main_registry.reg_version)
+        profiler.set_info("jobs", self._jobs)
         # === Paths ===
         output_zip_name = f"{self.config.package_output_name}-{self._build_version}.zip"
         output_zip_path = self._destination_path / output_zip_name
@@ -53,68 +73,98 @@ class ZipBuilder(BuilderBase):
         template_count = 0
         template_path_list = []
         pcp = None
-        meta_reader = ReadObsidianTemplateMeta()
-        template_meta = meta_reader.read_template_meta()
-
-        process_templates = ProcessObsidianTemplates()
-
-        processed_template_data = process_templates.process(
-            {
-                "declared_registry_id": self._main_registry.reg_id,
-                "declared_registry_version": self._main_registry.reg_version,
-                "mapped_registry": self._main_registry.reg_id,
-                "mapped_registry_minimum_version": self._main_registry.reg_version,
-                "batch_number": str(self._build_version),
-            }
-        )
+        with profiler.stage("read_template_meta"):
+            meta_reader = ReadObsidianTemplateMeta()
+            template_meta = meta_reader.read_template_meta()
+
+        corpus = TemplateCorpus()
+        corpus.configure(jobs=self._jobs, build_cache=self._build_cache)
+        with profiler.stage("process_templates"):
+            processed_template_data = corpus.get_templates(self._main_registry)
+        profiler.set_info("template_count", len(processed_template_data))
 
         # === Create ZIP ===
-        with zipfile.ZipFile(output_zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-            # Dictionary to group templates by category dynamically
-            for _, fm in processed_template_data.items():
-                template_path_list.append(fm.file_path)
-                # fm = FrontMatterMeta(file_path)
-                if not fm.has_field("template_id"):
-                    continue
-                template_count += 1
-                template_meta[fm.template_type]["template_id"] = fm.template_id
-                # template_meta[fm.template_type]["template_family"] = fm.template_family
-                template_meta[fm.template_type]["template_front_matter_meta"] = fm
-                zipf.write(fm.file_path, arcname=fm.file_path.name)
-
-            pcp = PkgCompanionsProcessor(self._main_registry)
-            companion_results = pcp.execute_all(
+        # entries are written from memory and the archive is hashed as it is written,
+        # so no file is read back. The archive is written to a temporary name so a
+        # failed build does not leave a partial package.
+        tmp_zip_path = output_zip_path.with_name(f".{output_zip_name}.tmp")
+        try:
+            with (
+                profiler.stage("write_zip"),
+                tmp_zip_path.open("wb") as f_zip,
+                HashingWriter(f_zip) as hashing_writer,
+                zipfile.ZipFile(hashing_writer, "w", zipfile.ZIP_DEFLATED) as zipf,
+            ):
+                # Dictionary to group templates by category dynamically
+                for _, fm in processed_template_data.items():
+                    template_path_list.append(fm.file_path)
+                    # fm = FrontMatterMeta(file_path)
+                    if not fm.has_field("template_id"):
+                        continue
+                    template_count += 1
+                    template_meta[fm.template_type]["template_id"] = fm.template_id
+                    # template_meta[fm.template_type]["template_family"] = fm.template_family
+                    template_meta[fm.template_type]["template_front_matter_meta"] = fm
+                    self._write_entry(
+                        zipf, fm.file_path.name, fm.get_template_text().encode("utf-8")
+                    )
+
+                pcp = PkgCompanionsProcessor(self._main_registry, jobs=self._jobs)
+                with profiler.stage("pkg_companions"):
+                    companion_results = pcp.render_all(
+                        {
+                            "VER": str(self._build_version),
+                            "BATCH_HASH": self.batch_hash,
+                            "BUILDER_VER": self.config.version,
+                            "DATE": self.batch_date.isoformat(),
+                            "TEMPLATE_COUNT": template_count,
+                            "TEMPLATES_DATA": processed_template_data,
+                            "TEMPLATE_META": template_meta,
+                        }
+                    )
+                for _, (file_name, data) in companion_results.items():
+                    self._write_entry(zipf, file_name, data)
+        except BaseException:
+            tmp_zip_path.unlink(missing_ok=True)
+            raise
+
+        zip_hash = hashing_writer.hexdigest()
+        os.replace(tmp_zip_path, output_zip_path)
+
+        pb = SupportProcessor(self._main_registry, jobs=self._jobs)
+        with profiler.stage("support"):
+            _ = pb.execute_all(
                 {
-                    "VER": str(self._build_version),
-                    "BATCH_HASH": self.batch_hash,
-                    "BUILDER_VER": self.config.version,
-                    "DATE": self.batch_date.isoformat(),
+                    "CURRENT_USER": self._current_user,
                     "TEMPLATE_COUNT": template_count,
                     "TEMPLATES_DATA": processed_template_data,
-                    "TEMPLATE_META": template_meta,
+                    "VER": str(self._build_version),
+                    "ZIP_HASH": zip_hash,
                 }
             )
-            for _, result_path in companion_results.items():
-                zipf.write(result_path, arcname=result_path.name)
-
-        zip_hash = self.compute_sha256(output_zip_path)
-
-        pb = SupportProcessor(self._main_registry)
-        _ = pb.execute_all(
-            {
-                "CURRENT_USER": self._current_user,
-                "TEMPLATE_COUNT": template_count,
-                "TEMPLATES_DATA": processed_template_data,
-                "VER": str(self._build_version),
-                "ZIP_HASH": zip_hash,
-            }
-        )
 
-        if pcp is not None:
-            pcp.cleanup()
-        process_templates.cleanup()
+        with profiler.stage("cleanup"):
+            if pcp is not None:
+                pcp.cleanup()
+            corpus.cleanup()
+        if self._explain_cache:
+            print(self._build_cache.format_explain())
         print(f"Built package: {output_zip_path}")
 
+    def _write_entry(self, zipf: zipfile.ZipFile, arcname: str, data: bytes) -> None:
+        """
+        Writes a file of the package from memory.
+
+        Args:
+            zipf (zipfile.ZipFile): Package being written.
+            arcname (str): Name of the file in the package.
+            data (bytes): File content.
+        """
+        zinfo = zipfile.ZipInfo(arcname, date_time=self.batch_date.timetuple()[:6])
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        zinfo.external_attr = 0o644 << 16
+        zipf.writestr(zinfo, data)
+
     @property
     def batch_date(self) -> datetime:
         if not self._batch_date:
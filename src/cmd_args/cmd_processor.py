@@ -1,5 +1,7 @@
 from __future__ import annotations
 import argparse
+from datetime import datetime
+from pathlib import Path
 from typing import cast
 from .protocol_subparser import ProtocolSubparser
 from .rule_pkg_zip import RulePkgZip
@@ -9,6 +11,7 @@ from .rule_single_upgrade import RuleSingleUpgrade
 from .rule_single_clean import RuleSingleClean
 from .rule_install_api import RuleInstallApi
 from ..config.pkg_config import PkgConfig
+from ..builder.build_profiler import BuildProfiler
 
 
 class CmdProcessor:
@@ -118,6 +121,7 @@ class CmdProcessor:
         - Iterates through the processes registered in self._processes in insertion order.
         - For the first process where process.is_match(cmd) returns True, calls that process.action(args)
             and returns whatever integer exit code it produces.
+        - With --profile, profiles the action and writes the profile report, even if the action fails.
         - If no registered process matches the parsed command, prints parser help text and returns 1.
 
         Assumptions:
@@ -143,10 +147,40 @@ class CmdProcessor:
             return 1
         for process in self._processes:
             if process.is_match(cmd):
-                result = process.action(args)
+                result = self._run_action(process, cmd, args)
                 if result == 0:
                     cfg = PkgConfig()
                     print("Package build complete. Output Folder:", cfg.pkg_out_dir)
                 return result
         self.parser.print_help()
         return 1
+
+    def _run_action(
+        self, process: ProtocolSubparser, cmd: str, args: argparse.Namespace
+    ) -> int:
+        profile = cast(str | None, getattr(args, "profile", None))
+        if profile is None:
+            return process.action(args)
+        profiler = BuildProfiler()
+        profiler.start(
+            cmd,
+            cprofile=bool(getattr(args, "profile_stats", False)),
+            trace_memory=bool(getattr(args, "profile_memory", False)),
+        )
+        try:
+            return process.action(args)
+        finally:
+            profiler.stop()
+            report_path = self._get_profile_report_path(cmd, profile)
+            stats_path = report_path.with_suffix(".pstats")
+            profiler.write_report(report_path, stats_path)
+            print(profiler.format_summary())
+            print("Profile report:", report_path)
+            if args.profile_stats:
+                print("Profile statistics:", stats_path)
+
+    def _get_profile_report_path(self, cmd: str, profile: str) -> Path:
+        if profile:
+            return Path(profile)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        return PkgConfig().config_cache.get_profile_path() / f"{cmd}-{stamp}.json"
@@ -38,6 +38,19 @@ class RuleInstallApi(SubParserBase, ProtocolSubparser):
             help="Specify the build version for the package. If not provided then the current build version will be used.",
             default=0,
         )
+        self._sub_parser.add_argument(
+            "-j",
+            "--jobs",
+            type=int,
+            help="Number of template types installed at once. Use 0 for one per CPU. Default is 1.",
+            default=1,
+        )
+        self._sub_parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="List the files that would be added or changed without installing them.",
+            default=False,
+        )
 
     def is_match(self, command: str) -> bool:
         return command == self._cmd
@@ -46,11 +59,11 @@ class RuleInstallApi(SubParserBase, ProtocolSubparser):
         from ..template.single.install.install_api import InstallAPI
 
         try:
-            install_api = InstallAPI(build_number=args.build)
+            install_api = InstallAPI(build_number=args.build, jobs=args.jobs)
             if args.template_type:
-                install_api.install_single(args.template_type)
+                install_api.install_single(args.template_type, dry_run=args.dry_run)
             else:
-                install_api.install()
+                install_api.install(dry_run=args.dry_run)
 
         except Exception as e:
             print(f"Error during verification: {e}")
@@ -35,6 +35,27 @@ class RulePkgZip(SubParserBase, ProtocolSubparser):
             help="Specify the build version for the package. If not provided then the next available build version will be used.",
             default=0,
         )
+        self._sub_parser.add_argument(
+            "-j",
+            "--jobs",
+            type=int,
+            help="Number of processes used to process templates, also the number of package processes run at once. Use 0 for one per CPU. Default is 1.",
+            default=1,
+        )
+        self._sub_parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="Rebuild every stage instead of reusing unchanged outputs from the build cache.",
+            dest="no_cache",
+            default=False,
+        )
+        self._sub_parser.add_argument(
+            "--explain-cache",
+            action="store_true",
+            help="Print which build stages were reused or rebuilt and why.",
+            dest="explain_cache",
+            default=False,
+        )
 
     def is_match(self, command: str) -> bool:
         return command == self._cmd
@@ -43,7 +64,12 @@ class RulePkgZip(SubParserBase, ProtocolSubparser):
         from ..builder.zip_builder import ZipBuilder
 
         try:
-            builder = ZipBuilder(build_version=args.build)
+            builder = ZipBuilder(
+                build_version=args.build,
+                jobs=args.jobs,
+                use_cache=not args.no_cache,
+                explain_cache=args.explain_cache,
+            )
             builder.build_package()
             print("Package build complete.")
         except Exception as e:
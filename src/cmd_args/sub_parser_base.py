@@ -8,8 +8,26 @@ class SubParserBase:
         self._add_common_arguments()
 
     def _add_common_arguments(self):
-        # this method is for future common arguments across sub-parsers
-        pass
+        self._parser_args.sub_parser.add_argument(
+            "--profile",
+            nargs="?",
+            const="",
+            default=None,
+            metavar="PATH",
+            help="Record the time of each build stage and process and the peak RSS of the command and write a JSON report to PATH. By default the report is written to the profile folder of the output folder.",
+        )
+        self._parser_args.sub_parser.add_argument(
+            "--profile-memory",
+            action="store_true",
+            help="With --profile, also trace the peak memory of each stage with tracemalloc. Tracing slows the command several times.",
+            default=False,
+        )
+        self._parser_args.sub_parser.add_argument(
+            "--profile-stats",
+            action="store_true",
+            help="With --profile, also write cProfile statistics next to the report as a .pstats file.",
+            default=False,
+        )
 
         # self._parser_args.sub_parser.add_argument("script", help="Path to the entry point script")
 
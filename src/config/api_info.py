@@ -1,7 +1,12 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from ..util.validation import check
 from .api_info_templates import ApiInfoTemplates
 from .api_env import ApiEnv
+from .api_session import ApiSession
+from .api_users import ApiUsers
+from .api_rate_limit import ApiRateLimit
+from .api_mcp_cache import ApiMcpCache
+from .api_mcp_batch import ApiMcpBatch
 
 
 @dataclass
@@ -13,6 +18,11 @@ class ApiInfo:
     description: str
     version: str
     env: ApiEnv
+    session: ApiSession = field(default_factory=ApiSession)
+    users: ApiUsers = field(default_factory=ApiUsers)
+    rate_limit: ApiRateLimit = field(default_factory=ApiRateLimit)
+    mcp_cache: ApiMcpCache = field(default_factory=ApiMcpCache)
+    mcp_batch: ApiMcpBatch = field(default_factory=ApiMcpBatch)
 
     def __post_init__(self) -> None:
         check(self.base_dir != "", f"{self}", "base_dir cannot be empty.")
@@ -5,8 +5,15 @@ from ..util.validation import check
 @dataclass
 class ApiInfoTemplates:
     dir_name: str
+    reload_check_seconds: float = 1.0
+    """Minimum seconds between checks of the templates generation marker, which reloads the templates. Zero disables reloading."""
 
     def __post_init__(self) -> None:
+        check(
+            self.reload_check_seconds >= 0,
+            f"{self}",
+            "Value of reload_check_seconds must not be negative.",
+        )
         check(
             self.dir_name != "",
             f"{self}",
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from ..util.validation import check
+
+
+@dataclass
+class ApiMcpBatch:
+    enabled: bool = True
+    """Accepts JSON-RPC 2.0 batch arrays on the MCP endpoint."""
+    max_size: int = 32
+    """Maximum number of messages in one batch."""
+    max_concurrency: int = 8
+    """Maximum number of messages of one batch executed at the same time."""
+
+    def __post_init__(self) -> None:
+        check(
+            self.max_size > 0, f"{self}", "Value of max_size must be greater than zero."
+        )
+        check(
+            self.max_concurrency > 0,
+            f"{self}",
+            "Value of max_concurrency must be greater than zero.",
+        )
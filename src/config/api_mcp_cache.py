@@ -0,0 +1,51 @@
+from dataclasses import dataclass, field
+from ..util.validation import check
+
+
+@dataclass
+class ApiMcpCache:
+    enabled: bool = True
+    """Enables result caching of the MCP tools in ``tools``."""
+    tools: list[str] = field(
+        default_factory=lambda: [
+            "get_codex_template",
+            "get_codex_template_instructions",
+            "get_codex_template_registry",
+            "get_codex_template_manifest",
+            "get_codex_template_bundle",
+            "get_codex_template_latest_version",
+            "list_codex_template_versions",
+            "list_codex_template_types",
+            "get_canonical_executor_mode",
+            "get_default_canonical_executor_mode",
+        ]
+    )
+    """
+    Names of the tools whose results are cached. Only list tools whose result depends
+    on nothing but their arguments, the caller monad name and the installed templates;
+    a tool that adds the current time to its result, or takes an artifact as argument,
+    must not be cached.
+    """
+    ttl_seconds: float = 300.0
+    """Seconds a cached tool result is served before the tool runs again."""
+    max_entries: int = 1024
+    """Maximum number of cached tool results. The least recently used are dropped first."""
+    reload_check_seconds: float = 1.0
+    """Minimum seconds between checks of the templates generation marker for a reload, which clears the cache."""
+
+    def __post_init__(self) -> None:
+        check(
+            self.ttl_seconds >= 0,
+            f"{self}",
+            "Value of ttl_seconds must not be negative.",
+        )
+        check(
+            self.max_entries >= 0,
+            f"{self}",
+            "Value of max_entries must not be negative.",
+        )
+        check(
+            self.reload_check_seconds >= 0,
+            f"{self}",
+            "Value of reload_check_seconds must not be negative.",
+        )
@@ -0,0 +1,66 @@
+from dataclasses import dataclass, field
+from ..util.validation import check
+
+
+@dataclass(frozen=True)
+class ApiRateLimitQuota:
+    requests_per_minute: float
+    """Sustained number of requests allowed per minute."""
+    burst: int
+    """Maximum number of requests that can be made at once, the bucket capacity."""
+
+    def __post_init__(self) -> None:
+        check(
+            self.requests_per_minute > 0,
+            f"{self}",
+            "Value of requests_per_minute must be greater than zero.",
+        )
+        check(self.burst > 0, f"{self}", "Value of burst must be greater than zero.")
+
+
+@dataclass
+class ApiRateLimit:
+    enabled: bool = True
+    """Enables the per-principal rate limiter."""
+    path_prefixes: list[str] = field(
+        default_factory=lambda: ["/api/", "/templates/mcp"]
+    )
+    """Only requests whose path starts with one of these prefixes are metered."""
+    max_principals: int = 100_000
+    """Maximum number of buckets kept. The least recently used buckets are dropped first."""
+    default: ApiRateLimitQuota = field(
+        default_factory=lambda: ApiRateLimitQuota(requests_per_minute=120, burst=30)
+    )
+    """Quota of authenticated users holding none of the scopes in ``scopes``."""
+    anonymous: ApiRateLimitQuota = field(
+        default_factory=lambda: ApiRateLimitQuota(requests_per_minute=30, burst=10)
+    )
+    """Quota of requests without a verified token, keyed by client address."""
+    trust_forwarded_for: bool = False
+    """
+    Keys anonymous requests by the address in the ``X-Forwarded-For`` header added by
+    the trusted proxies. Enable only behind proxies that append to the header.
+    """
+    trusted_proxy_hops: int = 1
+    """
+    Number of proxies in front of the API that append to ``X-Forwarded-For``. The
+    client address is the entry this far from the right; entries left of it are
+    sent by the client.
+    """
+    scopes: dict[str, ApiRateLimitQuota] = field(default_factory=dict)
+    """
+    Quota per scope. A user holding several of these scopes gets the quota with
+    the highest ``requests_per_minute``.
+    """
+
+    def __post_init__(self) -> None:
+        check(
+            self.max_principals > 0,
+            f"{self}",
+            "Value of max_principals must be greater than zero.",
+        )
+        check(
+            self.trusted_proxy_hops > 0,
+            f"{self}",
+            "Value of trusted_proxy_hops must be greater than zero.",
+        )
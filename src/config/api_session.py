@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+from ..util.validation import check
+
+
+@dataclass
+class ApiSession:
+    backend: str = "memory"
+    """Session backend, one of ``memory`` or ``sqlite``."""
+    sqlite_path: str = ".cache/api_sessions.sqlite3"
+    """Path of the SQLite session database. Relative paths are resolved from the project root."""
+    lru_size: int = 1024
+    """Maximum number of sessions held in the in-process read-through LRU."""
+    lru_ttl_seconds: float = 2.0
+    """Seconds a cached session is trusted before it is re-read from the shared backend."""
+    batch_size: int = 64
+    """Number of pending access updates that triggers a flush to the shared backend."""
+    batch_interval_seconds: float = 1.0
+    """Maximum seconds pending access updates are held before being flushed."""
+
+    def __post_init__(self) -> None:
+        check(
+            self.backend in ("memory", "sqlite"),
+            f"{self}",
+            "Value of backend must be 'memory' or 'sqlite'.",
+        )
+        check(
+            self.sqlite_path != "",
+            f"{self}",
+            "Value of sqlite_path must not be empty.",
+        )
+        check(self.lru_size >= 0, f"{self}", "Value of lru_size must not be negative.")
+        check(
+            self.lru_ttl_seconds >= 0,
+            f"{self}",
+            "Value of lru_ttl_seconds must not be negative.",
+        )
+        check(
+            self.batch_size > 0,
+            f"{self}",
+            "Value of batch_size must be greater than zero.",
+        )
+        check(
+            self.batch_interval_seconds >= 0,
+            f"{self}",
+            "Value of batch_interval_seconds must not be negative.",
+        )
@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from ..util.validation import check
+
+
+@dataclass
+class ApiUsers:
+    path: str = ""
+    """
+    Optional users file, ``.json`` or ``.sqlite``/``.sqlite3``/``.db``.
+    Relative paths are resolved from the project root.
+    When empty, users are read from ``API_ENV_DATA``.
+    """
+    reload_check_seconds: float = 5.0
+    """Minimum seconds between checks of the users file for changes. Zero disables reloading."""
+
+    def __post_init__(self) -> None:
+        check(
+            self.reload_check_seconds >= 0,
+            f"{self}",
+            "Value of reload_check_seconds must not be negative.",
+        )
+        if self.path:
+            check(
+                self.path.lower().endswith((".json", ".sqlite", ".sqlite3", ".db")),
+                f"{self}",
+                "Value of path must be a .json, .sqlite, .sqlite3 or .db file.",
+            )
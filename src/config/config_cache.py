@@ -33,6 +33,30 @@ class ConfigCache:
             self._cache[key] = p
         return self._cache[key]
 
+    def get_api_templates_bundle_path(self) -> Path:
+        """Get the path to the API templates bundle file."""
+        key = "api_templates_bundle_path"
+        if key not in self._cache:
+            p = (
+                self.get_api_path()
+                / self.config.api_info.info_templates.dir_name
+                / "templates.bundle"
+            )
+            self._cache[key] = p
+        return self._cache[key]
+
+    def get_api_templates_generation_path(self) -> Path:
+        """Get the path to the generation marker of the installed API templates."""
+        key = "api_templates_generation_path"
+        if key not in self._cache:
+            p = (
+                self.get_api_path()
+                / self.config.api_info.info_templates.dir_name
+                / "templates.generation"
+            )
+            self._cache[key] = p
+        return self._cache[key]
+
     def get_api_cbib_path(self) -> Path:
         """Get the path to the API templates cbib directory."""
         key = "api_cbib_path"
@@ -45,6 +69,22 @@ class ConfigCache:
             self._cache[key] = p
         return self._cache[key]
 
+    def get_build_cache_path(self) -> Path:
+        """Get the path to the build cache directory."""
+        key = "build_cache_path"
+        if key not in self._cache:
+            p = self.config.root_path / self.config.pkg_out_dir / ".build_cache"
+            self._cache[key] = p
+        return self._cache[key]
+
+    def get_profile_path(self) -> Path:
+        """Get the path to the directory of build profile reports."""
+        key = "profile_path"
+        if key not in self._cache:
+            p = self.config.root_path / self.config.pkg_out_dir / "profile"
+            self._cache[key] = p
+        return self._cache[key]
+
     def get_dist_single(self, build_number: int) -> Path:
         """Get the path to the single distribution directory for the given build number."""
         key = f"dist_single_{build_number}"
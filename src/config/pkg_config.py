@@ -6,6 +6,11 @@ import toml
 from .api_env import ApiEnv
 from .api_info import ApiInfo
 from .api_info_templates import ApiInfoTemplates
+from .api_session import ApiSession
+from .api_users import ApiUsers
+from .api_rate_limit import ApiRateLimit, ApiRateLimitQuota
+from .api_mcp_cache import ApiMcpCache
+from .api_mcp_batch import ApiMcpBatch
 from .codex_binding_contract import CodexBindingContract
 from .template_cbib_info import TemplateCbibInfo
 from .template_ceib_info import TemplateCeibInfo
@@ -218,7 +223,8 @@ class PkgConfig(metaclass=SingletonMeta):
             .get("templates", {})
         )
         api_info_templates = ApiInfoTemplates(
-            dir_name=api_config_templates.get("dir_name", "")
+            dir_name=api_config_templates.get("dir_name", ""),
+            reload_check_seconds=api_config_templates.get("reload_check_seconds", 1.0),
         )
 
         api_config_env = (
@@ -240,6 +246,71 @@ class PkgConfig(metaclass=SingletonMeta):
             .get("config", {})
             .get("api", {})
         )
+        api_config_session = api_info_data.get("session", {})
+        api_info_session = ApiSession(
+            backend=api_config_session.get("backend", "memory"),
+            sqlite_path=api_config_session.get(
+                "sqlite_path", ".cache/api_sessions.sqlite3"
+            ),
+            lru_size=api_config_session.get("lru_size", 1024),
+            lru_ttl_seconds=api_config_session.get("lru_ttl_seconds", 2.0),
+            batch_size=api_config_session.get("batch_size", 64),
+            batch_interval_seconds=api_config_session.get(
+                "batch_interval_seconds", 1.0
+            ),
+        )
+        api_config_users = api_info_data.get("users", {})
+        api_info_users = ApiUsers(
+            path=api_config_users.get("path", ""),
+            reload_check_seconds=api_config_users.get("reload_check_seconds", 5.0),
+        )
+        api_config_rate_limit = api_info_data.get("rate_limit", {})
+        api_info_rate_limit_defaults = ApiRateLimit()
+        api_info_rate_limit = ApiRateLimit(
+            enabled=api_config_rate_limit.get(
+                "enabled", api_info_rate_limit_defaults.enabled
+            ),
+            path_prefixes=api_config_rate_limit.get(
+                "path_prefixes", api_info_rate_limit_defaults.path_prefixes
+            ),
+            max_principals=api_config_rate_limit.get(
+                "max_principals", api_info_rate_limit_defaults.max_principals
+            ),
+            default=self._get_rate_limit_quota(
+                api_config_rate_limit.get("default", {}),
+                api_info_rate_limit_defaults.default,
+            ),
+            anonymous=self._get_rate_limit_quota(
+                api_config_rate_limit.get("anonymous", {}),
+                api_info_rate_limit_defaults.anonymous,
+            ),
+            trust_forwarded_for=api_config_rate_limit.get(
+                "trust_forwarded_for", api_info_rate_limit_defaults.trust_forwarded_for
+            ),
+            trusted_proxy_hops=api_config_rate_limit.get(
+                "trusted_proxy_hops", api_info_rate_limit_defaults.trusted_proxy_hops
+            ),
+            scopes={
+                scope: self._get_rate_limit_quota(
+                    quota, api_info_rate_limit_defaults.default
+                )
+                for scope, quota in api_config_rate_limit.get("scopes", {}).items()
+            },
+        )
+        api_config_mcp_cache = api_info_data.get("mcp_cache", {})
+        api_info_mcp_cache = ApiMcpCache(
+            enabled=api_config_mcp_cache.get("enabled", True),
+            tools=api_config_mcp_cache.get("tools", ApiMcpCache().tools),
+            ttl_seconds=api_config_mcp_cache.get("ttl_seconds", 300.0),
+            max_entries=api_config_mcp_cache.get("max_entries", 1024),
+            reload_check_seconds=api_config_mcp_cache.get("reload_check_seconds", 1.0),
+        )
+        api_config_mcp_batch = api_info_data.get("mcp_batch", {})
+        api_info_mcp_batch = ApiMcpBatch(
+            enabled=api_config_mcp_batch.get("enabled", True),
+            max_size=api_config_mcp_batch.get("max_size", 32),
+            max_concurrency=api_config_mcp_batch.get("max_concurrency", 8),
+        )
         self.api_info = ApiInfo(
             base_dir=api_info_data.get("base_dir", ""),
             ttl_session_cache_seconds=api_info_data.get("ttl_session_cache_seconds", 0),
@@ -248,6 +319,11 @@ class PkgConfig(metaclass=SingletonMeta):
             description=api_info_data.get("description", ""),
             version=api_info_data.get("version", ""),
             env=api_info_env,
+            session=api_info_session,
+            users=api_info_users,
+            rate_limit=api_info_rate_limit,
+            mcp_cache=api_info_mcp_cache,
+            mcp_batch=api_info_mcp_batch,
         )
 
         # Config Cache
@@ -436,6 +512,16 @@ class PkgConfig(metaclass=SingletonMeta):
         if not self._upgrade_dir:
             raise ValueError("upgrade_dir cannot be empty")
 
+    def _get_rate_limit_quota(
+        self, data: dict, default: ApiRateLimitQuota
+    ) -> ApiRateLimitQuota:
+        return ApiRateLimitQuota(
+            requests_per_minute=data.get(
+                "requests_per_minute", default.requests_per_minute
+            ),
+            burst=data.get("burst", default.burst),
+        )
+
     def _get_env_user(self) -> str:
         result = ""
         if os.getenv("CURRENT_USER") is None:
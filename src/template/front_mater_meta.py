@@ -1,3 +1,4 @@
+import copy
 from pathlib import Path
 from typing import Any
 import yaml
@@ -34,14 +35,22 @@ class FrontMatterMeta:
         new_instance._sha256 = self._sha256
         return new_instance
 
-    def copy(self) -> "FrontMatterMeta":
-        """Create a shallow copy of the FrontMatterMeta instance.
+    def copy(self, deep: bool = False) -> "FrontMatterMeta":
+        """Create a copy of the FrontMatterMeta instance.
+
+        Args:
+            deep (bool, optional): If True, nested frontmatter values are copied
+                as well, so the copy can be changed without affecting the original.
+                Defaults to False.
 
         Returns:
             FrontMatterMeta: A new instance of FrontMatterMeta with the same
             frontmatter and content as the original.
         """
-        return self.__copy__()
+        new_instance = self.__copy__()
+        if deep:
+            new_instance._frontmatter = copy.deepcopy(new_instance._frontmatter)
+        return new_instance
 
     def get_field(self, field_name: str, default: Any = None) -> Any:
         """Retrieve a value from the object's frontmatter mapping.
@@ -1,12 +1,124 @@
+import hashlib
+import os
+import pickle
+from contextlib import suppress
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 import yaml
 from ..config.pkg_config import PkgConfig
 
+_SNAPSHOT_NAME = ".mkpkg_registry_snapshot"
+_SNAPSHOT_VERSION = 1
+
+_FIELD_TYPE_MAPPING: dict[str, tuple[type, str]] = {
+    "string": (str, ""),
+    "integer": (int, ""),
+    "boolean": (bool, ""),
+    "str": (str, ""),
+    "int": (int, ""),
+    "bool": (bool, ""),
+    "float": (float, ""),
+    "number": (float, ""),
+    "num": (float, ""),
+    "list": (list, ""),
+    "dict": (dict, ""),
+    "object": (dict, ""),
+    "list[string]": (list, "str"),
+    "list[integer]": (list, "int"),
+    "list[boolean]": (list, "bool"),
+    "list[float]": (list, "float"),
+    "list[str]": (list, "str"),
+    "list[int]": (list, "int"),
+    "list[bool]": (list, "bool"),
+}
+
+
+@dataclass
+class RegistrySnapshot:
+    """
+    Compiled form of the main registry YAML with precomputed indexes.
+
+    Attributes:
+        version (int): Snapshot format version.
+        yaml_sha256 (str): Hash of the YAML the snapshot was compiled from.
+        registry (dict): Parsed registry.
+        field_py_types (dict[str, tuple[type, str]]): Python type and subtype of each
+            metadata field with a known ``field_type``.
+        fields_by_status (dict[str, frozenset[str]]): Metadata field names by ``status``.
+    """
+
+    version: int
+    yaml_sha256: str
+    registry: dict
+    field_py_types: dict[str, tuple[type, str]]
+    fields_by_status: dict[str, frozenset[str]]
+
+    @staticmethod
+    def compile(yaml_bytes: bytes, yaml_sha256: str) -> "RegistrySnapshot":
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        registry = yaml.load(yaml_bytes, Loader=loader)
+        metadata_fields: dict[str, dict[str, Any]] = registry.get("metadata_fields", {})
+        field_py_types: dict[str, tuple[type, str]] = {}
+        by_status: dict[str, set[str]] = {}
+        for name, info in metadata_fields.items():
+            if not info:
+                continue
+            field_type = info.get("field_type")
+            if field_type:
+                py_type = _FIELD_TYPE_MAPPING.get(str(field_type).lower())
+                if py_type is not None:
+                    field_py_types[name] = py_type
+            by_status.setdefault(info.get("status", "active"), set()).add(name)
+        return RegistrySnapshot(
+            version=_SNAPSHOT_VERSION,
+            yaml_sha256=yaml_sha256,
+            registry=registry,
+            field_py_types=field_py_types,
+            fields_by_status={k: frozenset(v) for k, v in by_status.items()},
+        )
+
+
+def load_registry_snapshot(
+    registry_path: Path, snapshot_path: Path
+) -> RegistrySnapshot:
+    """
+    Loads the compiled snapshot of a registry YAML, compiling it when missing or stale.
+
+    The snapshot is keyed by the SHA-256 of the YAML, so any edit to the YAML
+    recompiles it. Failing to write the snapshot is not an error.
+
+    Args:
+        registry_path (Path): Registry YAML.
+        snapshot_path (Path): Snapshot file.
+
+    Returns:
+        RegistrySnapshot: Snapshot of the registry.
+    """
+    yaml_bytes = registry_path.read_bytes()
+    yaml_sha256 = hashlib.sha256(yaml_bytes).hexdigest()
+    with suppress(Exception):
+        with snapshot_path.open("rb") as f:
+            snapshot = pickle.load(f)
+        if (
+            isinstance(snapshot, RegistrySnapshot)
+            and snapshot.version == _SNAPSHOT_VERSION
+            and snapshot.yaml_sha256 == yaml_sha256
+        ):
+            return snapshot
+    snapshot = RegistrySnapshot.compile(yaml_bytes, yaml_sha256)
+    with suppress(Exception):
+        tmp_path = snapshot_path.with_name(f"{snapshot_path.name}.{os.getpid()}.tmp")
+        with tmp_path.open("wb") as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, snapshot_path)
+    return snapshot
+
 
 class MainRegistry:
     def __init__(self, build_version: int):
         self.config = PkgConfig()
+        self._snapshot: RegistrySnapshot | None = None
         self._reg: dict = self.load_registry()
         self._build_version = build_version
         self._reg_id = ""
@@ -16,9 +128,11 @@ class MainRegistry:
 
     def load_registry(self):
         self._registry_path = self.config.root_path / self.config.reg_file
-        with open(self._registry_path, "r") as f:
-            registry_data = yaml.safe_load(f)
-        return registry_data
+        self._snapshot = load_registry_snapshot(
+            registry_path=self._registry_path,
+            snapshot_path=self.config.root_path / _SNAPSHOT_NAME,
+        )
+        return self._snapshot.registry
 
     def get_field_py_type(self, field_name: str) -> tuple[type, str] | None:
         """
@@ -36,35 +150,20 @@ class MainRegistry:
             (which may be empty), or None if the field does not exist or has no type defined.
         """
 
-        metadata_fields = self.metadata_fields
-        field_info = metadata_fields.get(field_name)
-        if not field_info:
-            return None
-        field_type_str = field_info.get("field_type")
-        if not field_type_str:
-            return None
-        type_mapping = {
-            "string": (str, ""),
-            "integer": (int, ""),
-            "boolean": (bool, ""),
-            "str": (str, ""),
-            "int": (int, ""),
-            "bool": (bool, ""),
-            "float": (float, ""),
-            "number": (float, ""),
-            "num": (float, ""),
-            "list": (list, ""),
-            "dict": (dict, ""),
-            "object": (dict, ""),
-            "list[string]": (list, "str"),
-            "list[integer]": (list, "int"),
-            "list[boolean]": (list, "bool"),
-            "list[float]": (list, "float"),
-            "list[str]": (list, "str"),
-            "list[int]": (list, "int"),
-            "list[bool]": (list, "bool"),
-        }
-        return type_mapping.get(field_type_str.lower())
+        return self.snapshot.field_py_types.get(field_name)
+
+    def get_fields_by_status(self, status: str) -> frozenset[str]:
+        """
+        Gets the names of the metadata fields with a given status.
+
+        Args:
+            status (str): Status such as ``active`` or ``deprecated``. Fields without
+                a status are ``active``.
+
+        Returns:
+            frozenset[str]: Field names.
+        """
+        return self.snapshot.fields_by_status.get(status, frozenset())
 
     # region Properties
     @property
@@ -128,4 +227,16 @@ class MainRegistry:
         """Gets the metadata fields from the registry data."""
         return self._reg.get("metadata_fields", {})
 
+    @property
+    def deprecated_fields(self) -> frozenset[str]:
+        """Gets the names of the deprecated metadata fields."""
+        return self.get_fields_by_status("deprecated")
+
+    @property
+    def snapshot(self) -> RegistrySnapshot:
+        """Gets the compiled registry snapshot."""
+        if self._snapshot is None:
+            self._reg = self.load_registry()
+        return self._snapshot  # type: ignore[return-value]
+
     # endregion Properties
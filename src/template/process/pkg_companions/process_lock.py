@@ -103,24 +103,36 @@ class ProcessLock(ProtocolProcess):
         lockfile["templates"] = {}
         return lockfile
 
+    def _get_companion_sha(
+        self, tokens: dict, process: ProcessRegistry | ProcessTemplateRegistry
+    ) -> str | None:
+        # companions rendered in memory pass their hashes; otherwise read the file
+        hashes = cast(dict[str, str], tokens.get("COMPANION_SHA256", {}))
+        digest = hashes.get(process.get_process_name())
+        if digest is not None:
+            return digest
+        file_path = process.get_dest_path(tokens=tokens)
+        if file_path.exists():
+            return sha.compute_file_sha256(file_path)
+        return None
+
     def _update_registry_sha(self, tokens: dict, lockfile: dict) -> None:
         reg = ProcessRegistry(self._workspace_dir, self._main_registry)
-        reg_path = reg.get_dest_path(tokens=tokens)
-        if reg_path.exists():
-            lockfile["registry_sources"][self.config.template_hash_field_name] = (
-                sha.compute_file_sha256(reg_path)
-            )
+        digest = self._get_companion_sha(tokens, reg)
+        if digest is not None:
+            lockfile["registry_sources"][self.config.template_hash_field_name] = digest
         else:
-            del lockfile[["registry_sources"]][self.config.template_hash_field_name]
+            del lockfile["registry_sources"][self.config.template_hash_field_name]
             print(
-                f"Unable to calculate sha256 for registry file. File {reg_path.name} not found!"
+                f"Unable to calculate sha256 for registry file. File {reg.get_dest_path(tokens=tokens).name} not found!"
             )
 
     def _update_manifest_info(self, tokens: dict, lockfile: dict) -> None:
         reg = ProcessTemplateRegistry(self._workspace_dir, self._main_registry)
         manifest_path = reg.get_dest_path(tokens=tokens)
-        if manifest_path.exists():
-            lockfile["manifest_sha256"] = sha.compute_file_sha256(manifest_path)
+        digest = self._get_companion_sha(tokens, reg)
+        if digest is not None:
+            lockfile["manifest_sha256"] = digest
             lockfile["manifest_file_name"] = manifest_path.name
         else:
             del lockfile["manifest_sha256"]
@@ -174,29 +186,48 @@ class ProcessLock(ProtocolProcess):
 
             self._build_lockfile_templates(fm.file_path, fm, lockfile)
 
-    def process(self, tokens: dict) -> Path:
+    def render(self, tokens: dict) -> tuple[str, bytes]:
         """
-        Process the README source file and return its content as a string.
+        Render the lockfile without writing it.
         Args:
-            tokens (dict): A dictionary of tokens to replace in the README.
+            tokens (dict): A dictionary of tokens to replace in the lockfile.
         Returns:
-            Path: The path to the processed README file.
+            tuple[str, bytes]: The file name and content of the processed lockfile.
         """
 
         self._validate_tokens(tokens)
 
-        file_path = (
-            self._workspace_dir
-            / f"{self.config.lock_file_name}-{tokens['VER']}{self.config.lock_file_ext}"
+        file_name = (
+            f"{self.config.lock_file_name}-{tokens['VER']}{self.config.lock_file_ext}"
         )
         lockfile = self._build_lockfile(tokens)
         self._process_templates_data(lockfile, tokens)
 
-        with open(file_path, "w") as lockfile_f:
-            yaml.dump(lockfile, lockfile_f, Dumper=yaml.Dumper, sort_keys=False)
+        text = yaml.dump(lockfile, Dumper=yaml.Dumper, sort_keys=False)
+        return file_name, text.encode("utf-8")
 
+    def process(self, tokens: dict) -> Path:
+        """
+        Process the lockfile and write it to the workspace.
+        Args:
+            tokens (dict): A dictionary of tokens to replace in the lockfile.
+        Returns:
+            Path: The path to the processed lockfile file.
+        """
+        file_name, data = self.render(tokens)
+        file_path = self._workspace_dir / file_name
+        file_path.write_bytes(data)
         return file_path
 
+    def get_inputs(self) -> set[str]:
+        """
+        Gets the outputs of other processes this process reads.
+
+        Returns:
+            set[str]: ``registry`` and ``manifest``, hashed into the lockfile.
+        """
+        return {"registry", "manifest"}
+
     def get_process_name(self) -> str:
         """
         Gets the process name for this instance
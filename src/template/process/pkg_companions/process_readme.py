@@ -125,13 +125,13 @@ class ProcessReadme(ProtocolProcess):
 
         return s
 
-    def process(self, tokens: dict) -> Path:
+    def render(self, tokens: dict) -> tuple[str, bytes]:
         """
-        Process the README source file and return its content as a string.
+        Render the README without writing it.
         Args:
             tokens (dict): A dictionary of tokens to replace in the README.
         Returns:
-            Path: The path to the processed README file.
+            tuple[str, bytes]: The file name and content of the processed README.
         """
         if not self.file_src.exists():
             raise FileNotFoundError(f"README source file not found: {self.file_src}")
@@ -142,8 +142,20 @@ class ProcessReadme(ProtocolProcess):
         self._update_front_matter(fm.frontmatter, tokens)
         fm.content = self._update_content(fm.content, tokens)
 
-        file_path = self._workspace_dir / f"README-{tokens['VER']}.md"
-        fm.write_template(file_path)
+        file_name = f"README-{tokens['VER']}.md"
+        return file_name, fm.get_template_text().encode("utf-8")
+
+    def process(self, tokens: dict) -> Path:
+        """
+        Process the README and write it to the workspace.
+        Args:
+            tokens (dict): A dictionary of tokens to replace in the README.
+        Returns:
+            Path: The path to the processed README file.
+        """
+        file_name, data = self.render(tokens)
+        file_path = self._workspace_dir / file_name
+        file_path.write_bytes(data)
         return file_path
 
     def get_process_name(self) -> str:
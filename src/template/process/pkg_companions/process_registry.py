@@ -203,18 +203,17 @@ class ProcessRegistry(ProtocolProcess):
             "enforce_in_all_templates": True,
         }
 
-    def process(self, tokens: dict) -> Path:
+    def render(self, tokens: dict) -> tuple[str, bytes]:
         """
-        Process the Registry source file and return its content as a string.
+        Render the registry without writing it.
         Args:
-            tokens (dict): A dictionary of tokens to replace in the README.
+            tokens (dict): A dictionary of tokens to replace in the registry.
         Returns:
-            Path: The path to the processed README file.
+            tuple[str, bytes]: The file name and content of the processed registry.
         """
         if not self.file_src.exists():
             raise FileNotFoundError(f"README source file not found: {self.file_src}")
         self._validate_tokens(tokens)
-        file_path = self._workspace_dir / self.file_src.name
         # copy source to destination
         with self.file_src.open("r", encoding="utf-8") as f_src:
             mmr = yaml.safe_load(f_src)
@@ -240,10 +239,31 @@ class ProcessRegistry(ProtocolProcess):
         template_families = self._get_template_families(tokens)
         mmr["template_families"] = template_families
 
-        with file_path.open("w", encoding="utf-8") as f_dest:
-            yaml.safe_dump(mmr, f_dest, sort_keys=False)
+        text = yaml.safe_dump(mmr, sort_keys=False)
+        return self.file_src.name, text.encode("utf-8")
+
+    def process(self, tokens: dict) -> Path:
+        """
+        Process the registry and write it to the workspace.
+        Args:
+            tokens (dict): A dictionary of tokens to replace in the registry.
+        Returns:
+            Path: The path to the processed registry file.
+        """
+        file_name, data = self.render(tokens)
+        file_path = self._workspace_dir / file_name
+        file_path.write_bytes(data)
         return file_path
 
+    def get_outputs(self) -> set[str]:
+        """
+        Gets the outputs this process produces for other processes.
+
+        Returns:
+            set[str]: ``registry``, read by the lockfile.
+        """
+        return {"registry"}
+
     def get_process_name(self) -> str:
         """
         Gets the process name for this instance
@@ -128,25 +128,45 @@ class ProcessTemplateRegistry(ProtocolProcess):
             reg_dict["template_manifest_registry"]["template_count"] += 1
             template_ids.append(fm.template_id)
 
-    def process(self, tokens: dict) -> Path:
+    def render(self, tokens: dict) -> tuple[str, bytes]:
         """
-        Process the README source file and return its content as a string.
+        Render the manifest without writing it.
         Args:
-            tokens (dict): A dictionary of tokens to replace in the README.
+            tokens (dict): A dictionary of tokens to replace in the manifest.
         Returns:
-            Path: The path to the processed README file.
+            tuple[str, bytes]: The file name and content of the processed manifest.
         """
         self._validate_tokens(tokens)
 
-        file_path = self.get_dest_path(tokens)
+        file_name = self.get_dest_path(tokens).name
 
         manifest = self._build_registry(tokens)
 
-        with open(file_path, "w") as manifest_f:
-            yaml.dump(manifest, manifest_f, Dumper=yaml.Dumper, sort_keys=False)
+        text = yaml.dump(manifest, Dumper=yaml.Dumper, sort_keys=False)
+        return file_name, text.encode("utf-8")
 
+    def process(self, tokens: dict) -> Path:
+        """
+        Process the manifest and write it to the workspace.
+        Args:
+            tokens (dict): A dictionary of tokens to replace in the manifest.
+        Returns:
+            Path: The path to the processed manifest file.
+        """
+        file_name, data = self.render(tokens)
+        file_path = self._workspace_dir / file_name
+        file_path.write_bytes(data)
         return file_path
 
+    def get_outputs(self) -> set[str]:
+        """
+        Gets the outputs this process produces for other processes.
+
+        Returns:
+            set[str]: ``manifest``, read by the lockfile.
+        """
+        return {"manifest"}
+
     def get_process_name(self) -> str:
         """
         Gets the process name for this instance
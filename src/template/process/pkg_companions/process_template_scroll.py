@@ -52,13 +52,13 @@ class ProcessTemplateScroll(ProtocolProcess):
 
         return s
 
-    def process(self, tokens: dict) -> Path:
+    def render(self, tokens: dict) -> tuple[str, bytes]:
         """
-        Process the README source file and return its content as a string.
+        Render the template scroll without writing it.
         Args:
-            tokens (dict): A dictionary of tokens to replace in the README.
+            tokens (dict): A dictionary of tokens to replace in the template scroll.
         Returns:
-            Path: The path to the processed README file.
+            tuple[str, bytes]: The file name and content of the processed template scroll.
         """
         if not self.file_src.exists():
             raise FileNotFoundError(f"README source file not found: {self.file_src}")
@@ -69,13 +69,20 @@ class ProcessTemplateScroll(ProtocolProcess):
         self._update_front_matter(fm.frontmatter, tokens)
         fm.content = self._update_content(fm.content, tokens)
 
-        fm.file_path
+        file_name = f"{self.file_src.stem}-{tokens['VER']}{self.file_src.suffix}"
+        return file_name, fm.get_template_text().encode("utf-8")
 
-        file_path = (
-            self._workspace_dir
-            / f"{self.file_src.stem}-{tokens['VER']}{self.file_src.suffix}"
-        )
-        fm.write_template(file_path)
+    def process(self, tokens: dict) -> Path:
+        """
+        Process the template scroll and write it to the workspace.
+        Args:
+            tokens (dict): A dictionary of tokens to replace in the template scroll.
+        Returns:
+            Path: The path to the processed template scroll file.
+        """
+        file_name, data = self.render(tokens)
+        file_path = self._workspace_dir / file_name
+        file_path.write_bytes(data)
         return file_path
 
     def get_process_name(self) -> str:
@@ -1,5 +1,8 @@
+import hashlib
 import tempfile
+from functools import partial
 from pathlib import Path
+from typing import Any, Callable
 from .protocol_process import ProtocolProcess
 from .process_readme import ProcessReadme
 from .process_template_scroll import ProcessTemplateScroll
@@ -7,6 +10,7 @@ from .process_lock import ProcessLock
 from .process_registry import ProcessRegistry
 from .process_template_registry import ProcessTemplateRegistry
 from ...main_registry import MainRegistry
+from ....builder.process_scheduler import ProcessScheduler, ProcessTiming
 
 
 class PkgCompanionsProcessor:
@@ -17,11 +21,15 @@ class PkgCompanionsProcessor:
     Notes:
         - Writes lockfiles, readme, and protocol scroll to a temporary workspace directory.
         - Provides methods to register, unregister, and execute processes.
+        - Processes run in the order of their declared inputs and outputs; with more
+          than one job, independent processes run concurrently.
     """
 
-    def __init__(self, registry: MainRegistry):
+    def __init__(self, registry: MainRegistry, jobs: int = 1):
         self._workspace_dir = Path(tempfile.mkdtemp(prefix="pkg_companions_"))
         self._main_registry = registry
+        self._jobs = jobs
+        self._timings: list[ProcessTiming] = []
         self._processes: list[ProtocolProcess] = []
         self._register_default_processes()
 
@@ -74,8 +82,8 @@ class PkgCompanionsProcessor:
 
         Notes:
             - Each registered process is invoked once.
-            - If multiple processes return the same process name, later results will
-            overwrite earlier ones in the returned dictionary.
+            - Process names must be unique; a duplicate name raises ValueError.
+            - A process starts after the processes producing its declared inputs.
             - Side effects (file creation, network I/O, etc.) are performed by the
             individual processes and are not handled by this method.
         """
@@ -84,13 +92,66 @@ class PkgCompanionsProcessor:
             raise RuntimeError(
                 "No processes registered to execute. Has cleanup been called?"
             )
-        results = {}
+        return self._run_all(lambda process: process.process(tokens))
+
+    def render_all(self, tokens: dict) -> dict[str, tuple[str, bytes]]:
+        """
+        Render all registered processes in memory without writing their files.
+
+        Processes are rendered in the order of their declared inputs and outputs.
+        The SHA-256 of each rendered file is passed to dependent processes in the ``COMPANION_SHA256`` token, keyed by
+        process name, so the lockfile can hash the registry and manifest without
+        reading them from disk.
+
+        Args:
+            tokens (dict): A mapping of tokens that is passed to each process. It is
+                not modified.
+
+        Returns:
+            dict[str, tuple[str, bytes]]: A dictionary mapping process names to the
+            file name and content rendered by the corresponding process.
+
+        Raises:
+            RuntimeError: If no processes are registered to execute.
+        """
+
+        if not self._processes:
+            raise RuntimeError(
+                "No processes registered to execute. Has cleanup been called?"
+            )
+        hashes: dict[str, str] = {}
+        render_tokens = {**tokens, "COMPANION_SHA256": hashes}
+
+        def render(process: ProtocolProcess) -> tuple[str, bytes]:
+            file_name, data = process.render(render_tokens)
+            # set before dependent processes start
+            hashes[process.get_process_name()] = hashlib.sha256(data).hexdigest()
+            return file_name, data
+
+        return self._run_all(render)
+
+    def _run_all(self, run: Callable[[ProtocolProcess], Any]) -> dict[str, Any]:
+        scheduler = ProcessScheduler(jobs=self._jobs)
         for process in self._processes:
-            print(f"Processing Package Companion: {process.get_process_name()}")
-            result_path = process.process(tokens)
-            results[process.get_process_name()] = result_path
+            scheduler.add(
+                name=process.get_process_name(),
+                run=partial(run, process),
+                inputs=process.get_inputs(),
+                outputs=process.get_outputs(),
+            )
+        results = scheduler.run()
+        self._timings = scheduler.timings
+        for timing in self._timings:
+            print(
+                f"Processed Package Companion: {timing.name} in {timing.seconds:.3f}s"
+            )
         return results
 
+    @property
+    def timings(self) -> list[ProcessTiming]:
+        """Gets the time of each process of the last execution."""
+        return self._timings
+
     def unregister_all(self) -> None:
         """Unregister all processes from the registry.
         Clears the internal _processes collection so that no previously
@@ -5,6 +5,17 @@ from ...main_registry import MainRegistry
 
 class ProtocolProcess(Protocol):
     def __init__(self, worksapce_dir: Path | str, registry: MainRegistry): ...
+    def render(self, tokens: dict) -> tuple[str, bytes]:
+        """Render the processed file without writing it.
+
+        Args:
+            tokens (dict): A dictionary of tokens to be used in processing.
+
+        Returns:
+            tuple[str, bytes]: The file name and content of the processed file.
+        """
+        ...
+
     def process(self, tokens: dict) -> Path:
         """Process method to be implemented by classes adhering to this protocol.
 
@@ -24,3 +35,21 @@ class ProtocolProcess(Protocol):
             str: Process Name
         """
         ...
+
+    def get_inputs(self) -> set[str]:
+        """
+        Gets the outputs of other processes this process reads.
+
+        Returns:
+            set[str]: Output names. Defaults to none.
+        """
+        return set()
+
+    def get_outputs(self) -> set[str]:
+        """
+        Gets the outputs this process produces for other processes.
+
+        Returns:
+            set[str]: Output names. Defaults to none.
+        """
+        return set()
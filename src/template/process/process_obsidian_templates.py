@@ -1,19 +1,40 @@
+import os
 import re
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from typing import Any
 
 from pathlib import Path
 from ...config.pkg_config import PkgConfig
+from ...builder.build_cache import BuildCache, CacheDecision, file_fingerprint
 from ..obsidian_editor import ObsidianEditor
 from ..front_mater_meta import FrontMatterMeta
 
 
 class ProcessObsidianTemplates:
-    def __init__(self):
+    def __init__(self, jobs: int = 1, build_cache: BuildCache | None = None):
+        """
+        Args:
+            jobs (int, optional): Worker processes used to process templates.
+                ``1`` processes them in this process, ``0`` uses one per CPU. Defaults to 1.
+            build_cache (BuildCache, optional): Reuses processed templates whose inputs
+                are unchanged. Defaults to None.
+        """
         self.config = PkgConfig()
+        self._jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self._build_cache = build_cache
         self._tmp_dir = tempfile.TemporaryDirectory()
         self._tmp_path = Path(self._tmp_dir.name)
 
+    def __getstate__(self) -> dict[str, Any]:
+        # only the settings are sent to worker processes, which load their own config
+        return {"_jobs": self._jobs, "_build_cache": self._build_cache}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.config = PkgConfig()
+
     def _validate_tokens(self, kw: dict) -> None:
         required_tokens = set(
             [
@@ -28,71 +49,147 @@ class ProcessObsidianTemplates:
             if token not in kw:
                 raise ValueError(f"Missing required token: {token}")
 
-    def _process_templates(
-        self, tmp_dir: Path, tokens: dict[str, Any]
-    ) -> list[FrontMatterMeta]:
-        processed_templates = []
+    def _get_template_files(self) -> list[Path]:
+        files: list[Path] = []
         for dir_name in self.config.template_dirs:
             dir_path = self.config.root_path / dir_name
             if dir_path.exists() and dir_path.is_dir():
-                for file_path in dir_path.glob("*.md"):
-                    fm_dict, content = ObsidianEditor().read_template(file_path)
-                    clean_content = self.remove_line_comments(content)
-                    clean_content = clean_content.lstrip()
-                    if fm_dict is None:
-                        print(f"Skipping file without frontmatter: {file_path.name}")
-                        continue
-                    print(f"Processing template: {file_path.name}")
-                    fm = FrontMatterMeta.from_frontmatter_dict(
-                        file_path, fm_dict, clean_content
-                    )
-                    if not fm.has_field("template_id"):
-                        continue
-                    for key, value in tokens.items():
-                        fm.set_field(key, value)
-                    info = self.config.templates_config_info.tci_items.get(
-                        fm.template_type, None
-                    )
-                    if info is None:
-                        raise ValueError(
-                            f"Template type '{fm.template_type}' not found in configuration. Ensure it is defined in the templates section of pyproject.toml."
-                        )
+                files.extend(dir_path.glob("*.md"))
+        return files
 
-                    new_file_name = (
-                        f"{file_path.stem}-v{info.template_version}{file_path.suffix}"
-                    )
-                    new_file_path = tmp_dir / new_file_name
-                    fm.set_field(
-                        "template_id", (f"{info.template_id}-V{info.template_version}")
-                    )
-                    fm.set_field("template_name", info.template_name)
-                    fm.set_field("template_category", info.template_category)
-                    fm.set_field("template_version", info.template_version)
-                    fm.set_field("template_family", info.template_family)
-                    fm.set_field("template_type", info.template_type)
-                    fm.set_field("template_filename", new_file_name)
-
-                    for (
-                        field
-                    ) in self.config.template_config.apply_config_template_fields_zip:
-                        if field in self.config.template_config.tp_cfg:
-                            fm.set_field(
-                                field, self.config.template_config.tp_cfg[field]
-                            )
-
-                    # self.config.template_config.update_yaml_dict(fm.frontmatter)
-                    self._add_template_fields_declared(fm)
-                    # Force recalculation of SHA256 after frontmatter changes
-                    # It is important that this comes after updating the frontmatter
-                    fm.recompute_sha256()
-                    ObsidianEditor().write_template(
-                        new_file_path, fm.frontmatter, clean_content
-                    )
-                    processed_templates.append(
-                        FrontMatterMeta.from_frontmatter_dict(
-                            new_file_path, fm.frontmatter, clean_content
-                        )
+    def _process_file(
+        self, file_path: Path, tmp_dir: Path, tokens: dict[str, Any]
+    ) -> tuple[str, tuple[Path, dict[str, Any], str] | None, CacheDecision | None]:
+        """Process a single template file, reusing the build cache when there is one.
+
+        Runs in a worker process in parallel mode, so it returns plain data rather
+        than printing, recording cache decisions or creating ``FrontMatterMeta`` instances.
+
+        Args:
+            file_path (Path): Template file to process.
+            tmp_dir (Path): Directory the processed template is written to.
+            tokens (dict[str, Any]): Key-value pairs to set in the frontmatter.
+
+        Returns:
+            tuple[str, tuple[Path, dict[str, Any], str] | None, CacheDecision | None]:
+            Progress message, the written file path, frontmatter and content, or None
+            if the file is skipped, and the cache decision if there is a build cache.
+        """
+        if self._build_cache is None:
+            return (*self._build_file(file_path, tmp_dir, tokens), None)
+
+        def build() -> tuple[list[Path], Any]:
+            message, processed = self._build_file(file_path, tmp_dir, tokens)
+            if processed is None:
+                return [], (message, None)
+            new_file_path, frontmatter, content = processed
+            return [new_file_path], (message, (frontmatter, content))
+
+        template_config = self.config.template_config
+        paths, (message, parts), decision = self._build_cache.run(
+            stage="process",
+            name=file_path.name,
+            inputs={
+                "source": file_fingerprint(file_path),
+                # the output file is named after the source file
+                "source_name": file_path.name,
+                "tokens": tokens,
+                "templates_config": self.config.templates_config_info.tci_items,
+                "config_fields": {
+                    field: template_config.tp_cfg.get(field)
+                    for field in template_config.apply_config_template_fields_zip
+                },
+            },
+            dest_dir=tmp_dir,
+            build=build,
+        )
+        processed = None if parts is None else (paths[0], *parts)
+        return message, processed, decision
+
+    def _build_file(
+        self, file_path: Path, tmp_dir: Path, tokens: dict[str, Any]
+    ) -> tuple[str, tuple[Path, dict[str, Any], str] | None]:
+        """Process a single template file and write it into ``tmp_dir``.
+
+        Args:
+            file_path (Path): Template file to process.
+            tmp_dir (Path): Directory the processed template is written to.
+            tokens (dict[str, Any]): Key-value pairs to set in the frontmatter.
+
+        Returns:
+            tuple[str, tuple[Path, dict[str, Any], str] | None]: Progress message and
+            the written file path, frontmatter and content, or None if the file is skipped.
+        """
+        fm_dict, content = ObsidianEditor().read_template(file_path)
+        clean_content = self.remove_line_comments(content)
+        clean_content = clean_content.lstrip()
+        if fm_dict is None:
+            return f"Skipping file without frontmatter: {file_path.name}", None
+        message = f"Processing template: {file_path.name}"
+        fm = FrontMatterMeta.from_frontmatter_dict(file_path, fm_dict, clean_content)
+        if not fm.has_field("template_id"):
+            return message, None
+        for key, value in tokens.items():
+            fm.set_field(key, value)
+        info = self.config.templates_config_info.tci_items.get(fm.template_type, None)
+        if info is None:
+            raise ValueError(
+                f"Template type '{fm.template_type}' not found in configuration. Ensure it is defined in the templates section of pyproject.toml."
+            )
+
+        new_file_name = f"{file_path.stem}-v{info.template_version}{file_path.suffix}"
+        new_file_path = tmp_dir / new_file_name
+        fm.set_field("template_id", (f"{info.template_id}-V{info.template_version}"))
+        fm.set_field("template_name", info.template_name)
+        fm.set_field("template_category", info.template_category)
+        fm.set_field("template_version", info.template_version)
+        fm.set_field("template_family", info.template_family)
+        fm.set_field("template_type", info.template_type)
+        fm.set_field("template_filename", new_file_name)
+
+        for field in self.config.template_config.apply_config_template_fields_zip:
+            if field in self.config.template_config.tp_cfg:
+                fm.set_field(field, self.config.template_config.tp_cfg[field])
+
+        # self.config.template_config.update_yaml_dict(fm.frontmatter)
+        self._add_template_fields_declared(fm)
+        # Force recalculation of SHA256 after frontmatter changes
+        # It is important that this comes after updating the frontmatter
+        fm.recompute_sha256()
+        ObsidianEditor().write_template(new_file_path, fm.frontmatter, clean_content)
+        return message, (new_file_path, fm.frontmatter, clean_content)
+
+    def _process_templates(
+        self, tmp_dir: Path, tokens: dict[str, Any]
+    ) -> list[FrontMatterMeta]:
+        files = self._get_template_files()
+        if self._jobs == 1 or len(files) < 2:
+            results = [self._process_file(f, tmp_dir, tokens) for f in files]
+        else:
+            # map() keeps the order of files, so results match the serial mode
+            with ProcessPoolExecutor(max_workers=min(self._jobs, len(files))) as pool:
+                results = list(
+                    pool.map(
+                        self._process_file,
+                        files,
+                        repeat(tmp_dir),
+                        repeat(tokens),
+                        chunksize=max(1, len(files) // (self._jobs * 4)),
                     )
+                )
+        processed_templates = []
+        for message, processed, decision in results:
+            print(message)
+            if decision is not None and self._build_cache is not None:
+                self._build_cache.record(decision)
+            if processed is None:
+                continue
+            new_file_path, frontmatter, content = processed
+            processed_templates.append(
+                FrontMatterMeta.from_frontmatter_dict(
+                    new_file_path, frontmatter, content
+                )
+            )
         return processed_templates
 
     def remove_line_comments(self, markdown_content: str) -> str:
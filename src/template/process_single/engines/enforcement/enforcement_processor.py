@@ -1,6 +1,8 @@
 from pathlib import Path
+from functools import partial
 from ....front_mater_meta import FrontMatterMeta
 from ....main_registry import MainRegistry
+from .....builder.process_scheduler import ProcessScheduler, ProcessTiming
 from .protocol_enforcement import ProtocolEnforcement
 from .enforcement_canonical_executor_mode_readme import (
     EnforcementCanonicalExecutorModeReadme,
@@ -16,6 +18,8 @@ class EnforcementProcessor:
     Notes:
         - Writes template registry workspace directory.
         - Provides methods to register, unregister, and execute processes.
+        - Processes run in the order of their declared inputs and outputs; with more
+          than one job, independent processes run concurrently.
     """
 
     def __init__(
@@ -23,8 +27,11 @@ class EnforcementProcessor:
         workspace_dir: Path,
         registry: MainRegistry,
         templates_data: dict[str, FrontMatterMeta],
+        jobs: int = 1,
     ):
         self._workspace_dir = workspace_dir
+        self._jobs = jobs
+        self._timings: list[ProcessTiming] = []
         self._main_registry = registry
         self._processes: list[ProtocolEnforcement] = []
         self._templates_data = templates_data
@@ -67,8 +74,8 @@ class EnforcementProcessor:
 
         Notes:
             - Each registered process is invoked once.
-            - If multiple processes return the same process name, later results will
-            overwrite earlier ones in the returned dictionary.
+            - Processes are named by class; two processes of the same class raise ValueError.
+            - A process starts after the processes producing its declared inputs.
             - Side effects (file creation, network I/O, etc.) are performed by the
             individual processes and are not handled by this method.
         """
@@ -77,13 +84,25 @@ class EnforcementProcessor:
             raise RuntimeError(
                 "No processes registered to execute. Has cleanup been called?"
             )
-        results = []
+        scheduler = ProcessScheduler(jobs=self._jobs)
         for process in self._processes:
-            result_path = process.process(tokens)
-            results.append(result_path)
-            print(f"Processed Enforcement: {result_path.name}")
+            scheduler.add(
+                name=type(process).__name__,
+                run=partial(process.process, tokens),
+                inputs=process.get_inputs(),
+                outputs=process.get_outputs(),
+            )
+        results = list(scheduler.run().values())
+        self._timings = scheduler.timings
+        for timing, result_path in zip(self._timings, results):
+            print(f"Processed Enforcement: {result_path.name} in {timing.seconds:.3f}s")
         return results
 
+    @property
+    def timings(self) -> list[ProcessTiming]:
+        """Gets the time of each process of the last execution."""
+        return self._timings
+
     def unregister_all(self) -> None:
         """Unregister all processes from the registry.
         Clears the internal _processes collection so that no previously
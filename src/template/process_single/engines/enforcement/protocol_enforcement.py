@@ -14,3 +14,21 @@ class ProtocolEnforcement(Protocol):
     ): ...
 
     def process(self, tokens: dict[str, Any]) -> Path: ...
+
+    def get_inputs(self) -> set[str]:
+        """
+        Gets the outputs of other processes this process reads.
+
+        Returns:
+            set[str]: Output names. Defaults to none.
+        """
+        return set()
+
+    def get_outputs(self) -> set[str]:
+        """
+        Gets the outputs this process produces for other processes.
+
+        Returns:
+            set[str]: Output names. Defaults to none.
+        """
+        return set()
@@ -14,3 +14,26 @@ class ProtocolTemplateReg(Protocol):
     ): ...
 
     def process(self, tokens: dict[str, Any]) -> tuple[str, Path]: ...
+
+    def get_cache_inputs(self, tokens: dict[str, Any]) -> dict[str, Any]: ...
+
+    @property
+    def template_type(self) -> str: ...
+
+    def get_inputs(self) -> set[str]:
+        """
+        Gets the outputs of other processes this process reads.
+
+        Returns:
+            set[str]: Output names. Defaults to none.
+        """
+        return set()
+
+    def get_outputs(self) -> set[str]:
+        """
+        Gets the outputs this process produces for other processes.
+
+        Returns:
+            set[str]: Output names. Defaults to none.
+        """
+        return set()
@@ -4,7 +4,9 @@ import yaml
 from ....main_registry import MainRegistry
 from .....config.pkg_config import PkgConfig
 from ....front_mater_meta import FrontMatterMeta
+from .....builder.build_cache import file_fingerprint
 from ....prompt.meta_helpers.prompt_meta_type import PromptMetaType, TemplateEntry
+from ....prompt.meta_helpers.metadata_cache import MetadataCache
 
 
 class TemplateBase:
@@ -14,8 +16,10 @@ class TemplateBase:
         main_registry: MainRegistry,
         templates_meta: dict[str, dict[str, Any]],
         template_front_matter: FrontMatterMeta,
+        metadata_cache: MetadataCache | None = None,
     ):
         self.__working_dir = working_dir
+        self.__metadata_cache = metadata_cache or MetadataCache()
         self.__main_registry = main_registry
         self.__config = PkgConfig()
         self.__meta = templates_meta.get(template_front_matter.template_type, {})
@@ -26,10 +30,43 @@ class TemplateBase:
         self.__fm = self._get_filtered_front_matter(template_front_matter)
 
     def _load_prompt_meta_type(self) -> PromptMetaType:
-        tfbm_path = self.config.root_path / self.config.template_field_being_map_src
-        prompt_meta_type = PromptMetaType.from_yaml(tfbm_path)
+        prompt_meta_type = self.__metadata_cache.get_prompt_meta_type(
+            self._get_tfbm_path()
+        )
         return prompt_meta_type
 
+    def _get_tfbm_path(self) -> Path:
+        return self.config.root_path / self.config.template_field_being_map_src
+
+    def get_cache_inputs(self, tokens: dict[str, Any]) -> dict[str, Any]:
+        """
+        Gets the inputs that determine the written registry, for the build cache.
+
+        Args:
+            tokens (dict[str, Any]): Tokens passed to ``process()``.
+
+        Returns:
+            dict[str, Any]: Named inputs.
+        """
+        metadata_fields = self.main_registry.metadata_fields
+        return {
+            "template": {
+                "frontmatter": self.fm.frontmatter,
+                "content": self.fm.content,
+            },
+            "template_config": self.tci,
+            "template_meta": self.template_meta,
+            "master_registry": {
+                key: metadata_fields[key]
+                for key in self.fm.frontmatter
+                if key in metadata_fields
+            },
+            "field_being_map": file_fingerprint(self._get_tfbm_path()),
+            "placeholder": self.config.template_config.placeholder,
+            "env_user": self.config.env_user,
+            "tokens": tokens,
+        }
+
     def _get_filtered_front_matter(self, orig_fm: FrontMatterMeta) -> FrontMatterMeta:
         omitted_fields = self.tci.single_fields_omitted
         filtered_fm = {
@@ -266,11 +303,14 @@ class TemplateBase:
 
         return result
 
-    def _write_yaml_file(self, data: dict[str, Any]) -> Path:
-        output_path = (
+    def _get_file_path(self) -> Path:
+        return (
             self.working_dir
             / f"{self.fm.template_type}-template-v{self.fm.template_version}-registry.yml"
         )
+
+    def _write_yaml_file(self, data: dict[str, Any]) -> Path:
+        output_path = self._get_file_path()
         with open(output_path, "w") as f:
             yaml.dump(data, f, sort_keys=False)
         # print(f"Generated registry file: {output_path.name}")
@@ -300,6 +340,10 @@ class TemplateBase:
     def working_dir(self) -> Path:
         return self.__working_dir
 
+    @property
+    def template_type(self) -> str:
+        return self.tci.template_type
+
     @property
     def prompt_meta_type(self) -> PromptMetaType:
         return self.__prompt_meta_type
@@ -1,8 +1,11 @@
+from functools import partial
 from typing import Any
 from pathlib import Path
 
 from ....front_mater_meta import FrontMatterMeta
 from ....main_registry import MainRegistry
+from .....builder.build_cache import BuildCache
+from .....builder.process_scheduler import ProcessScheduler, ProcessTiming
 from .protocol_template_reg import ProtocolTemplateReg
 from .template_glyph import TemplateGlyph
 from .template_field_certificate import TemplateFieldCertificate
@@ -25,6 +28,8 @@ class TemplateRegistryProcessor:
     Notes:
         - Writes template registry workspace directory.
         - Provides methods to register, unregister, and execute processes.
+        - Processes run in the order of their declared inputs and outputs; with more
+          than one job, independent processes run concurrently.
     """
 
     def __init__(
@@ -33,8 +38,13 @@ class TemplateRegistryProcessor:
         registry: MainRegistry,
         templates_meta: dict[str, dict[str, Any]],
         templates_data: dict[str, FrontMatterMeta],
+        build_cache: BuildCache | None = None,
+        jobs: int = 1,
     ):
         self._workspace_dir = workspace_dir
+        self._build_cache = build_cache
+        self._jobs = jobs
+        self._timings: list[ProcessTiming] = []
         self._main_registry = registry
         self._templates_meta = templates_meta
         self._processes: list[ProtocolTemplateReg] = []
@@ -78,8 +88,8 @@ class TemplateRegistryProcessor:
 
         Notes:
             - Each registered process is invoked once.
-            - If multiple processes return the same process name, later results will
-            overwrite earlier ones in the returned dictionary.
+            - Processes are named by template type; a duplicate type raises ValueError.
+            - A process starts after the processes producing its declared inputs.
             - Side effects (file creation, network I/O, etc.) are performed by the
             individual processes and are not handled by this method.
         """
@@ -88,15 +98,49 @@ class TemplateRegistryProcessor:
             raise RuntimeError(
                 "No processes registered to execute. Has cleanup been called?"
             )
-        results = {}
+        scheduler = ProcessScheduler(jobs=self._jobs)
         for process in self._processes:
-            result_path = process.process(tokens)
+            scheduler.add(
+                name=process.template_type,
+                run=partial(self._execute, process, tokens),
+                inputs=process.get_inputs(),
+                outputs=process.get_outputs(),
+            )
+        process_results = scheduler.run()
+        self._timings = scheduler.timings
+        results = {}
+        for timing, result_path in zip(self._timings, process_results.values()):
             results[result_path[0]] = result_path[1]
             print(
-                f"Processed Template Registry: {result_path[0]} -> {result_path[1].name}"
+                f"Processed Template Registry: {result_path[0]} -> {result_path[1].name} in {timing.seconds:.3f}s"
             )
         return results
 
+    @property
+    def timings(self) -> list[ProcessTiming]:
+        """Gets the time of each process of the last execution."""
+        return self._timings
+
+    def _execute(
+        self, process: ProtocolTemplateReg, tokens: dict[str, Any]
+    ) -> tuple[str, Path]:
+        if self._build_cache is None:
+            return process.process(tokens)
+
+        def build() -> tuple[list[Path], Any]:
+            template_type, path = process.process(tokens)
+            return [path], template_type
+
+        paths, template_type, decision = self._build_cache.run(
+            stage="registry",
+            name=process.template_type,
+            inputs=process.get_cache_inputs(tokens),
+            dest_dir=self._workspace_dir,
+            build=build,
+        )
+        self._build_cache.record(decision)
+        return template_type, paths[0]
+
     def unregister_all(self) -> None:
         """Unregister all processes from the registry.
         Clears the internal _processes collection so that no previously
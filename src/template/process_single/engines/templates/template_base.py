@@ -57,6 +57,28 @@ class TemplateBase:
         # result["batch_number"] = str(self.main_registry.build_version)
         # self.fm.set_field("batch_number", str(self.main_registry.build_version))
 
+    def get_cache_inputs(self, tokens: dict[str, Any]) -> dict[str, Any]:
+        """
+        Gets the inputs that determine the written template, for the build cache.
+
+        Must be called before ``process()``, which changes the frontmatter.
+
+        Args:
+            tokens (dict[str, Any]): Tokens passed to ``process()``.
+
+        Returns:
+            dict[str, Any]: Named inputs.
+        """
+        return {
+            "template": {
+                "frontmatter": self.fm.frontmatter,
+                "content": self.fm.content,
+            },
+            "template_config": self.tci,
+            "executor_mode": self.config.template_ceib_single,
+            "tokens": tokens,
+        }
+
     def _get_file_path(self) -> Path:
         return (
             self.working_dir
@@ -90,3 +112,7 @@ class TemplateBase:
     @property
     def working_dir(self) -> Path:
         return self.__working_dir
+
+    @property
+    def template_type(self) -> str:
+        return self.tci.template_type
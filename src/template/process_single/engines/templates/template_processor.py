@@ -1,6 +1,10 @@
+from functools import partial
+from typing import Any
 from pathlib import Path
 from ....front_mater_meta import FrontMatterMeta
 from ....main_registry import MainRegistry
+from .....builder.build_cache import BuildCache
+from .....builder.process_scheduler import ProcessScheduler, ProcessTiming
 from .protocol_template import ProtocolTemplate
 from .template_glyph import TemplateGlyph
 from .template_field_certificate import TemplateFieldCertificate
@@ -23,6 +27,8 @@ class TemplateProcessor:
     Notes:
         - Writes template registry workspace directory.
         - Provides methods to register, unregister, and execute processes.
+        - Processes run in the order of their declared inputs and outputs; with more
+          than one job, independent processes run concurrently.
     """
 
     def __init__(
@@ -30,8 +36,13 @@ class TemplateProcessor:
         workspace_dir: Path,
         registry: MainRegistry,
         templates_data: dict[str, FrontMatterMeta],
+        build_cache: BuildCache | None = None,
+        jobs: int = 1,
     ):
         self._workspace_dir = workspace_dir
+        self._build_cache = build_cache
+        self._jobs = jobs
+        self._timings: list[ProcessTiming] = []
         self._main_registry = registry
         self._processes: list[ProtocolTemplate] = []
         self._templates_data = templates_data
@@ -51,7 +62,7 @@ class TemplateProcessor:
         self._processes.append(process)
 
     def execute_all(self, tokens: dict) -> dict[str, FrontMatterMeta]:
-        """Execute all registered processes in sequence.
+        """Execute all registered processes, concurrently when more than one job is set.
 
         Args:
             tokens (dict): A dictionary of tokens to pass to each process during execution.
@@ -65,15 +76,53 @@ class TemplateProcessor:
             raise RuntimeError(
                 "No processes registered to execute. Has cleanup been called?"
             )
-        results = {}
+        scheduler = ProcessScheduler(jobs=self._jobs)
         for process in self._processes:
-            result_fm = process.process(tokens)
+            scheduler.add(
+                name=process.template_type,
+                run=partial(self._execute, process, tokens),
+                inputs=process.get_inputs(),
+                outputs=process.get_outputs(),
+            )
+        process_results = scheduler.run()
+        self._timings = scheduler.timings
+        results = {}
+        for timing, result_fm in zip(self._timings, process_results.values()):
             results[result_fm.template_type] = result_fm
             print(
-                f"Processed Template: {result_fm.template_type} -> {result_fm.file_path.name}"
+                f"Processed Template: {result_fm.template_type} -> {result_fm.file_path.name} in {timing.seconds:.3f}s"
             )
         return results
 
+    @property
+    def timings(self) -> list[ProcessTiming]:
+        """Gets the time of each process of the last execution."""
+        return self._timings
+
+    def _execute(
+        self, process: ProtocolTemplate, tokens: dict[str, Any]
+    ) -> FrontMatterMeta:
+        if self._build_cache is None:
+            return process.process(tokens)
+        built: list[FrontMatterMeta] = []
+
+        def build() -> tuple[list[Path], Any]:
+            fm = process.process(tokens)
+            built.append(fm)
+            return [fm.file_path], (fm.frontmatter, fm.content)
+
+        paths, (frontmatter, content), decision = self._build_cache.run(
+            stage="template",
+            name=process.template_type,
+            inputs=process.get_cache_inputs(tokens),
+            dest_dir=self._workspace_dir,
+            build=build,
+        )
+        self._build_cache.record(decision)
+        if built:
+            return built[0]
+        return FrontMatterMeta.from_frontmatter_dict(paths[0], frontmatter, content)
+
     def unregister_all(self) -> None:
         """Unregister all processes from the registry.
         Clears the internal _processes collection so that no previously
@@ -0,0 +1,79 @@
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+import yaml
+from ....meta.singleton import SingletonMeta
+from .prompt_beings import PromptBeings
+from .prompt_meta_type import PromptMetaType
+
+T = TypeVar("T")
+
+
+class MetadataCache(metaclass=SingletonMeta):
+    """
+    Process-wide cache of helper models loaded from metadata YAML files.
+
+    Files are keyed by their resolved path and validated by modification time and size,
+    so each file is parsed once per process, and again only after it changes. Every
+    model built from a file is cached with it. The returned models are shared by every
+    engine; treat them as read-only.
+    """
+
+    def __init__(self):
+        self._files: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+        self._models: dict[tuple[type, Path, tuple[int, int]], Any] = {}
+
+    def _load(self, path: Path | str) -> tuple[Path, tuple[int, int], dict[str, Any]]:
+        p = Path(path).resolve()
+        try:
+            st = p.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"{p} not found") from None
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._files.get(p)
+        if cached is not None and cached[0] == stamp:
+            return p, stamp, cached[1]
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        data = yaml.load(p.read_text(encoding="utf-8"), Loader=loader) or {}
+        self._files[p] = (stamp, data)
+        self._models = {k: v for k, v in self._models.items() if k[1] != p}
+        return p, stamp, data
+
+    def _get_model(
+        self, model_cls: type[T], path: Path | str, build: Callable[[dict], T]
+    ) -> T:
+        p, stamp, data = self._load(path)
+        key = (model_cls, p, stamp)
+        model = self._models.get(key)
+        if model is None:
+            model = build(data)
+            self._models[key] = model
+        return model
+
+    def get_prompt_meta_type(self, path: Path | str) -> PromptMetaType:
+        """
+        Gets the ``template_type`` section of a field being map.
+
+        Args:
+            path (Path | str): Path to ``template_field_being_map.yml``.
+
+        Returns:
+            PromptMetaType: Shared model, built on first use or after the file changed.
+        """
+        return self._get_model(PromptMetaType, path, PromptMetaType.from_dict)
+
+    def get_prompt_beings(self, path: Path | str) -> PromptBeings:
+        """
+        Gets the ``beings`` section of a field being map.
+
+        Args:
+            path (Path | str): Path to ``template_field_being_map.yml``.
+
+        Returns:
+            PromptBeings: Shared model, built on first use or after the file changed.
+        """
+        return self._get_model(PromptBeings, path, PromptBeings.from_dict)
+
+    def clear(self) -> None:
+        """Forgets every loaded file and model."""
+        self._files.clear()
+        self._models.clear()
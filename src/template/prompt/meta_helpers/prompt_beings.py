@@ -30,6 +30,10 @@ class PromptBeings:
         if not p.exists():
             raise FileNotFoundError(f"{p} not found")
         data = yaml.safe_load(p.read_text(encoding="utf-8")) or {}
+        return cls.from_dict(data)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PromptBeings":
         raw = data.get("beings", {})
         if not isinstance(raw, dict):
             raise TypeError("`beings` must be a mapping in the YAML")
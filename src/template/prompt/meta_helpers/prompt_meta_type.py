@@ -61,6 +61,10 @@ class PromptMetaType:
         if not p.exists():
             raise FileNotFoundError(f"{p} not found")
         data = yaml.safe_load(p.read_text(encoding="utf-8")) or {}
+        return cls.from_dict(data)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PromptMetaType":
         tt = data.get("template_type", {})
         if not isinstance(tt, dict):
             raise TypeError("template_type must be a table/dictionary in the YAML")
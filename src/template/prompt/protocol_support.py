@@ -23,3 +23,21 @@ class ProtocolSupport(Protocol):
             str: Process Name
         """
         ...
+
+    def get_inputs(self) -> set[str]:
+        """
+        Gets the outputs of other processes this process reads.
+
+        Returns:
+            set[str]: Output names. Defaults to none.
+        """
+        return set()
+
+    def get_outputs(self) -> set[str]:
+        """
+        Gets the outputs this process produces for other processes.
+
+        Returns:
+            set[str]: Output names. Defaults to none.
+        """
+        return set()
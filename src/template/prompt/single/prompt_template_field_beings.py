@@ -7,11 +7,15 @@ from ...main_registry import MainRegistry
 from ...front_mater_meta import FrontMatterMeta
 from ..meta_helpers.prompt_meta_type import PromptMetaType, TemplateEntry
 from ..meta_helpers.prompt_beings import PromptBeings
+from ..meta_helpers.metadata_cache import MetadataCache
 
 
 class PromptTemplateFieldBeings(ProtocolSupport):
-    def __init__(self, registry: MainRegistry) -> None:
+    def __init__(
+        self, registry: MainRegistry, metadata_cache: MetadataCache | None = None
+    ) -> None:
         self.config = PkgConfig()
+        self._metadata_cache = metadata_cache or MetadataCache()
         self._main_registry = registry
         self._dest_dir = self.config.root_path / self.config.pkg_out_dir
         self._prompt_meta_type = self._load_prompt_meta_type()
@@ -21,12 +25,12 @@ class PromptTemplateFieldBeings(ProtocolSupport):
 
     def _load_prompt_meta_type(self) -> PromptMetaType:
         tfbm_path = self.config.root_path / self.config.template_field_being_map_src
-        prompt_meta_type = PromptMetaType.from_yaml(tfbm_path)
+        prompt_meta_type = self._metadata_cache.get_prompt_meta_type(tfbm_path)
         return prompt_meta_type
 
     def _load_prompt_beings(self) -> PromptBeings:
         tfbm_path = self.config.root_path / self.config.template_field_being_map_src
-        prompt_beings = PromptBeings.from_yaml(tfbm_path)
+        prompt_beings = self._metadata_cache.get_prompt_beings(tfbm_path)
         return prompt_beings
 
     def _map(self, tokens: dict) -> dict[str, Path]:
@@ -1,4 +1,5 @@
 import tempfile
+from functools import partial
 from pathlib import Path
 from ..protocol_support import ProtocolSupport
 from ....config.pkg_config import PkgConfig
@@ -8,6 +9,7 @@ from .prompt_template_field_beings_upgrade import PromptTemplateFieldBeingsUpgra
 from .prompt_template_field_beings_upgrade2 import PromptTemplateFieldBeingsUpgrade2
 from .prompt_template_field_beings_create import PromptTemplateFieldBeingsCreate
 from ...main_registry import MainRegistry
+from ....builder.process_scheduler import ProcessScheduler, ProcessTiming
 
 
 class SupportProcessor:
@@ -18,12 +20,16 @@ class SupportProcessor:
     Notes:
         - Writes lockfiles, readme, and protocol scroll to a temporary workspace directory.
         - Provides methods to register, unregister, and execute processes.
+        - Processes run in the order of their declared inputs and outputs; with more
+          than one job, independent processes run concurrently.
     """
 
-    def __init__(self, registry: MainRegistry):
+    def __init__(self, registry: MainRegistry, jobs: int = 1):
         self.config = PkgConfig()
         self._workspace_dir = self.config.root_path / self.config.pkg_out_dir
         self._main_registry = registry
+        self._jobs = jobs
+        self._timings: list[ProcessTiming] = []
         self._processes: list[ProtocolSupport] = []
         self._register_default_processes()
 
@@ -76,8 +82,8 @@ class SupportProcessor:
 
         Notes:
             - Each registered process is invoked once.
-            - If multiple processes return the same process name, later results will
-            overwrite earlier ones in the returned dictionary.
+            - Process names must be unique; a duplicate name raises ValueError.
+            - A process starts after the processes producing its declared inputs.
             - Side effects (file creation, network I/O, etc.) are performed by the
             individual processes and are not handled by this method.
         """
@@ -86,13 +92,27 @@ class SupportProcessor:
             raise RuntimeError(
                 "No processes registered to execute. Has cleanup been called?"
             )
-        results = {}
+        scheduler = ProcessScheduler(jobs=self._jobs)
         for process in self._processes:
-            print(f"Processing Support Companion: {process.get_process_name()}")
-            result_path = process.process(tokens)
-            results[process.get_process_name()] = result_path
+            scheduler.add(
+                name=process.get_process_name(),
+                run=partial(process.process, tokens),
+                inputs=process.get_inputs(),
+                outputs=process.get_outputs(),
+            )
+        results = scheduler.run()
+        self._timings = scheduler.timings
+        for timing in self._timings:
+            print(
+                f"Processed Support Companion: {timing.name} in {timing.seconds:.3f}s"
+            )
         return results
 
+    @property
+    def timings(self) -> list[ProcessTiming]:
+        """Gets the time of each process of the last execution."""
+        return self._timings
+
     def unregister_all(self) -> None:
         """Unregister all processes from the registry.
         Clears the internal _processes collection so that no previously
@@ -7,9 +7,10 @@ from ...process.read_obsidian_template_meta import (
     ReadObsidianTemplateMeta,
 )
 from ....builder.build_ver_mgr import BuildVerMgr
+from ....builder.build_profiler import BuildProfiler
 from ....util import file_util
 from ...main_registry import MainRegistry
-from ...process.process_obsidian_templates import ProcessObsidianTemplates
+from ...template_corpus import TemplateCorpus
 
 
 class Cleanup:
@@ -17,8 +18,10 @@ class Cleanup:
 
     def __init__(self):
         self.config = PkgConfig()
-        reader = ReadObsidianTemplateMeta()
-        self._template_meta = reader.read_template_meta()
+        self._profiler = BuildProfiler()
+        with self._profiler.stage("read_template_meta"):
+            reader = ReadObsidianTemplateMeta()
+            self._template_meta = reader.read_template_meta()
 
         self._current_version = self._get_current_version()
 
@@ -38,18 +41,13 @@ class Cleanup:
         if not self._dest_dir_reports.exists():
             self._dest_dir_reports.mkdir(parents=True)
         self._main_registry = MainRegistry(build_version=self._current_version)
+        self._profiler.set_info("build_version", self._current_version)
+        self._profiler.set_info("registry_version", self._main_registry.reg_version)
 
-        process_templates = ProcessObsidianTemplates()
-
-        self._obsidian_templates = process_templates.process(
-            {
-                "declared_registry_id": self._main_registry.reg_id,
-                "declared_registry_version": self._main_registry.reg_version,
-                "mapped_registry": self._main_registry.reg_id,
-                "mapped_registry_minimum_version": self._main_registry.reg_version,
-                "batch_number": str(self._current_version),
-            }
-        )
+        with self._profiler.stage("process_templates"):
+            self._obsidian_templates = TemplateCorpus().get_templates(
+                self._main_registry
+            )
 
     def _get_obsidian_template_meta(self, template_type: str) -> FrontMatterMeta:
         """Get obsidian template meta for given template type."""
@@ -158,21 +156,23 @@ class Cleanup:
         if not tpl_path.exists():
             raise FileNotFoundError(f"Template path {tpl_path} does not exist.")
         try:
-            fm_cleanup_template = FrontMatterMeta(file_path=tpl_path)
-            if not fm_cleanup_template.template_type:
-                raise ValueError(
-                    f"Field template_type is not specified in frontmatter of {tpl_path}."
+            with self._profiler.stage("clean_template"):
+                fm_cleanup_template = FrontMatterMeta(file_path=tpl_path)
+                if not fm_cleanup_template.template_type:
+                    raise ValueError(
+                        f"Field template_type is not specified in frontmatter of {tpl_path}."
+                    )
+                removed = self._cleanup_template_only_fields(fm_cleanup_template)
+                self._cleanup_upgrade_contents(fm_cleanup_template)
+
+                fm_obsidian = self._get_obsidian_template_meta(
+                    fm_cleanup_template.template_type
                 )
-            removed = self._cleanup_template_only_fields(fm_cleanup_template)
-            self._cleanup_upgrade_contents(fm_cleanup_template)
-
-            fm_obsidian = self._get_obsidian_template_meta(
-                fm_cleanup_template.template_type
-            )
-            self._ensure_fields(fm_cleanup_template, fm_obsidian)
+                self._ensure_fields(fm_cleanup_template, fm_obsidian)
 
-            self._write_new_frontmatter(fm_cleanup_template, output_name)
-            self._write_report(fm_cleanup_template, removed, output_name)
+            with self._profiler.stage("write"):
+                self._write_new_frontmatter(fm_cleanup_template, output_name)
+                self._write_report(fm_cleanup_template, removed, output_name)
 
         except Exception as e:
             raise ValueError(f"Error reading frontmatter from {tpl_path}: {e}")
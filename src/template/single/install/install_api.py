@@ -1,54 +1,66 @@
 from datetime import datetime
 import json
-from typing import Any
+from functools import partial
+from typing import Any, Callable
 from pathlib import Path
 import yaml
 
 from ...front_mater_meta import FrontMatterMeta
 from ....config.pkg_config import PkgConfig
 from ....builder.build_ver_mgr import BuildVerMgr
+from ....builder.build_profiler import BuildProfiler
+from ....builder.process_scheduler import ProcessScheduler
 from .tp_support.instructions import Instructions
 from .tp_support.cbib import CBIB
-from .tp_support.manifest import get_manifest
+from .tp_support.manifest import get_manifest, keep_installed_at
 from .tp_support.pre_processors.template.template_pre_processor import (
     TemplatePreProcessor,
 )
 from .tp_support.pre_processors.registry.reg_pre_processor import RegPreProcessor
 from ...main_registry import MainRegistry
-from ...process.process_obsidian_templates import ProcessObsidianTemplates
+from ...template_bundle import is_template_bundle_current, write_template_bundle
+from ...template_corpus import TemplateCorpus
+from ...templates_generation import write_templates_generation
+from .templates_stage import (
+    ADDED,
+    CHANGED,
+    UNCHANGED,
+    FileChange,
+    TemplatesStage,
+    get_file_change,
+    read_file,
+)
 
 
 class InstallAPI:
-    def __init__(self, build_number: int = 0):
+    def __init__(self, build_number: int = 0, jobs: int = 1):
+        """
+        Args:
+            build_number (int, optional): Single build to install, 0 for the current build.
+                Defaults to 0.
+            jobs (int, optional): Template types installed at the same time, 0 for one
+                per CPU. Defaults to 1.
+        """
         self._cache = {}
+        self._jobs = jobs
         self.config = PkgConfig()
+        self._profiler = BuildProfiler()
         if build_number == 0:
             build_number = self._get_current_build_number()
         self.build_number = build_number
         self._build_dir_ensured = False
-        self._single_mode = True
         self._src_dir = self.config.config_cache.get_dist_single(self.build_number)
         self._manifest = self._get_manifest()
         self._instructions = Instructions()
         self._cbib = CBIB()
         self._main_registry = MainRegistry(build_version=self.build_number)
-        self._original_templates = self._get_original_templates()
+        self._profiler.set_info("build_version", self.build_number)
+        self._profiler.set_info("registry_version", self._main_registry.reg_version)
+        with self._profiler.stage("process_templates"):
+            self._original_templates = self._get_original_templates()
 
     def _get_original_templates(self) -> dict[str, FrontMatterMeta]:
-        process_templates = ProcessObsidianTemplates()
-        processed_template_data = process_templates.process(
-            {
-                "declared_registry_id": self._main_registry.reg_id,
-                "declared_registry_version": self._main_registry.reg_version,
-                "mapped_registry": self._main_registry.reg_id,
-                "mapped_registry_minimum_version": self._main_registry.reg_version,
-                "batch_number": str(self.build_number),
-            }
-        )
-        results = {}
-        for fm in processed_template_data.values():
-            results[fm.template_type] = fm
-        return results
+        return TemplateCorpus().get_templates_by_type(self._main_registry)
 
     def _get_current_build_number(self) -> int:
         bvm = BuildVerMgr()
@@ -200,36 +212,144 @@ class InstallAPI:
         sorted_registry.update(cp)
         return sorted_registry
 
-    def install_single(self, template_type: str) -> None:
-        if template_type not in self._manifest["templates"]:
-            raise ValueError(
-                f"Template type '{template_type}' not found in manifest for build {self._src_dir}"
+    def _write_bundle(self) -> None:
+        bundle_path = self.config.config_cache.get_api_templates_bundle_path()
+        with self._profiler.stage("write_bundle"):
+            count = write_template_bundle(
+                templates_path=self.config.config_cache.get_api_templates_path(),
+                bundle_path=bundle_path,
             )
+        print(f"Wrote template bundle with {count} template versions to {bundle_path}")
+
+    def _render_template_files(self, template_type: str) -> dict[Path, bytes]:
         fm = self._load_template_file(template_type)
         registry = self._load_registry_file(template_type)
         self._update_template_frontmatter(fm)
         self._update_registry_data(fm, registry)
         manifest = self._get_template_manifest(fm)
         dest_path = fm.file_path.parent
-        if not dest_path.exists():
-            dest_path.mkdir(parents=True, exist_ok=True)
-
         instructions_md = self._generate_frontmatter_instructions(
             fm=fm, registry=registry, dest_path=dest_path
         )
+        sorted_registry = self._get_sorted_registry(registry)
+        templates_path = self.config.config_cache.get_api_templates_path()
+        version_dir = dest_path.relative_to(templates_path)
+        manifest = keep_installed_at(
+            manifest, read_file(templates_path / version_dir / "manifest.json")
+        )
+        return {
+            version_dir / "template.md": fm.get_template_text().encode("utf-8"),
+            version_dir / "registry.json": json.dumps(sorted_registry, indent=4).encode(
+                "utf-8"
+            ),
+            version_dir / "manifest.json": json.dumps(manifest, indent=4).encode(
+                "utf-8"
+            ),
+            version_dir / "instructions.md": instructions_md.get_template_text().encode(
+                "utf-8"
+            ),
+        }
+
+    def _install_template(
+        self, template_type: str, write: Callable[[Path, bytes], FileChange]
+    ) -> list[FileChange]:
+        files = self._render_template_files(template_type)
+        changes = [write(path, data) for path, data in files.items()]
+        version_dir = next(iter(files)).parent
+        print(f"Installing template '{template_type}' to {version_dir}")
+        return changes
+
+    def _install_templates(
+        self, template_types: list[str], dry_run: bool
+    ) -> list[FileChange]:
+        """
+        Installs templates, or with ``dry_run`` compares them with the installed files.
+
+        Each template type is rendered on the process scheduler, concurrently when
+        more than one job is set. Files are written into a stage that is published
+        once every template is written, and only when a file changed.
+
+        Args:
+            template_types (list[str]): Template types to install.
+            dry_run (bool): Compare with the installed files without writing.
+
+        Returns:
+            list[FileChange]: Change of each file, in template type order.
+        """
+        templates_path = self.config.config_cache.get_api_templates_path()
+
+        def run_all(write: Callable[[Path, bytes], FileChange]) -> list[FileChange]:
+            scheduler = ProcessScheduler(jobs=self._jobs)
+            for template_type in template_types:
+                scheduler.add(
+                    name=template_type,
+                    run=partial(self._install_template, template_type, write),
+                )
+            results = scheduler.run()
+            return [change for changes in results.values() for change in changes]
+
+        if dry_run:
+            with self._profiler.stage("diff_templates"):
+                return run_all(
+                    lambda path, data: get_file_change(
+                        path, read_file(templates_path / path), data
+                    )
+                )
+
         self._ensure_cbib()
-        print(f"Installing template '{template_type}' to {dest_path}")
+        with TemplatesStage(templates_path) as stage:
+            with self._profiler.stage("stage_templates"):
+                changes = run_all(stage.write)
+            changed_files = sum(1 for c in changes if c.status != UNCHANGED)
+            if changed_files:
+                with self._profiler.stage("publish"):
+                    stage.publish()
+        bundle_path = self.config.config_cache.get_api_templates_bundle_path()
+        if changed_files or not is_template_bundle_current(bundle_path, templates_path):
+            self._write_bundle()
+        if changed_files:
+            generation = write_templates_generation(
+                self.config.config_cache.get_api_templates_generation_path(),
+                build_number=self.build_number,
+                changed_files=changed_files,
+            )
+            print(f"Published templates generation {generation.generation}")
+        return changes
 
-        fm.write_template(fm.file_path)
-        registry_path = dest_path / "registry.json"
-        sorted_registry = self._get_sorted_registry(registry)
-        with registry_path.open("w", encoding="utf-8") as f:
-            # yaml.dump(registry, f, sort_keys=False)
-            json.dump(sorted_registry, f, indent=4)
-        with (dest_path / "manifest.json").open("w", encoding="utf-8") as f:
-            json.dump(manifest, f, indent=4)
-        instructions_md.write_template(instructions_md.file_path)
-        if self._single_mode:
+    def _print_changes(self, changes: list[FileChange], dry_run: bool) -> None:
+        for change in changes:
+            if change.status != UNCHANGED:
+                print(change)
+        counts = {
+            status: sum(1 for c in changes if c.status == status)
+            for status in (ADDED, CHANGED, UNCHANGED)
+        }
+        prefix = "Dry run: " if dry_run else ""
+        print(
+            f"{prefix}{counts[ADDED]} added, {counts[CHANGED]} changed, {counts[UNCHANGED]} unchanged files"
+        )
+
+    def install_single(self, template_type: str, dry_run: bool = False) -> None:
+        """
+        Installs one template type.
+
+        Args:
+            template_type (str): Template type in the manifest of the build.
+            dry_run (bool, optional): Report the files that would change without
+                writing them. Defaults to False.
+
+        Raises:
+            ValueError: If the template type is not in the manifest.
+        """
+        if template_type not in self._manifest["templates"]:
+            raise ValueError(
+                f"Template type '{template_type}' not found in manifest for build {self._src_dir}"
+            )
+        changes = self._install_templates([template_type], dry_run)
+        self._print_changes(changes, dry_run)
+        if dry_run:
+            return
+        with self._profiler.stage("pre_processors"):
             tp_processor = TemplatePreProcessor(self._original_templates)
             tp_result = tp_processor.execute_single(template_type)
             print(
@@ -241,21 +361,29 @@ class InstallAPI:
                 f"Processed Registry Pre-Processor: {reg_result[0]} -> {reg_result[1].name}"
             )
 
-    def install(self) -> None:
-        # Implementation of the install method
-        self._single_mode = False
+    def install(self, dry_run: bool = False) -> None:
+        """
+        Installs every template type of the manifest of the build.
+
+        Args:
+            dry_run (bool, optional): Report the files that would change without
+                writing them. Defaults to False.
+        """
         try:
-            for template_type in self._manifest["templates"].keys():
-                self.install_single(template_type)
-            tp_processor = TemplatePreProcessor(self._original_templates)
-            reg_process = RegPreProcessor(self._original_templates)
-            tp_results = tp_processor.execute_all()
-            reg_results = reg_process.execute_all()
+            changes = self._install_templates(
+                list(self._manifest["templates"].keys()), dry_run
+            )
+            self._print_changes(changes, dry_run)
+            if dry_run:
+                return
+            with self._profiler.stage("pre_processors"):
+                tp_processor = TemplatePreProcessor(self._original_templates)
+                reg_process = RegPreProcessor(self._original_templates)
+                tp_results = tp_processor.execute_all()
+                reg_results = reg_process.execute_all()
             for tt, path in tp_results.items():
                 print(f"Processed Template Pre-Processor: {tt} -> {path.name}")
             for tt, path in reg_results.items():
                 print(f"Processed Registry Pre-Processor: {tt} -> {path.name}")
         except Exception as e:
             print(f"Error during installation: {e}")
-        finally:
-            self._single_mode = True
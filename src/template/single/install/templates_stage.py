@@ -0,0 +1,260 @@
+"""
+Staged install of the API templates directory.
+
+Templates are written into a sibling copy of the live templates directory, which is
+then exchanged with the live directory in one atomic rename, so a running server reads
+the previous or the new templates and never a partly written file or a missing
+directory. Files of the copy are hard links to the live files where the file system
+allows it, and a file whose content is unchanged is not written.
+"""
+
+import ctypes
+import difflib
+import errno
+import os
+import shutil
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+ADDED = "added"
+CHANGED = "changed"
+UNCHANGED = "unchanged"
+
+
+@dataclass(frozen=True)
+class FileChange:
+    """
+    Change of one installed file.
+
+    Attributes:
+        path (Path): File path relative to the templates directory.
+        status (str): ``added``, ``changed`` or ``unchanged``.
+        lines_added (int): Lines in the new file that are not in the current file.
+        lines_removed (int): Lines in the current file that are not in the new file.
+    """
+
+    path: Path
+    status: str
+    lines_added: int = 0
+    lines_removed: int = 0
+
+    def __str__(self) -> str:
+        if self.status == UNCHANGED:
+            return f"{self.status:<9} {self.path}"
+        return (
+            f"{self.status:<9} {self.path} (+{self.lines_added} -{self.lines_removed})"
+        )
+
+
+def get_file_change(path: Path, current: bytes | None, data: bytes) -> FileChange:
+    """
+    Compares the content of an installed file with its new content.
+
+    Args:
+        path (Path): File path relative to the templates directory.
+        current (bytes | None): Current content, None if the file does not exist.
+        data (bytes): New content.
+
+    Returns:
+        FileChange: Change of the file.
+    """
+    if current == data:
+        return FileChange(path, UNCHANGED)
+    new_lines = data.decode("utf-8", errors="replace").splitlines()
+    if current is None:
+        return FileChange(path, ADDED, lines_added=len(new_lines))
+    added = removed = 0
+    for line in difflib.unified_diff(
+        current.decode("utf-8", errors="replace").splitlines(), new_lines, n=0
+    ):
+        if line.startswith(("+++", "---")):
+            continue
+        if line.startswith("+"):
+            added += 1
+        elif line.startswith("-"):
+            removed += 1
+    return FileChange(path, CHANGED, lines_added=added, lines_removed=removed)
+
+
+def read_file(path: Path) -> bytes | None:
+    """
+    Reads a file if it exists.
+
+    Args:
+        path (Path): File to read.
+
+    Returns:
+        bytes | None: The content if the file exists; Otherwise, None.
+    """
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+_AT_FDCWD = -100
+_RENAME_EXCHANGE = 2
+
+
+def _get_renameat2():
+    try:
+        renameat2 = ctypes.CDLL(None, use_errno=True).renameat2
+    except (OSError, AttributeError, TypeError):
+        # not Linux, or a C library older than glibc 2.28
+        return None
+    renameat2.argtypes = [
+        ctypes.c_int,
+        ctypes.c_char_p,
+        ctypes.c_int,
+        ctypes.c_char_p,
+        ctypes.c_uint,
+    ]
+    renameat2.restype = ctypes.c_int
+    return renameat2
+
+
+def exchange_paths(path_a: Path, path_b: Path) -> bool:
+    """
+    Atomically exchanges two existing paths with ``renameat2(RENAME_EXCHANGE)``.
+
+    Args:
+        path_a (Path): First path.
+        path_b (Path): Second path, on the same file system.
+
+    Raises:
+        OSError: If the exchange is supported but fails.
+
+    Returns:
+        bool: True if the paths were exchanged; False if the platform or file system
+        does not support exchanging them.
+    """
+    renameat2 = _get_renameat2()
+    if renameat2 is None:
+        return False
+    result = renameat2(
+        _AT_FDCWD, os.fsencode(path_a), _AT_FDCWD, os.fsencode(path_b), _RENAME_EXCHANGE
+    )
+    if result == 0:
+        return True
+    err = ctypes.get_errno()
+    if err in (errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+        return False
+    raise OSError(err, os.strerror(err), str(path_a), None, str(path_b))
+
+
+class TemplatesStage:
+    """
+    Sibling copy of the live templates directory that is published by renaming it.
+
+    Use it as a context manager; a stage that is not published is removed on exit.
+    """
+
+    def __init__(self, live_path: Path):
+        """
+        Args:
+            live_path (Path): Live templates directory.
+        """
+        self._live_path = live_path
+        self._stage_path = live_path.with_name(f".{live_path.name}.stage-{os.getpid()}")
+        self._lock = threading.Lock()
+        self._changes: list[FileChange] = []
+        self._published = False
+
+    def __enter__(self) -> "TemplatesStage":
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.discard()
+
+    def open(self) -> None:
+        """Creates the stage as a copy of the live templates directory."""
+        if self._stage_path.exists():
+            # left by an install that was killed
+            shutil.rmtree(self._stage_path)
+        if self._live_path.is_dir():
+            shutil.copytree(
+                self._live_path, self._stage_path, copy_function=_link_or_copy
+            )
+        else:
+            self._stage_path.mkdir(parents=True)
+
+    def write(self, path: Path, data: bytes) -> FileChange:
+        """
+        Writes a file into the stage unless its content is unchanged.
+
+        Safe to call from several threads for different files.
+
+        Args:
+            path (Path): File path relative to the templates directory.
+            data (bytes): File content.
+
+        Returns:
+            FileChange: Change of the file.
+        """
+        stage_file = self._stage_path / path
+        change = get_file_change(path, read_file(stage_file), data)
+        if change.status != UNCHANGED:
+            stage_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = stage_file.with_name(f".{stage_file.name}.tmp")
+            tmp_file.write_bytes(data)
+            # replacing rather than writing in place leaves a hard linked live file as it is
+            os.replace(tmp_file, stage_file)
+        with self._lock:
+            self._changes.append(change)
+        return change
+
+    def publish(self) -> None:
+        """
+        Replaces the live templates directory with the stage.
+
+        The stage and the live directory are exchanged in one atomic rename, then
+        the previous tree, now at the stage path, is removed. Where the platform or
+        file system cannot exchange paths, the live directory is moved aside and the
+        stage renamed over it, leaving it missing between the two renames.
+        """
+        if not self._live_path.exists():
+            os.replace(self._stage_path, self._live_path)
+            self._published = True
+            return
+        if exchange_paths(self._stage_path, self._live_path):
+            self._published = True
+            shutil.rmtree(self._stage_path, ignore_errors=True)
+            return
+        backup_path = self._live_path.with_name(
+            f".{self._live_path.name}.old-{os.getpid()}"
+        )
+        if backup_path.exists():
+            shutil.rmtree(backup_path)
+        os.replace(self._live_path, backup_path)
+        try:
+            os.replace(self._stage_path, self._live_path)
+        except BaseException:
+            os.replace(backup_path, self._live_path)
+            raise
+        self._published = True
+        shutil.rmtree(backup_path, ignore_errors=True)
+
+    def discard(self) -> None:
+        """Removes the stage if it was not published."""
+        if not self._published and self._stage_path.exists():
+            shutil.rmtree(self._stage_path, ignore_errors=True)
+
+    @property
+    def path(self) -> Path:
+        """Gets the stage directory."""
+        return self._stage_path
+
+    @property
+    def changes(self) -> list[FileChange]:
+        """Gets the changes of the files written so far."""
+        with self._lock:
+            return list(self._changes)
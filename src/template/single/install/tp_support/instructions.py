@@ -3,13 +3,15 @@ from .cbib import CBIB
 from .....config.pkg_config import PkgConfig
 from ....front_mater_meta import FrontMatterMeta
 from ....prompt.meta_helpers.prompt_beings import PromptBeings
+from ....prompt.meta_helpers.metadata_cache import MetadataCache
 from ....prompt.meta_helpers.prompt_meta_type import PromptMetaType, TemplateEntry
 
 
 class Instructions:
-    def __init__(self) -> None:
+    def __init__(self, metadata_cache: MetadataCache | None = None) -> None:
         self._registry_file = "registry.json"
         self.config = PkgConfig()
+        self._metadata_cache = metadata_cache or MetadataCache()
         self._cbib = CBIB().get_cbib()
         self._dest_dir = self.config.root_path / self.config.pkg_out_dir
         self._prompt_meta_type = self._load_prompt_meta_type()
@@ -19,12 +21,12 @@ class Instructions:
 
     def _load_prompt_meta_type(self) -> PromptMetaType:
         tfbm_path = self.config.root_path / self.config.template_field_being_map_src
-        prompt_meta_type = PromptMetaType.from_yaml(tfbm_path)
+        prompt_meta_type = self._metadata_cache.get_prompt_meta_type(tfbm_path)
         return prompt_meta_type
 
     def _load_prompt_beings(self) -> PromptBeings:
         tfbm_path = self.config.root_path / self.config.template_field_being_map_src
-        prompt_beings = PromptBeings.from_yaml(tfbm_path)
+        prompt_beings = self._metadata_cache.get_prompt_beings(tfbm_path)
         return prompt_beings
 
     def _get_invocation_agents(self, entry: TemplateEntry, registry: dict) -> str:
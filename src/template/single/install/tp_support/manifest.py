@@ -1,3 +1,4 @@
+import json
 from datetime import datetime
 from src.template.front_mater_meta import FrontMatterMeta
 from src.config.pkg_config import PkgConfig
@@ -43,3 +44,33 @@ def get_manifest(fm: FrontMatterMeta) -> dict:
     if fm.template_id:
         data["template_info"]["template_id"] = fm.template_id
     return data
+
+
+def keep_installed_at(data: dict, installed: bytes | None) -> dict:
+    """
+    Keeps the install time of the installed manifest when nothing else changed.
+
+    ``get_manifest()`` stamps the current time, so without this every install would
+    rewrite every manifest.
+
+    Args:
+        data (dict): New manifest.
+        installed (bytes | None): Content of the installed manifest, None if not installed.
+
+    Returns:
+        dict: ``data`` with the installed ``installed_at`` if the manifests differ only
+            in ``installed_at``; Otherwise, ``data``.
+    """
+    if installed is None:
+        return data
+    try:
+        previous = json.loads(installed)
+    except ValueError:
+        return data
+    if not isinstance(previous, dict) or "installed_at" not in previous:
+        return data
+    if {k: v for k, v in previous.items() if k != "installed_at"} != {
+        k: v for k, v in data.items() if k != "installed_at"
+    }:
+        return data
+    return {**data, "installed_at": previous["installed_at"]}
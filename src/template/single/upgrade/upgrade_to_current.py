@@ -7,6 +7,7 @@ from ...process.read_obsidian_template_meta import (
     ReadObsidianTemplateMeta,
 )
 from ....builder.build_ver_mgr import BuildVerMgr
+from ....builder.build_profiler import BuildProfiler
 from ....util import file_util
 
 
@@ -15,10 +16,13 @@ class UpgradeToCurrent:
 
     def __init__(self):
         self.config = PkgConfig()
-        reader = ReadObsidianTemplateMeta()
-        self._template_meta = reader.read_template_meta()
+        self._profiler = BuildProfiler()
+        with self._profiler.stage("read_template_meta"):
+            reader = ReadObsidianTemplateMeta()
+            self._template_meta = reader.read_template_meta()
 
         self._current_version = self._get_current_version()
+        self._profiler.set_info("build_version", self._current_version)
 
         self._templates_path = self.config.config_cache.get_dist_single(
             self._current_version
@@ -150,26 +154,30 @@ class UpgradeToCurrent:
         if not tpl_path.exists():
             raise FileNotFoundError(f"Template path {tpl_path} does not exist.")
         try:
-            fm_upgrade_template = FrontMatterMeta(file_path=tpl_path)
-            required_fields = self._get_filtered_required_fields(fm_upgrade_template)
-            all_fields = self._get_all_fields_filtered(fm_upgrade_template)
-            fm_fields = set(fm_upgrade_template.frontmatter.keys())
-            extra_fields = fm_fields - all_fields
-            if not fm_upgrade_template.template_type:
-                raise ValueError(
-                    f"Field template_type is not specified in frontmatter of {tpl_path}."
+            with self._profiler.stage("upgrade_template"):
+                fm_upgrade_template = FrontMatterMeta(file_path=tpl_path)
+                required_fields = self._get_filtered_required_fields(
+                    fm_upgrade_template
                 )
-            fm_existing_template = self._get_existing_frontmatter(
-                fm_upgrade_template.template_type
-            )
-            self._cleanup_upgrade_contents(fm_upgrade_template)
-            self._upgrade_template_specific_fields(
-                fm_existing_template=fm_existing_template,
-                fm_upgrade_template=fm_upgrade_template,
-                required_fields=required_fields,
-            )
-            self._write_new_frontmatter(fm_upgrade_template)
-            self._write_report(fm_upgrade_template, extra_fields)
+                all_fields = self._get_all_fields_filtered(fm_upgrade_template)
+                fm_fields = set(fm_upgrade_template.frontmatter.keys())
+                extra_fields = fm_fields - all_fields
+                if not fm_upgrade_template.template_type:
+                    raise ValueError(
+                        f"Field template_type is not specified in frontmatter of {tpl_path}."
+                    )
+                fm_existing_template = self._get_existing_frontmatter(
+                    fm_upgrade_template.template_type
+                )
+                self._cleanup_upgrade_contents(fm_upgrade_template)
+                self._upgrade_template_specific_fields(
+                    fm_existing_template=fm_existing_template,
+                    fm_upgrade_template=fm_upgrade_template,
+                    required_fields=required_fields,
+                )
+            with self._profiler.stage("write"):
+                self._write_new_frontmatter(fm_upgrade_template)
+                self._write_report(fm_upgrade_template, extra_fields)
 
         except Exception as e:
             raise ValueError(f"Error reading frontmatter from {tpl_path}: {e}")
@@ -0,0 +1,246 @@
+"""
+Indexed single-file bundle of the installed API templates.
+
+Layout::
+
+    MAGIC (8 bytes) | index length (uint32, little endian) | index (JSON) | data
+
+The index holds the ``source`` stamp of the templates directory the bundle was written
+from, see ``get_templates_stamp()``, and maps ``"<type>/<version>"`` in ``members`` to
+the ``[offset, length]`` of each member, relative to the start of the data section.
+A reader compares the stamp with the directory and reads the folders when they differ,
+so a bundle left behind by changed folders is not served. Members are pickled:
+
+- ``template`` and ``instructions``: ``(frontmatter dict, body str)``, already split.
+- ``manifest`` and ``registry``: parsed JSON.
+
+The bundle is written by ``install-api`` from the installed templates directory and
+is only read from files this project writes, never from untrusted input.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import struct
+from pathlib import Path
+from typing import Any
+from .obsidian_editor import ObsidianEditor
+
+BUNDLE_MAGIC = b"LCTBND02"
+BUNDLE_MEMBERS = ("template", "instructions", "manifest", "registry")
+_HEADER = struct.Struct("<8sI")
+_PICKLE_PROTOCOL = 5
+
+
+def read_version_member(version_dir: Path, member: str) -> Any:
+    """
+    Reads a member of one installed template version the way it is bundled.
+
+    Args:
+        version_dir (Path): Installed ``<type>/vX.Y/`` folder.
+        member (str): One of ``BUNDLE_MEMBERS``.
+
+    Returns:
+        Any: The member if its file exists; Otherwise, None.
+    """
+    if member in ("template", "instructions"):
+        path = version_dir / f"{member}.md"
+        if not path.is_file():
+            return None
+        fm, content = ObsidianEditor().read_template(path)
+        return (fm or {}, content)
+    path = version_dir / f"{member}.json"
+    if not path.is_file():
+        return None
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _iter_version_dirs(templates_path: Path):
+    for type_dir in sorted(p for p in templates_path.iterdir() if p.is_dir()):
+        for version_dir in sorted(type_dir.iterdir()):
+            if version_dir.is_dir() and version_dir.name.startswith("v"):
+                yield type_dir, version_dir
+
+
+def get_templates_stamp(templates_path: Path) -> str:
+    """
+    Stamps the member files of every ``<type>/vX.Y/`` folder of ``templates_path``.
+
+    Only the files are stat'ed, so the stamp is cheap enough to check on every load.
+    Installs replace changed files, which changes their modification time.
+
+    Args:
+        templates_path (Path): Installed API templates directory.
+
+    Returns:
+        str: SHA-256 of the path, size and modification time of every member file.
+    """
+    hasher = hashlib.sha256()
+    if not templates_path.is_dir():
+        return hasher.hexdigest()
+    for type_dir, version_dir in _iter_version_dirs(templates_path):
+        for name in (
+            "template.md",
+            "instructions.md",
+            "manifest.json",
+            "registry.json",
+        ):
+            try:
+                st = (version_dir / name).stat()
+            except OSError:
+                continue
+            hasher.update(
+                f"{type_dir.name}/{version_dir.name}/{name}:{st.st_size}:{st.st_mtime_ns}\n".encode(
+                    "utf-8"
+                )
+            )
+    return hasher.hexdigest()
+
+
+def write_template_bundle(templates_path: Path, bundle_path: Path) -> int:
+    """
+    Writes every ``<type>/vX.Y/`` folder of ``templates_path`` into a bundle.
+
+    The file is written to a temporary name and then replaced, so readers never
+    see a partial bundle.
+
+    Args:
+        templates_path (Path): Installed API templates directory.
+        bundle_path (Path): Bundle file to write.
+
+    Returns:
+        int: Number of template versions written.
+    """
+    # stamped before reading, so a file changed while writing makes the bundle stale
+    source = get_templates_stamp(templates_path)
+    index: dict[str, dict[str, list[int]]] = {}
+    chunks: list[bytes] = []
+    offset = 0
+    for type_dir, version_dir in _iter_version_dirs(templates_path):
+        members: dict[str, list[int]] = {}
+        for member in BUNDLE_MEMBERS:
+            value = read_version_member(version_dir, member)
+            if value is None:
+                continue
+            data = pickle.dumps(value, protocol=_PICKLE_PROTOCOL)
+            members[member] = [offset, len(data)]
+            chunks.append(data)
+            offset += len(data)
+        index[f"{type_dir.name}/{version_dir.name}"] = members
+
+    index_bytes = json.dumps(
+        {"source": source, "members": index}, separators=(",", ":")
+    ).encode("utf-8")
+    tmp_path = bundle_path.with_name(f"{bundle_path.name}.tmp")
+    bundle_path.parent.mkdir(parents=True, exist_ok=True)
+    with tmp_path.open("wb") as f:
+        f.write(_HEADER.pack(BUNDLE_MAGIC, len(index_bytes)))
+        f.write(index_bytes)
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp_path, bundle_path)
+    return len(index)
+
+
+def is_template_bundle_current(bundle_path: Path, templates_path: Path) -> bool:
+    """
+    Checks if a bundle exists and was written from the current ``templates_path``.
+
+    Args:
+        bundle_path (Path): Bundle file.
+        templates_path (Path): Installed API templates directory.
+
+    Returns:
+        bool: True if the bundle source stamp matches the directory; Otherwise, False.
+    """
+    try:
+        bundle = TemplateBundle(bundle_path)
+    except (OSError, ValueError, KeyError):
+        return False
+    return bundle.source == get_templates_stamp(templates_path)
+
+
+class TemplateBundle:
+    """
+    Read-only view of a bundle written by ``write_template_bundle()``.
+
+    Opening reads only the header and index; the file is memory mapped and members
+    are deserialized when read, so processes reading the same bundle share its pages
+    through the page cache.
+    """
+
+    def __init__(self, bundle_path: Path):
+        """
+        Args:
+            bundle_path (Path): Bundle file.
+
+        Raises:
+            ValueError: If the file is not a bundle of this format.
+        """
+        self.bundle_path = bundle_path
+        with bundle_path.open("rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mm) < _HEADER.size:
+            raise ValueError(f"Template bundle is truncated: {bundle_path}")
+        magic, index_len = _HEADER.unpack_from(self._mm, 0)
+        if magic != BUNDLE_MAGIC:
+            raise ValueError(f"Not a template bundle of this version: {bundle_path}")
+        index_start = _HEADER.size
+        self._data_start = index_start + index_len
+        header = json.loads(self._mm[index_start : self._data_start])
+        self._source: str = header["source"]
+        self._index: dict[str, dict[str, list[int]]] = header["members"]
+
+    @property
+    def source(self) -> str:
+        """Gets the ``get_templates_stamp()`` of the directory the bundle was written from."""
+        return self._source
+
+    def keys(self) -> list[tuple[str, str]]:
+        """
+        Gets the template versions in the bundle.
+
+        Returns:
+            list[tuple[str, str]]: ``(template_type, version)`` pairs.
+        """
+        return [tuple(key.split("/", 1)) for key in self._index]  # type: ignore[misc]
+
+    def has_member(self, template_type: str, version: str, member: str) -> bool:
+        """
+        Gets if a member is in the bundle.
+
+        Args:
+            template_type (str): Template type such as ``glyph``.
+            version (str): Normalized version such as ``v2.11``.
+            member (str): One of ``BUNDLE_MEMBERS``.
+
+        Returns:
+            bool: True if found; Otherwise, False.
+        """
+        return member in self._index.get(f"{template_type}/{version}", {})
+
+    def read(self, template_type: str, version: str, member: str) -> Any:
+        """
+        Deserializes a member. Each call returns new objects.
+
+        Args:
+            template_type (str): Template type such as ``glyph``.
+            version (str): Normalized version such as ``v2.11``.
+            member (str): One of ``BUNDLE_MEMBERS``.
+
+        Returns:
+            Any: The member if found; Otherwise, None.
+        """
+        entry = self._index.get(f"{template_type}/{version}")
+        if entry is None or member not in entry:
+            return None
+        offset, length = entry[member]
+        start = self._data_start + offset
+        with memoryview(self._mm)[start : start + length] as view:
+            return pickle.loads(view)
+
+    def __len__(self) -> int:
+        return len(self._index)
@@ -0,0 +1,125 @@
+from typing import Any
+from ..builder.build_cache import BuildCache
+from ..config.pkg_config import PkgConfig
+from ..meta.singleton import SingletonMeta
+from .front_mater_meta import FrontMatterMeta
+from .main_registry import MainRegistry
+from .process.process_obsidian_templates import (
+    ProcessObsidianTemplates as ProcessZipTemplates,
+)
+from .process_single.process_obsidian_templates import (
+    ProcessObsidianTemplates as ProcessSingleTemplates,
+)
+
+
+class TemplateCorpus(metaclass=SingletonMeta):
+    """
+    Processed Obsidian templates shared by every consumer of one invocation.
+
+    The builders, installer and cleanup all need the templates processed with the
+    same registry tokens. The corpus processes them once per variant and build number
+    and hands every consumer the same set. Processed files are also kept in the build
+    cache, validated by the hash of each source and its configuration, so a later
+    invocation with unchanged sources reuses them.
+
+    The returned ``FrontMatterMeta`` instances are shared. Treat them as read-only;
+    use ``FrontMatterMeta.copy(deep=True)`` before changing one.
+    """
+
+    def __init__(self):
+        self.config = PkgConfig()
+        self._jobs = 1
+        self._build_cache: BuildCache | None = None
+        self._processors: list[ProcessZipTemplates | ProcessSingleTemplates] = []
+        self._corpora: dict[tuple[bool, int], dict[str, FrontMatterMeta]] = {}
+
+    def configure(self, jobs: int = 1, build_cache: BuildCache | None = None) -> None:
+        """
+        Sets how templates are processed by later loads.
+
+        Args:
+            jobs (int, optional): Worker processes, see ``ProcessObsidianTemplates``. Defaults to 1.
+            build_cache (BuildCache, optional): Build cache to use. Defaults to a cache in
+                ``ConfigCache.get_build_cache_path()``.
+        """
+        self._jobs = jobs
+        self._build_cache = build_cache
+
+    def _get_build_cache(self) -> BuildCache:
+        if self._build_cache is None:
+            self._build_cache = BuildCache(
+                cache_dir=self.config.config_cache.get_build_cache_path(),
+                builder_version=self.config.version,
+            )
+        return self._build_cache
+
+    def get_tokens(self, main_registry: MainRegistry) -> dict[str, Any]:
+        """
+        Gets the tokens set in the frontmatter of every processed template.
+
+        Args:
+            main_registry (MainRegistry): Main registry of the build.
+
+        Returns:
+            dict[str, Any]: Tokens.
+        """
+        return {
+            "declared_registry_id": main_registry.reg_id,
+            "declared_registry_version": main_registry.reg_version,
+            "mapped_registry": main_registry.reg_id,
+            "mapped_registry_minimum_version": main_registry.reg_version,
+            "batch_number": str(main_registry.build_version),
+        }
+
+    def get_templates(
+        self, main_registry: MainRegistry, single: bool = False
+    ) -> dict[str, FrontMatterMeta]:
+        """
+        Gets the processed templates, processing them on first use.
+
+        Args:
+            main_registry (MainRegistry): Main registry of the build.
+            single (bool, optional): If True, templates are processed for single template
+                packages; Otherwise, for the zip package. Defaults to False.
+
+        Returns:
+            dict[str, FrontMatterMeta]: Template hash to template, as returned by
+            ``ProcessObsidianTemplates.process()``. Each call returns a new dict, so a
+            caller may change the dict without affecting other consumers.
+        """
+        key = (single, main_registry.build_version)
+        corpus = self._corpora.get(key)
+        if corpus is None:
+            process_cls = ProcessSingleTemplates if single else ProcessZipTemplates
+            processor = process_cls(
+                jobs=self._jobs, build_cache=self._get_build_cache()
+            )
+            self._processors.append(processor)
+            corpus = processor.process(self.get_tokens(main_registry))
+            self._corpora[key] = corpus
+        return dict(corpus)
+
+    def get_templates_by_type(
+        self, main_registry: MainRegistry, single: bool = False
+    ) -> dict[str, FrontMatterMeta]:
+        """
+        Gets the processed templates keyed by template type.
+
+        Args:
+            main_registry (MainRegistry): Main registry of the build.
+            single (bool, optional): See ``get_templates()``. Defaults to False.
+
+        Returns:
+            dict[str, FrontMatterMeta]: Template type to template.
+        """
+        return {
+            fm.template_type: fm
+            for fm in self.get_templates(main_registry, single=single).values()
+        }
+
+    def cleanup(self) -> None:
+        """Removes the processed template files and forgets the loaded templates."""
+        for processor in self._processors:
+            processor.cleanup()
+        self._processors.clear()
+        self._corpora.clear()
@@ -0,0 +1,136 @@
+"""
+Generation marker of the installed API templates.
+
+``install-api`` publishes templates by exchanging a fully written copy of the templates
+directory with the live one, then writes the marker with the next generation number.
+A server watching the marker reloads once per install, after the new files are in place.
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class TemplatesGeneration:
+    """
+    Attributes:
+        generation (int): Number of the install, incremented by every install that changes files.
+        build_number (int): Build the templates were installed from.
+        installed_at (str): ISO time of the install.
+        changed_files (int): Files added or changed by the install.
+    """
+
+    generation: int
+    build_number: int
+    installed_at: str
+    changed_files: int
+
+
+def read_templates_generation(path: Path) -> TemplatesGeneration | None:
+    """
+    Reads the generation marker.
+
+    Args:
+        path (Path): Marker file.
+
+    Returns:
+        TemplatesGeneration | None: The marker if it exists and is valid; Otherwise, None.
+    """
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            return TemplatesGeneration(**json.load(f))
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def write_templates_generation(
+    path: Path, build_number: int, changed_files: int
+) -> TemplatesGeneration:
+    """
+    Writes the next generation marker.
+
+    The file is written to a temporary name and then replaced, so watchers never
+    read a partial marker.
+
+    Args:
+        path (Path): Marker file.
+        build_number (int): Build the templates were installed from.
+        changed_files (int): Files added or changed by the install.
+
+    Returns:
+        TemplatesGeneration: The written marker.
+    """
+    previous = read_templates_generation(path)
+    marker = TemplatesGeneration(
+        generation=(previous.generation if previous else 0) + 1,
+        build_number=build_number,
+        installed_at=datetime.now().astimezone().isoformat(),
+        changed_files=changed_files,
+    )
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        json.dump(asdict(marker), f, indent=2)
+    os.replace(tmp_path, path)
+    return marker
+
+
+class GenerationWatcher:
+    """
+    Detects new generations of the installed templates.
+
+    The marker is checked at most every ``reload_check_seconds``. The watcher is
+    thread safe; one caller sees each change.
+    """
+
+    def __init__(self, path: Path, reload_check_seconds: float = 1.0):
+        """
+        Args:
+            path (Path): Marker file.
+            reload_check_seconds (float, optional): Minimum seconds between checks.
+                Zero disables the watcher. Defaults to 1.0.
+        """
+        self._path = path
+        self._reload_check = reload_check_seconds
+        self._lock = threading.Lock()
+        self._stamp = self._get_stamp()
+        self._last_check = time.monotonic()
+
+    def _get_stamp(self) -> tuple[int, int, int] | None:
+        try:
+            st = self._path.stat()
+        except OSError:
+            return None
+        # the marker is replaced on every install, so its inode changes too
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def changed(self) -> bool:
+        """
+        Checks if a new generation was published since the last change was reported.
+
+        Returns:
+            bool: True once per new generation; Otherwise, False.
+        """
+        if self._reload_check <= 0:
+            return False
+        now = time.monotonic()
+        if now - self._last_check < self._reload_check:
+            return False
+        with self._lock:
+            if now - self._last_check < self._reload_check:
+                return False
+            self._last_check = now
+            stamp = self._get_stamp()
+            if stamp == self._stamp:
+                return False
+            self._stamp = stamp
+            return True
+
+    @property
+    def path(self) -> Path:
+        """Gets the marker file."""
+        return self._path
@@ -0,0 +1,55 @@
+import hashlib
+import io
+from typing import BinaryIO
+
+
+class HashingWriter(io.RawIOBase):
+    """
+    Write-only stream that hashes every byte written before passing it on.
+
+    The stream is not seekable, so writers such as ``zipfile.ZipFile`` produce their
+    output in one forward pass and the digest matches the bytes written without
+    reading them back.
+    """
+
+    def __init__(self, target: BinaryIO, algorithm: str = "sha256"):
+        """
+        Args:
+            target (BinaryIO): Stream the bytes are written to. It is not closed.
+            algorithm (str, optional): ``hashlib`` algorithm. Defaults to ``sha256``.
+        """
+        super().__init__()
+        self._target = target
+        self._hasher = hashlib.new(algorithm)
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        with memoryview(b) as view:
+            self._hasher.update(view)
+            self._target.write(view)
+            size = view.nbytes
+        self._position += size
+        return size
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        self._target.flush()
+
+    def hexdigest(self) -> str:
+        """
+        Gets the digest of the bytes written so far.
+
+        Returns:
+            str: Hexadecimal digest.
+        """
+        return self._hasher.hexdigest()
+
+    @property
+    def bytes_written(self) -> int:
+        """Gets the number of bytes written."""
+        return self._position
@@ -0,0 +1,86 @@
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+import time
+
+for _module in ("loguru", "pydantic", "toml"):
+    pytest.importorskip(_module)
+
+from api.lib.cache.backends import LruSessionBackend, SqliteSessionBackend
+from api.lib.cache.session_handler import SessionHandler
+
+
+def _create_handler(db_path) -> SessionHandler:
+    # SessionHandler is a per-process singleton, so each handler stands for one worker
+    SessionHandler._instance = None
+    return SessionHandler(backend=LruSessionBackend(SqliteSessionBackend(db_path)))
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "sessions.db"
+
+
+@pytest.fixture
+def handlers(db_path):
+    first = _create_handler(db_path)
+    second = _create_handler(db_path)
+    yield first, second
+    first.close()
+    second.close()
+    SessionHandler._instance = None
+
+
+def test_set_data_keeps_changes_of_other_workers(db_path, handlers):
+    """Test two handlers on one database changing different keys of a session."""
+    first, second = handlers
+    session_id = first.create_session()
+    # both handlers now hold the session in their LRU
+    assert first.get_data(session_id, "a") is None
+    assert second.get_data(session_id, "b") is None
+
+    assert first.set_data(session_id, "a", 1)
+    assert second.set_data(session_id, "b", 2)
+
+    assert first.get_data(session_id, "b") == 2
+    assert second.get_data(session_id, "a") == 1
+    backend = SqliteSessionBackend(db_path)
+    try:
+        entry = backend.get(session_id, time.time())
+        assert entry is not None
+        assert entry.session.data == {"a": 1, "b": 2}
+    finally:
+        backend.close()
+
+
+def test_set_data_of_missing_session(handlers):
+    """Test setting data of an unknown session changes nothing."""
+    first, _ = handlers
+    assert not first.set_data("missing", "a", 1)
+    assert first.get_data("missing", "a") is None
+
+
+def test_idle_backend_flushes_touches(db_path, handlers):
+    """Test a pending access update is written while its worker is idle."""
+    first, _ = handlers
+    session_id = first.create_session()
+    writer = SqliteSessionBackend(db_path, batch_interval_seconds=0.05)
+    reader = SqliteSessionBackend(db_path)
+    try:
+        entry = writer.get(session_id, time.time())
+        assert entry is not None
+        expires_at = entry.expires_at + 3600
+        writer.touch(session_id, entry.session.last_accessed, expires_at)
+        # no further call on the writer, only its timer can flush the update
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            stored = reader.get(session_id, time.time())
+            if stored is not None and stored.expires_at == expires_at:
+                break
+            time.sleep(0.05)
+        assert stored is not None and stored.expires_at == expires_at
+    finally:
+        writer.close()
+        reader.close()
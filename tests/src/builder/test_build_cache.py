@@ -0,0 +1,159 @@
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from src.builder import build_cache
+from src.builder.build_cache import BuildCache, fingerprint
+
+_ROOT = Path(__file__).resolve().parents[3]
+
+_FINGERPRINT_SCRIPT = """
+from src.builder.build_cache import fingerprint
+from src.config.template_config_info import TemplateConfigInfo
+
+tci = TemplateConfigInfo(
+    template_id="glyph",
+    template_name="Glyph",
+    template_category="core",
+    template_version="1.0",
+    template_family="glyph",
+    template_type="glyph",
+    single_fields_omitted={"alpha", "beta", "gamma", "delta", "epsilon"},
+)
+print(fingerprint({"templates_config": {"glyph": tci}}))
+"""
+
+
+def _builder(dest_dir, text, calls):
+    def build():
+        calls.append(text)
+        path = dest_dir / "out.md"
+        path.write_text(text, encoding="utf-8")
+        return [path], {"text": text}
+
+    return build
+
+
+def test_reuses_unchanged_stage(tmp_path):
+    """Test a stage with unchanged inputs is restored instead of rebuilt."""
+    cache = BuildCache(cache_dir=tmp_path / "cache", builder_version="1.0")
+    calls: list[str] = []
+    first_dir = tmp_path / "first"
+    first_dir.mkdir()
+    _, data, decision = cache.run(
+        "template", "glyph", {"source": "a"}, first_dir, _builder(first_dir, "A", calls)
+    )
+    assert decision.hit is False
+    assert decision.reason == "no cache entry"
+    assert data == {"text": "A"}
+
+    second_dir = tmp_path / "second"
+    paths, data, decision = cache.run(
+        "template",
+        "glyph",
+        {"source": "a"},
+        second_dir,
+        _builder(second_dir, "A", calls),
+    )
+    assert decision.hit is True
+    assert calls == ["A"]
+    assert data == {"text": "A"}
+    assert paths == [second_dir / "out.md"]
+    assert paths[0].read_text(encoding="utf-8") == "A"
+
+
+def test_explains_changed_inputs(tmp_path):
+    """Test a rebuilt stage names the inputs that changed."""
+    cache = BuildCache(cache_dir=tmp_path / "cache", builder_version="1.0")
+    calls: list[str] = []
+    cache.run(
+        "registry",
+        "glyph",
+        {"source": "a", "config": 1},
+        tmp_path,
+        _builder(tmp_path, "A", calls),
+    )
+    _, _, decision = cache.run(
+        "registry",
+        "glyph",
+        {"source": "b", "config": 1},
+        tmp_path,
+        _builder(tmp_path, "B", calls),
+    )
+    assert decision.hit is False
+    assert decision.reason == "changed: source"
+
+    # inputs seen before are reused, not only those of the last build
+    _, data, decision = cache.run(
+        "registry",
+        "glyph",
+        {"source": "a", "config": 1},
+        tmp_path,
+        _builder(tmp_path, "A", calls),
+    )
+    assert decision.hit is True
+    assert data == {"text": "A"}
+    assert calls == ["A", "B"]
+
+
+def test_disabled_and_builder_version(tmp_path):
+    """Test a disabled cache and a new builder version rebuild the stage."""
+    cache_dir = tmp_path / "cache"
+    calls: list[str] = []
+    BuildCache(cache_dir, "1.0").run(
+        "template", "glyph", {"source": "a"}, tmp_path, _builder(tmp_path, "A", calls)
+    )
+    _, _, decision = BuildCache(cache_dir, "1.0", enabled=False).run(
+        "template", "glyph", {"source": "a"}, tmp_path, _builder(tmp_path, "A", calls)
+    )
+    assert decision.reason == "cache disabled"
+    _, _, decision = BuildCache(cache_dir, "2.0").run(
+        "template", "glyph", {"source": "a"}, tmp_path, _builder(tmp_path, "A", calls)
+    )
+    assert decision.reason == "builder version or sources changed"
+    assert len(calls) == 3
+
+
+def test_source_change(tmp_path, monkeypatch):
+    """Test a change of the builder sources rebuilds the stage."""
+    cache_dir = tmp_path / "cache"
+    calls: list[str] = []
+    BuildCache(cache_dir, "1.0").run(
+        "template", "glyph", {"source": "a"}, tmp_path, _builder(tmp_path, "A", calls)
+    )
+    monkeypatch.setattr(build_cache, "get_source_fingerprint", lambda: "0" * 64)
+    _, _, decision = BuildCache(cache_dir, "1.0").run(
+        "template", "glyph", {"source": "a"}, tmp_path, _builder(tmp_path, "A", calls)
+    )
+    assert decision.reason == "builder version or sources changed"
+    assert len(calls) == 2
+
+
+def test_fingerprint_independent_of_hash_seed():
+    """Test a key holding a set is the same in processes with different hash seeds."""
+    prints = set()
+    for seed in ("1", "2", "3"):
+        proc = subprocess.run(
+            [sys.executable, "-c", _FINGERPRINT_SCRIPT],
+            cwd=_ROOT,
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        prints.add(proc.stdout.strip())
+    assert len(prints) == 1
+
+
+def test_fingerprint_values():
+    """Test sets, tuples and paths are normalized and unknown types are rejected."""
+    assert fingerprint({"a": {3, 1, 2}}) == fingerprint({"a": [1, 2, 3]})
+    assert fingerprint((1, Path("a/b"))) == fingerprint([1, "a/b"])
+    with pytest.raises(TypeError):
+        fingerprint({"a": object()})
@@ -0,0 +1,90 @@
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+import json
+import sys
+import tracemalloc
+from src.builder.build_profiler import BuildProfiler
+from src.builder.process_scheduler import ProcessScheduler
+
+
+@pytest.fixture
+def profiler():
+    build_profiler = BuildProfiler()
+    yield build_profiler
+    build_profiler.stop()
+
+
+def test_disabled_profiler_records_nothing(profiler):
+    """Test stages run without measurements when profiling is off."""
+    with profiler.stage("unused"):
+        pass
+    assert not profiler.enabled
+    assert profiler.get_report()["profile"]["children"] == []
+
+
+def test_stages_and_processes(tmp_path, profiler):
+    """Test stages nest and scheduler processes are recorded in the open stage."""
+    profiler.start("pkg-zip", trace_memory=True)
+    profiler.set_info("build_version", 7)
+    with profiler.stage("process_templates"):
+        data = [bytearray(1_048_576)]
+        data.clear()
+    with profiler.stage("companions"):
+        scheduler = ProcessScheduler(jobs=1)
+        scheduler.add("first", lambda: 1, outputs={"a"})
+        scheduler.add("second", lambda: 2, inputs={"a"})
+        scheduler.run()
+    with profiler.stage("support"):
+        scheduler = ProcessScheduler(jobs=2)
+        scheduler.add("one", lambda: 1)
+        scheduler.add("two", lambda: 2)
+        scheduler.run()
+    profiler.stop()
+
+    report_path = tmp_path / "profile" / "report.json"
+    profiler.write_report(report_path, tmp_path / "profile" / "report.pstats")
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert report["command"] == "pkg-zip"
+    assert report["info"] == {"build_version": 7}
+    assert not (tmp_path / "profile" / "report.pstats").exists()
+
+    stages = report["profile"]["children"]
+    assert [s["name"] for s in stages] == ["process_templates", "companions", "support"]
+    assert stages[0]["peak_memory_bytes"] >= 1_048_576
+    companions = stages[1]["children"]
+    assert [(p["name"], p["kind"]) for p in companions] == [
+        ("first", "process"),
+        ("second", "process"),
+    ]
+    assert all(p["peak_memory_bytes"] is not None for p in companions)
+    concurrent = stages[2]["children"]
+    assert sorted(p["name"] for p in concurrent) == ["one", "two"]
+    assert all(p["peak_memory_bytes"] is None for p in concurrent)
+    assert "process_templates" in profiler.format_summary()
+
+
+def test_memory_not_traced_by_default(profiler):
+    """Test stages have no traced memory unless tracing is requested."""
+    profiler.start("pkg-zip")
+    with profiler.stage("process_templates"):
+        assert not tracemalloc.is_tracing()
+    profiler.stop()
+    report = profiler.get_report()
+    assert report["trace_memory"] is False
+    assert report["profile"]["children"][0]["peak_memory_bytes"] is None
+    if sys.platform != "win32":
+        assert report["max_rss_bytes"] > 0
+
+
+def test_cprofile_stats(tmp_path, profiler):
+    """Test cProfile statistics are written when collected."""
+    profiler.start("single-template", cprofile=True)
+    with profiler.stage("work"):
+        sum(range(1000))
+    profiler.stop()
+    stats_path = tmp_path / "report.pstats"
+    profiler.write_report(tmp_path / "report.json", stats_path)
+    assert stats_path.exists()
@@ -0,0 +1,81 @@
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+import threading
+from src.builder.process_scheduler import ProcessScheduler
+
+
+def _add_lock_graph(scheduler, calls, run=None):
+    def task(name):
+        def run_task():
+            if run is not None:
+                run(name)
+            calls.append(name)
+            return name.lower()
+
+        return run_task
+
+    scheduler.add("Lock", task("Lock"), inputs={"registry", "manifest", "VER"})
+    scheduler.add("Registry", task("Registry"), outputs={"registry"})
+    scheduler.add("Manifest", task("Manifest"), outputs={"manifest"})
+    scheduler.add("Readme", task("Readme"))
+
+
+def test_runs_after_dependencies():
+    """Test a process runs after the processes producing its inputs."""
+    scheduler = ProcessScheduler()
+    calls: list[str] = []
+    _add_lock_graph(scheduler, calls)
+    results = scheduler.run()
+    assert calls == ["Registry", "Manifest", "Lock", "Readme"]
+    assert list(results) == ["Lock", "Registry", "Manifest", "Readme"]
+    assert results["Lock"] == "lock"
+    assert [t.name for t in scheduler.timings] == list(results)
+
+
+def test_runs_independent_processes_concurrently():
+    """Test independent processes overlap and dependents still wait."""
+    scheduler = ProcessScheduler(jobs=3)
+    calls: list[str] = []
+    barrier = threading.Barrier(3, timeout=5)
+
+    def run(name):
+        if name != "Lock":
+            barrier.wait()
+
+    _add_lock_graph(scheduler, calls, run)
+    scheduler.run()
+    assert calls[-1] == "Lock"
+    assert scheduler.format_timings().endswith("jobs 3)")
+
+
+def test_failure_is_raised():
+    """Test the first process error is raised and dependents are skipped."""
+    scheduler = ProcessScheduler(jobs=2)
+    calls: list[str] = []
+
+    def run(name):
+        if name == "Registry":
+            raise RuntimeError("registry failed")
+
+    _add_lock_graph(scheduler, calls, run)
+    with pytest.raises(RuntimeError, match="registry failed"):
+        scheduler.run()
+    assert "Lock" not in calls
+
+
+def test_cycle_and_duplicate_output():
+    """Test invalid graphs raise ValueError."""
+    scheduler = ProcessScheduler()
+    scheduler.add("A", lambda: None, inputs={"b"}, outputs={"a"})
+    scheduler.add("B", lambda: None, inputs={"a"}, outputs={"b"})
+    with pytest.raises(ValueError, match="cycle"):
+        scheduler.run()
+
+    scheduler = ProcessScheduler()
+    scheduler.add("A", lambda: None, outputs={"a"})
+    scheduler.add("B", lambda: None, outputs={"a"})
+    with pytest.raises(ValueError, match="produced by both"):
+        scheduler.run()
@@ -0,0 +1,35 @@
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+import subprocess
+import sys
+import zipfile
+
+# mkpkg runs in a child process; skip where its dependencies are not installed
+for _module in ("jinja2", "loguru", "toml"):
+    pytest.importorskip(_module)
+
+from bench.build_scale import generate
+
+
+def test_pkg_zip_builds_package(tmp_path):
+    """Test pkg-zip builds the zip package and its companion files end to end."""
+    generate(tmp_path, 1)
+    proc = subprocess.run(
+        [sys.executable, "mkpkg.py", "pkg-zip", "-b", "1", "--no-cache"],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+    assert proc.returncode == 0, proc.stdout + proc.stderr
+
+    zip_path = tmp_path / "dist" / "codex-templates-1.zip"
+    # mkpkg prints errors rather than raising, so check the package itself
+    assert zip_path.exists(), proc.stdout + proc.stderr
+    with zipfile.ZipFile(zip_path) as zipf:
+        names = zipf.namelist()
+    assert "README-1.md" in names
+    assert sum(name.endswith(".md") for name in names) > 1
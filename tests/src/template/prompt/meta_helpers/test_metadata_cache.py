@@ -0,0 +1,55 @@
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+import os
+from src.template.prompt.meta_helpers.metadata_cache import MetadataCache
+
+_MAP = """
+template_type:
+  glyph:
+    beings: [{being}]
+    default_field_being: {being}
+    role: Keeper
+    invocation: Invoke {being}
+beings:
+  {being}:
+    role_title: Keeper
+    template_types_governed: [glyph]
+"""
+
+
+@pytest.fixture
+def cache():
+    metadata_cache = MetadataCache()
+    metadata_cache.clear()
+    yield metadata_cache
+    metadata_cache.clear()
+
+
+def test_models_are_shared_until_file_changes(tmp_path, cache):
+    """Test a map is parsed once and parsed again only after it changes."""
+    path = tmp_path / "template_field_being_map.yml"
+    path.write_text(_MAP.format(being="Soluun"), encoding="utf-8")
+
+    meta_type = cache.get_prompt_meta_type(path)
+    beings = cache.get_prompt_beings(path)
+    assert meta_type.template_type["glyph"].beings == ["Soluun"]
+    assert list(beings.beings) == ["Soluun"]
+    assert MetadataCache().get_prompt_meta_type(str(path)) is meta_type
+    assert cache.get_prompt_beings(path) is beings
+
+    path.write_text(_MAP.format(being="Adamus"), encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    changed = cache.get_prompt_meta_type(path)
+    assert changed is not meta_type
+    assert changed.template_type["glyph"].beings == ["Adamus"]
+    assert list(cache.get_prompt_beings(path).beings) == ["Adamus"]
+
+
+def test_missing_file(tmp_path, cache):
+    """Test a missing map raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        cache.get_prompt_beings(tmp_path / "missing.yml")
@@ -0,0 +1,106 @@
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from pathlib import Path
+from src.template.single.install import templates_stage
+from src.template.single.install.templates_stage import (
+    ADDED,
+    CHANGED,
+    UNCHANGED,
+    TemplatesStage,
+    exchange_paths,
+    get_file_change,
+)
+
+
+@pytest.fixture
+def live(tmp_path):
+    templates = tmp_path / "templates"
+    (templates / "glyph" / "v2.11").mkdir(parents=True)
+    (templates / "glyph" / "v2.11" / "template.md").write_text(
+        "a\nb\n", encoding="utf-8"
+    )
+    (templates / "seal" / "v1.0").mkdir(parents=True)
+    (templates / "seal" / "v1.0" / "template.md").write_text("s\n", encoding="utf-8")
+    return templates
+
+
+def test_file_change():
+    """Test changes are classified and changed lines counted."""
+    path = Path("glyph/v2.11/template.md")
+    assert get_file_change(path, b"a\n", b"a\n").status == UNCHANGED
+    added = get_file_change(path, None, b"a\nb\n")
+    assert (added.status, added.lines_added) == (ADDED, 2)
+    changed = get_file_change(path, b"a\nb\nc\n", b"a\nB\nc\nd\n")
+    assert (changed.status, changed.lines_added, changed.lines_removed) == (
+        CHANGED,
+        2,
+        1,
+    )
+    assert str(changed) == f"changed   {path} (+2 -1)"
+
+
+def test_publish(live):
+    """Test the live tree is unchanged until the stage is published."""
+    glyph = live / "glyph" / "v2.11" / "template.md"
+    seal = live / "seal" / "v1.0" / "template.md"
+    seal_ino = seal.stat().st_ino
+    with TemplatesStage(live) as stage:
+        assert stage.write(Path("glyph/v2.11/template.md"), b"a\nc\n").status == CHANGED
+        assert stage.write(Path("seal/v1.0/template.md"), b"s\n").status == UNCHANGED
+        assert stage.write(Path("dyad/v1.0/template.md"), b"d\n").status == ADDED
+        assert glyph.read_text(encoding="utf-8") == "a\nb\n"
+        assert not (live / "dyad").exists()
+        stage.publish()
+    assert glyph.read_text(encoding="utf-8") == "a\nc\n"
+    assert (live / "dyad" / "v1.0" / "template.md").read_bytes() == b"d\n"
+    assert seal.read_text(encoding="utf-8") == "s\n"
+    # unchanged files are hard links to the previous live files, not rewritten
+    assert seal.stat().st_ino == seal_ino
+    assert sorted(p.name for p in live.parent.iterdir()) == ["templates"]
+
+
+def test_discard(live):
+    """Test an unpublished stage is removed and the live tree kept."""
+    with pytest.raises(RuntimeError):
+        with TemplatesStage(live) as stage:
+            stage.write(Path("glyph/v2.11/template.md"), b"x\n")
+            raise RuntimeError("render failed")
+    assert (live / "glyph" / "v2.11" / "template.md").read_text(
+        encoding="utf-8"
+    ) == "a\nb\n"
+    assert sorted(p.name for p in live.parent.iterdir()) == ["templates"]
+
+
+def test_publish_exchanges_atomically(live, monkeypatch):
+    """Test the stage is exchanged with the live tree without renaming it aside."""
+    probe_a, probe_b = live.parent / "a", live.parent / "b"
+    probe_a.mkdir()
+    probe_b.mkdir()
+    supported = exchange_paths(probe_a, probe_b)
+    probe_a.rmdir()
+    probe_b.rmdir()
+    if not supported:
+        pytest.skip("file system cannot exchange paths")
+
+    def fail_replace(*args):
+        raise AssertionError("live tree renamed aside")
+
+    with TemplatesStage(live) as stage:
+        stage.write(Path("glyph/v2.11/template.md"), b"x\n")
+        monkeypatch.setattr(templates_stage.os, "replace", fail_replace)
+        stage.publish()
+    assert (live / "glyph" / "v2.11" / "template.md").read_bytes() == b"x\n"
+    assert sorted(p.name for p in live.parent.iterdir()) == ["templates"]
+
+
+def test_publish_without_exchange(live, monkeypatch):
+    """Test publishing falls back to renames where paths cannot be exchanged."""
+    monkeypatch.setattr(templates_stage, "exchange_paths", lambda a, b: False)
+    with TemplatesStage(live) as stage:
+        stage.write(Path("glyph/v2.11/template.md"), b"x\n")
+        stage.publish()
+    assert (live / "glyph" / "v2.11" / "template.md").read_bytes() == b"x\n"
+    assert sorted(p.name for p in live.parent.iterdir()) == ["templates"]
@@ -0,0 +1,42 @@
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+import json
+
+pytest.importorskip("toml")
+
+from src.template.single.install.tp_support.manifest import keep_installed_at
+
+INSTALLED_AT = "2026-01-02T03:04:05+00:00"
+
+
+def _manifest(version: str, installed_at: str) -> dict:
+    return {
+        "name": "template_manifest_x",
+        "template_info": {"version": version},
+        "installed_at": installed_at,
+        "canonical_mode": {"version": "1.0"},
+    }
+
+
+def test_unchanged_manifest_keeps_installed_at():
+    """Test a manifest differing only in installed_at is written as installed."""
+    installed = json.dumps(_manifest("v1.0", INSTALLED_AT), indent=4).encode()
+    data = keep_installed_at(_manifest("v1.0", "2026-10-19T00:00:00+00:00"), installed)
+    assert json.dumps(data, indent=4).encode() == installed
+
+
+def test_changed_manifest_gets_new_installed_at():
+    """Test a changed manifest keeps its new install time."""
+    installed = json.dumps(_manifest("v1.0", INSTALLED_AT), indent=4).encode()
+    new = _manifest("v1.1", "2026-10-19T00:00:00+00:00")
+    assert keep_installed_at(new, installed) == new
+
+
+@pytest.mark.parametrize("installed", [None, b"not json", b"[]"])
+def test_missing_or_invalid_manifest(installed):
+    """Test a missing or unreadable installed manifest is ignored."""
+    new = _manifest("v1.0", "2026-10-19T00:00:00+00:00")
+    assert keep_installed_at(new, installed) == new
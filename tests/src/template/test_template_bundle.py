@@ -0,0 +1,89 @@
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+import json
+import os
+from src.template.template_bundle import (
+    TemplateBundle,
+    get_templates_stamp,
+    is_template_bundle_current,
+    write_template_bundle,
+)
+
+
+def _install(templates_path, template_type, version):
+    version_dir = templates_path / template_type / version
+    version_dir.mkdir(parents=True)
+    (version_dir / "template.md").write_text(
+        f"---\ntemplate_type: {template_type}\ntemplate_version: '{version[1:]}'\n---\n# Body\n",
+        encoding="utf-8",
+    )
+    (version_dir / "registry.json").write_text(
+        json.dumps({"template_type": template_type, "fields": {"a": 1}}),
+        encoding="utf-8",
+    )
+
+
+def test_bundle_round_trip(tmp_path):
+    """Test members written to a bundle read back equal to the installed files."""
+    templates_path = tmp_path / "templates"
+    _install(templates_path, "glyph", "v2.11")
+    _install(templates_path, "dyad", "v1.0")
+    bundle_path = tmp_path / "templates.bundle"
+
+    assert write_template_bundle(templates_path, bundle_path) == 2
+    bundle = TemplateBundle(bundle_path)
+    assert len(bundle) == 2
+    assert sorted(bundle.keys()) == [("dyad", "v1.0"), ("glyph", "v2.11")]
+    fm, content = bundle.read("glyph", "v2.11", "template")
+    assert fm == {"template_type": "glyph", "template_version": "2.11"}
+    assert content == "# Body\n"
+    assert bundle.read("dyad", "v1.0", "registry") == {
+        "template_type": "dyad",
+        "fields": {"a": 1},
+    }
+    assert bundle.has_member("glyph", "v2.11", "instructions") is False
+    assert bundle.read("glyph", "v2.11", "instructions") is None
+    assert bundle.read("stone", "v1.0", "template") is None
+
+
+def test_bundle_reads_are_independent(tmp_path):
+    """Test each read returns new objects that callers may change."""
+    templates_path = tmp_path / "templates"
+    _install(templates_path, "glyph", "v2.11")
+    bundle_path = tmp_path / "templates.bundle"
+    write_template_bundle(templates_path, bundle_path)
+    bundle = TemplateBundle(bundle_path)
+
+    first = bundle.read("glyph", "v2.11", "registry")
+    first["fields"]["a"] = 2
+    assert bundle.read("glyph", "v2.11", "registry")["fields"]["a"] == 1
+
+
+def test_not_a_bundle(tmp_path):
+    """Test opening a file that is not a bundle raises ValueError."""
+    path = tmp_path / "templates.bundle"
+    path.write_bytes(b"not a bundle at all")
+    with pytest.raises(ValueError):
+        TemplateBundle(path)
+
+
+def test_bundle_source_stamp(tmp_path):
+    """Test a bundle is current until an installed file changes."""
+    templates_path = tmp_path / "templates"
+    _install(templates_path, "glyph", "v2.11")
+    bundle_path = tmp_path / "templates.bundle"
+    assert not is_template_bundle_current(bundle_path, templates_path)
+
+    write_template_bundle(templates_path, bundle_path)
+    assert TemplateBundle(bundle_path).source == get_templates_stamp(templates_path)
+    assert is_template_bundle_current(bundle_path, templates_path)
+
+    registry_path = templates_path / "glyph" / "v2.11" / "registry.json"
+    registry_path.write_text(json.dumps({"fields": {"a": 2}}), encoding="utf-8")
+    st = registry_path.stat()
+    # a later modification time, even on file systems with coarse timestamps
+    os.utime(registry_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert not is_template_bundle_current(bundle_path, templates_path)
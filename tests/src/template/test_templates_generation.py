@@ -0,0 +1,42 @@
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from src.template.templates_generation import (
+    GenerationWatcher,
+    read_templates_generation,
+    write_templates_generation,
+)
+
+
+def test_generation_increments(tmp_path):
+    """Test each write publishes the next generation."""
+    path = tmp_path / "templates.generation"
+    assert read_templates_generation(path) is None
+    first = write_templates_generation(path, build_number=84, changed_files=3)
+    second = write_templates_generation(path, build_number=85, changed_files=1)
+    assert (first.generation, second.generation) == (1, 2)
+    assert read_templates_generation(path) == second
+    path.write_text("not json", encoding="utf-8")
+    assert read_templates_generation(path) is None
+
+
+def test_watcher_reports_each_generation_once(tmp_path, monkeypatch):
+    """Test the watcher reports a new generation once and honors the check interval."""
+    path = tmp_path / "templates.generation"
+    now = [100.0]
+    monkeypatch.setattr(
+        "src.template.templates_generation.time.monotonic", lambda: now[0]
+    )
+    watcher = GenerationWatcher(path, reload_check_seconds=1.0)
+    write_templates_generation(path, build_number=84, changed_files=1)
+    assert not watcher.changed()
+    now[0] += 1.0
+    assert watcher.changed()
+    now[0] += 1.0
+    assert not watcher.changed()
+    write_templates_generation(path, build_number=85, changed_files=1)
+    now[0] += 1.0
+    assert watcher.changed()
+    assert not GenerationWatcher(path, reload_check_seconds=0).changed()
@@ -0,0 +1,35 @@
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+import hashlib
+import io
+import zipfile
+from src.util.hashing_writer import HashingWriter
+
+
+def test_zip_hash_matches_written_bytes():
+    """Test a zip written through the writer is hashed in the same pass."""
+    buffer = io.BytesIO()
+    with (
+        HashingWriter(buffer) as writer,
+        zipfile.ZipFile(writer, "w", zipfile.ZIP_DEFLATED) as zipf,
+    ):
+        zipf.writestr("glyph-v1.md", b"---\ntemplate_type: glyph\n---\nbody")
+        zipf.writestr("README-1.md", "readme")
+
+    data = buffer.getvalue()
+    assert writer.hexdigest() == hashlib.sha256(data).hexdigest()
+    assert writer.bytes_written == len(data)
+    with zipfile.ZipFile(io.BytesIO(data)) as zipf:
+        assert zipf.read("README-1.md") == b"readme"
+        assert zipf.testzip() is None
+
+
+def test_is_not_seekable():
+    """Test writers cannot seek back and rewrite hashed bytes."""
+    writer = HashingWriter(io.BytesIO())
+    assert writer.seekable() is False
+    with pytest.raises(OSError):
+        writer.seek(0)